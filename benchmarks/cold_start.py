@@ -0,0 +1,112 @@
+"""Measure package import time and first-report latency in fresh interpreters.
+
+Each sample runs in its own subprocess so that nothing is cached between runs,
+which is what a short-lived batch container or serverless worker sees.
+
+Usage::
+
+    uv run python benchmarks/cold_start.py --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+_SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+
+_SAMPLE_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import mitoric
+imported = time.perf_counter()
+heavy_modules = sorted(name for name in ("polars", "jinja2") if name in sys.modules)
+
+import polars as pl
+
+frame = pl.DataFrame(
+    {
+        "age": [10, 12, 12, 14] * 250,
+        "city": ["A", "B", "A", "C"] * 250,
+    }
+)
+polars_ready = time.perf_counter()
+mitoric.generate_single_report(frame)
+reported = time.perf_counter()
+print(
+    json.dumps(
+        {
+            "import_seconds": imported - start,
+            "first_report_seconds": reported - polars_ready,
+            "heavy_modules_on_import": heavy_modules,
+        }
+    )
+)
+"""
+
+
+@dataclass(frozen=True)
+class _Sample:
+    import_seconds: float
+    first_report_seconds: float
+    heavy_modules_on_import: list[str]
+
+
+def _run_sample() -> _Sample:
+    completed = subprocess.run(
+        [sys.executable, "-c", _SAMPLE_SCRIPT],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(_SRC_ROOT)},
+    )
+    raw = json.loads(completed.stdout.strip().splitlines()[-1])
+    return _Sample(
+        import_seconds=float(raw["import_seconds"]),
+        first_report_seconds=float(raw["first_report_seconds"]),
+        heavy_modules_on_import=list(raw["heavy_modules_on_import"]),
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure import time and first-report latency."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=0.0,
+        help="fail when the median import time exceeds this budget (0 disables)",
+    )
+    args = parser.parse_args()
+
+    samples = [_run_sample() for _ in range(args.runs)]
+    import_ms = statistics.median(sample.import_seconds for sample in samples) * 1000
+    report_ms = (
+        statistics.median(sample.first_report_seconds for sample in samples) * 1000
+    )
+    heavy_modules = sorted(
+        {name for sample in samples for name in sample.heavy_modules_on_import}
+    )
+    print(f"import mitoric:      {import_ms:8.1f} ms (median of {args.runs})")
+    print(f"first report:        {report_ms:8.1f} ms (median of {args.runs})")
+    print(f"heavy modules eager: {', '.join(heavy_modules) or 'none'}")
+
+    if args.max_import_ms and import_ms > args.max_import_ms:
+        print(f"import budget exceeded: {import_ms:.1f} ms > {args.max_import_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,92 @@
+"""Measure peak memory and time of numeric profiling on narrow dtypes.
+
+Each dtype is profiled in its own subprocess so that the peak resident set size
+belongs to that run alone. The reported memory is the growth of the peak over
+the resident size once the input frame has been built, i.e. what profiling
+itself allocated on top of the data.
+
+Usage::
+
+    uv run python benchmarks/narrow_dtypes.py --rows 20000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+_SRC_ROOT = Path(__file__).resolve().parents[1] / "src"
+_DTYPES = ("Int8", "Int16", "Int32", "Float32", "Int64", "UInt64", "Float64")
+
+_SAMPLE_SCRIPT = """
+import json
+import resource
+import sys
+import time
+
+import polars as pl
+
+from mitoric.profiling.columns import profile_columns
+
+dtype = getattr(pl, sys.argv[1])
+rows = int(sys.argv[2])
+index = pl.int_range(rows, eager=True)
+values = (index * 7919 % 100) if dtype.is_integer() else (index * 0.37 % 100)
+frame = pl.DataFrame({"value": values.cast(dtype)})
+frame = frame.with_columns(
+    pl.when(pl.col("value") == 3).then(None).otherwise(pl.col("value")).alias("value")
+)
+
+before_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+profile_columns(frame, target_columns=None, explicit_types=None)
+elapsed = time.perf_counter() - start
+peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(
+    json.dumps(
+        {
+            "input_mib": frame.estimated_size() / 2**20,
+            "peak_growth_mib": (peak_kib - before_kib) / 1024,
+            "seconds": elapsed,
+        }
+    )
+)
+"""
+
+
+def _run_sample(dtype: str, rows: int) -> dict[str, float]:
+    completed = subprocess.run(
+        [sys.executable, "-c", _SAMPLE_SCRIPT, dtype, str(rows)],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": str(_SRC_ROOT)},
+    )
+    raw = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {key: float(value) for key, value in raw.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure peak memory of numeric profiling per dtype."
+    )
+    parser.add_argument("--rows", type=int, default=20_000_000)
+    parser.add_argument("--dtypes", nargs="+", default=list(_DTYPES))
+    args = parser.parse_args()
+
+    print(f"{'dtype':>8}{'input MiB':>12}{'peak +MiB':>12}{'seconds':>10}")
+    for dtype in args.dtypes:
+        sample = _run_sample(dtype, args.rows)
+        print(
+            f"{dtype:>8}{sample['input_mib']:12.1f}"
+            f"{sample['peak_growth_mib']:12.1f}{sample['seconds']:10.2f}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,89 @@
+"""Measure how per-column report cost scales with the number of columns.
+
+A full single report (``ReportPipeline.generate_single`` with diagnostics) is
+generated on frames of increasing width with a fixed number of rows, and the
+per-stage timings are read from the run's ``DiagnosticsRecorder``. On a pipeline
+that scales linearly the per-column figures stay flat as the width grows; the
+association stage is bounded by ``--association-max-columns`` and so shrinks per
+column.
+
+Usage::
+
+    uv run python benchmarks/wide_frame.py --columns 1000 5000 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+
+import polars as pl
+
+from mitoric.api.pipeline import ReportPipeline, SingleReportRequest
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
+
+_STAGES = (
+    "summarize_dataset",
+    "profile_columns",
+    "compute_associations",
+    "render_report",
+)
+_LABELS = ("summary", "profile", "associations", "render")
+
+
+def _wide_frame(columns: int, rows: int) -> pl.DataFrame:
+    index = pl.int_range(rows, eager=True)
+    return pl.DataFrame(
+        {
+            f"col_{position}": (
+                (index * (position + 1)) % 97
+                if position % 2 == 0
+                else (index % 5).cast(pl.String)
+            )
+            for position in range(columns)
+        }
+    )
+
+
+def _measure(columns: int, rows: int, max_columns: int) -> dict[str, float]:
+    request = SingleReportRequest.from_raw(
+        _wide_frame(columns, rows),
+        target_columns=None,
+        explicit_types=None,
+        save_path=None,
+        include_diagnostics=True,
+        association_max_columns=max_columns,
+    )
+    recorder = DiagnosticsRecorder()
+    ReportPipeline().generate_single(request, recorder=recorder)
+    diagnostics = recorder.build()
+    timings = {
+        str(timing.stage): float(timing.elapsed_seconds)
+        for timing in diagnostics.stages
+    }
+    timings["total"] = float(diagnostics.total_seconds)
+    return timings
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure per-column report cost on wide frames."
+    )
+    parser.add_argument(
+        "--columns", type=int, nargs="+", default=[1_000, 5_000, 20_000]
+    )
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--association-max-columns", type=int, default=50)
+    args = parser.parse_args()
+
+    header = "".join(f"{label:>14}" for label in (*_LABELS, "total"))
+    print(f"{'columns':>8}{header}   (ms per column)")
+    for columns in args.columns:
+        timings = _measure(columns, args.rows, args.association_max_columns)
+        per_column = [timings[stage] / columns * 1000 for stage in (*_STAGES, "total")]
+        cells = "".join(f"{value:14.3f}" for value in per_column)
+        print(f"{columns:>8}{cells}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,5 +1,23 @@
 """mitoric package."""
 
-from mitoric.api import generate_compare_report, generate_single_report
+from mitoric.api import (
+    agenerate_compare_report,
+    agenerate_single_report,
+    generate_compare_report,
+    generate_single_report,
+)
+from mitoric.profiling.utils.progress import (
+    CancellationToken,
+    ProgressUpdate,
+    ReportCancelledError,
+)
 
-__all__ = ["generate_compare_report", "generate_single_report"]
+__all__ = [
+    "CancellationToken",
+    "ProgressUpdate",
+    "ReportCancelledError",
+    "agenerate_compare_report",
+    "agenerate_single_report",
+    "generate_compare_report",
+    "generate_single_report",
+]
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import logging
+import math
 import time
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -19,14 +21,26 @@ from mitoric.models.base import (
     SavePath,
     WarningMessage,
 )
-from mitoric.profiling.associations import compute_associations
+from mitoric.profiling.associations import (
+    compute_association_drift,
+    compute_associations,
+)
 from mitoric.profiling.columns import (
     compare_column_profiles,
     compare_common_column_profiles,
     profile_columns,
 )
 from mitoric.profiling.dataset import summarize_comparison, summarize_dataset
+from mitoric.profiling.facts import FrameFacts
 from mitoric.profiling.histograms.config import HISTOGRAM_BINS
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
+from mitoric.profiling.utils.nested import struct_leaf_columns, unnest_struct_columns
+from mitoric.profiling.utils.progress import ProgressTracker
+from mitoric.profiling.utils.scan_accounting import track_scans
+from mitoric.profiling.utils.type_utils import (
+    classify_column_type,
+    needs_basic_statistics_only,
+)
 from mitoric.render.template import render_report
 from mitoric.reporting.builder import (
     build_compare_report_payload,
@@ -50,7 +64,52 @@ def _normalize_explicit_types(
     return list(explicit_types)
 
 
-def _normalize_save_path(save_path: str | None) -> SavePath:
+def _normalize_association_tolerance(tolerance: float | None) -> float | None:
+    if tolerance is None:
+        return None
+    if not math.isfinite(tolerance) or tolerance < 0:
+        raise ValueError("association_tolerance must be a non-negative number")
+    return float(tolerance)
+
+
+def _normalize_association_max_columns(max_columns: int | None) -> int | None:
+    if max_columns is None:
+        return None
+    if isinstance(max_columns, bool) or max_columns < 1:
+        raise ValueError("association_max_columns must be a positive integer")
+    return int(max_columns)
+
+
+_ASSOCIATION_TARGET_TYPES = (
+    ColumnType.NUMERIC,
+    ColumnType.CATEGORICAL,
+    ColumnType.BOOLEAN,
+)
+
+
+def _validate_association_target(
+    frame: pl.DataFrame, association_target: str | None
+) -> ColumnName | None:
+    if association_target is None:
+        return None
+    if association_target not in frame.columns:
+        raise ValueError(
+            f"association_target not found in DataFrame: {association_target!r}"
+        )
+    series = frame.get_column(association_target)
+    if (
+        needs_basic_statistics_only(series.dtype)
+        or classify_column_type(series) not in _ASSOCIATION_TARGET_TYPES
+    ):
+        raise ValueError(
+            "association_target must be a numeric, categorical or boolean "
+            f"column: {association_target!r}"
+        )
+    return ColumnName(association_target)
+
+
+def normalize_save_path(save_path: str | None) -> SavePath:
+    """Validate ``save_path``; an empty ``SavePath`` means "do not write"."""
     if save_path is None:
         return SavePath("")
     if not save_path.strip():
@@ -58,7 +117,8 @@ def _normalize_save_path(save_path: str | None) -> SavePath:
     return SavePath(save_path)
 
 
-def _write_report(save_path: SavePath, html: str) -> None:
+def write_report(save_path: SavePath, html: str) -> None:
+    """Write ``html`` to ``save_path``, creating parent directories as needed."""
     if not save_path:
         return
     output_path = Path(save_path)
@@ -73,17 +133,52 @@ def _normalize_compare_label(label: str | None, default: str) -> DatasetId:
     return DatasetId(cleaned or default)
 
 
+def _input_columns(frame: pl.DataFrame | pl.LazyFrame) -> list[str]:
+    if isinstance(frame, pl.LazyFrame):
+        return frame.collect_schema().names()
+    return frame.columns
+
+
 def _validate_target_columns(
-    frame: pl.DataFrame, target_columns: list[ColumnName]
+    frame: pl.DataFrame | pl.LazyFrame, target_columns: list[ColumnName]
 ) -> None:
     if not target_columns:
         return
-    column_names = set(frame.columns)
+    column_names = set(_input_columns(frame))
     missing = [name for name in target_columns if name not in column_names]
     if missing:
         raise ValueError(f"target_columns not found in DataFrame: {missing}")
 
 
+def _project_input(
+    frame: pl.DataFrame | pl.LazyFrame,
+    target_columns: list[ColumnName],
+    *,
+    strict_projection: bool,
+) -> pl.DataFrame:
+    """Materialize the input, keeping only ``target_columns`` in strict mode.
+
+    For a ``LazyFrame`` the projection is part of the query, so scans of
+    Parquet/IPC/CSV sources never read the other columns.
+    """
+    if strict_projection and target_columns:
+        frame = frame.select([str(name) for name in dict.fromkeys(target_columns)])
+    if isinstance(frame, pl.LazyFrame):
+        return frame.collect()
+    return frame
+
+
+def _expand_struct_targets(
+    frames: list[pl.DataFrame], target_columns: list[ColumnName]
+) -> list[ColumnName]:
+    expanded: dict[ColumnName, None] = {}
+    for name in target_columns:
+        for frame in frames:
+            for leaf in struct_leaf_columns(frame, name):
+                expanded[ColumnName(leaf)] = None
+    return list(expanded)
+
+
 def _validate_explicit_types(
     frame: pl.DataFrame, explicit_types: list[ExplicitType]
 ) -> list[ExplicitType]:
@@ -130,6 +225,25 @@ def _log_debug_counts(label: str, frame: pl.DataFrame) -> None:
     _logger.debug("%s: rows=%s cols=%s", label, frame.height, frame.width)
 
 
+@contextmanager
+def _log_debug_scan_report(name: str) -> Iterator[None]:
+    if not _logger.isEnabledFor(logging.DEBUG):
+        yield
+        return
+    with track_scans() as ledger:
+        yield
+    _logger.debug("%s: full-column passes per column\n%s", name, ledger.format_report())
+
+
+@contextmanager
+def _stage(
+    name: str, recorder: DiagnosticsRecorder, tracker: ProgressTracker
+) -> Iterator[None]:
+    tracker.begin(name)
+    with recorder.stage(name):
+        yield
+
+
 def _default_template_path() -> Path:
     return Path(__file__).resolve().parents[1] / "templates" / "report.html"
 
@@ -146,28 +260,65 @@ class SingleReportRequest:
     target_columns: list[ColumnName]
     explicit_types: list[ExplicitType]
     save_path: SavePath
+    include_diagnostics: bool = False
+    approximate_duplicates: bool = False
+    association_tolerance: float | None = None
+    association_target: ColumnName | None = None
+    association_max_columns: int | None = None
+    association_mutual_information: bool = False
 
     @classmethod
     def from_raw(
         cls,
-        frame: pl.DataFrame,
+        frame: pl.DataFrame | pl.LazyFrame,
         *,
         target_columns: list[str] | None,
         explicit_types: list[ExplicitType] | None,
         save_path: str | None,
+        include_diagnostics: bool = False,
+        unnest_structs: bool = False,
+        strict_projection: bool = False,
+        approximate_duplicates: bool = False,
+        association_tolerance: float | None = None,
+        association_target: str | None = None,
+        association_max_columns: int | None = None,
+        association_mutual_information: bool = False,
     ) -> SingleReportRequest:
         normalized_target_columns = _normalize_target_columns(target_columns)
         normalized_explicit_types = _normalize_explicit_types(explicit_types)
-        normalized_save_path = _normalize_save_path(save_path)
+        normalized_save_path = normalize_save_path(save_path)
+        normalized_association_tolerance = _normalize_association_tolerance(
+            association_tolerance
+        )
+        normalized_association_max_columns = _normalize_association_max_columns(
+            association_max_columns
+        )
         _validate_target_columns(frame, normalized_target_columns)
+        frame = _project_input(
+            frame, normalized_target_columns, strict_projection=strict_projection
+        )
+        if unnest_structs:
+            normalized_target_columns = _expand_struct_targets(
+                [frame], normalized_target_columns
+            )
+            frame = unnest_struct_columns(frame)
         validated_explicit_types = _validate_explicit_types(
             frame, normalized_explicit_types
         )
+        validated_association_target = _validate_association_target(
+            frame, association_target
+        )
         return cls(
             frame=frame,
             target_columns=normalized_target_columns,
             explicit_types=validated_explicit_types,
             save_path=normalized_save_path,
+            include_diagnostics=include_diagnostics,
+            approximate_duplicates=approximate_duplicates,
+            association_tolerance=normalized_association_tolerance,
+            association_target=validated_association_target,
+            association_max_columns=normalized_association_max_columns,
+            association_mutual_information=association_mutual_information,
         )
 
 
@@ -180,26 +331,51 @@ class CompareReportRequest:
     save_path: SavePath
     left_name: DatasetId
     right_name: DatasetId
+    include_diagnostics: bool = False
+    approximate_duplicates: bool = False
+    association_max_columns: int | None = None
+    association_mutual_information: bool = False
 
     @classmethod
     def from_raw(
         cls,
-        left: pl.DataFrame,
-        right: pl.DataFrame,
+        left: pl.DataFrame | pl.LazyFrame,
+        right: pl.DataFrame | pl.LazyFrame,
         *,
         target_columns: list[str] | None,
         explicit_types: list[ExplicitType] | None,
         save_path: str | None,
         left_name: str | None,
         right_name: str | None,
+        include_diagnostics: bool = False,
+        unnest_structs: bool = False,
+        strict_projection: bool = False,
+        approximate_duplicates: bool = False,
+        association_max_columns: int | None = None,
+        association_mutual_information: bool = False,
     ) -> CompareReportRequest:
         normalized_target_columns = _normalize_target_columns(target_columns)
         normalized_explicit_types = _normalize_explicit_types(explicit_types)
-        normalized_save_path = _normalize_save_path(save_path)
+        normalized_save_path = normalize_save_path(save_path)
         normalized_left_name = _normalize_compare_label(left_name, "left")
         normalized_right_name = _normalize_compare_label(right_name, "right")
+        normalized_association_max_columns = _normalize_association_max_columns(
+            association_max_columns
+        )
         _validate_target_columns(left, normalized_target_columns)
         _validate_target_columns(right, normalized_target_columns)
+        left = _project_input(
+            left, normalized_target_columns, strict_projection=strict_projection
+        )
+        right = _project_input(
+            right, normalized_target_columns, strict_projection=strict_projection
+        )
+        if unnest_structs:
+            normalized_target_columns = _expand_struct_targets(
+                [left, right], normalized_target_columns
+            )
+            left = unnest_struct_columns(left)
+            right = unnest_struct_columns(right)
         validated_explicit_types = _validate_explicit_types(
             left, normalized_explicit_types
         )
@@ -212,6 +388,10 @@ class CompareReportRequest:
             save_path=normalized_save_path,
             left_name=normalized_left_name,
             right_name=normalized_right_name,
+            include_diagnostics=include_diagnostics,
+            approximate_duplicates=approximate_duplicates,
+            association_max_columns=normalized_association_max_columns,
+            association_mutual_information=association_mutual_information,
         )
 
 
@@ -225,38 +405,101 @@ class ReportPipeline:
         self._template_path = template_path or _default_template_path()
         self._histogram_bins = histogram_bins
 
-    def generate_single(self, request: SingleReportRequest) -> str:
+    def generate_single(
+        self,
+        request: SingleReportRequest,
+        *,
+        tracker: ProgressTracker | None = None,
+        recorder: DiagnosticsRecorder | None = None,
+    ) -> str:
+        """Render a single report; ``recorder`` receives the stage timings."""
+        with _log_debug_scan_report("generate_single_report"):
+            return self._generate_single(
+                request, tracker or ProgressTracker(), recorder or DiagnosticsRecorder()
+            )
+
+    def generate_compare(
+        self,
+        request: CompareReportRequest,
+        *,
+        tracker: ProgressTracker | None = None,
+        recorder: DiagnosticsRecorder | None = None,
+    ) -> str:
+        """Render a compare report; ``recorder`` receives the stage timings."""
+        with _log_debug_scan_report("generate_compare_report"):
+            return self._generate_compare(
+                request, tracker or ProgressTracker(), recorder or DiagnosticsRecorder()
+            )
+
+    def _generate_single(
+        self,
+        request: SingleReportRequest,
+        tracker: ProgressTracker,
+        recorder: DiagnosticsRecorder,
+    ) -> str:
         start = _log_info_start("generate_single_report")
         _log_debug_counts("input", request.frame)
+        facts = FrameFacts(request.frame)
 
         warnings = _collect_input_warnings(request.frame)
         for warning in warnings:
             _logger.warning("generate_single_report: %s", warning)
 
-        dataset_summary = summarize_dataset(request.frame, dataset_id="single")
-        column_profiles = profile_columns(
-            request.frame,
-            target_columns=_optional_target_columns(request.target_columns),
-            explicit_types=request.explicit_types,
-        )
-        associations = compute_associations(request.frame)
+        with _stage("summarize_dataset", recorder, tracker):
+            dataset_summary = summarize_dataset(
+                request.frame,
+                dataset_id="single",
+                approximate_duplicates=request.approximate_duplicates,
+                facts=facts,
+            )
+        with _stage("profile_columns", recorder, tracker):
+            column_profiles = profile_columns(
+                request.frame,
+                target_columns=_optional_target_columns(request.target_columns),
+                explicit_types=request.explicit_types,
+                recorder=recorder,
+                tracker=tracker,
+                facts=facts,
+            )
+        with _stage("compute_associations", recorder, tracker):
+            associations = compute_associations(
+                request.frame,
+                recorder=recorder,
+                tracker=tracker,
+                facts=facts,
+                screening_tolerance=request.association_tolerance,
+                target=request.association_target,
+                max_columns=request.association_max_columns,
+                mutual_information=request.association_mutual_information,
+            )
         payload = build_single_report_payload(
             warnings=warnings,
             dataset_summary=dataset_summary,
             column_profiles=column_profiles,
             associations=associations,
             histogram_bins=self._histogram_bins,
+            diagnostics=recorder.build() if request.include_diagnostics else None,
         )
-        html = render_report(self._template_path, payload)
-        _write_report(request.save_path, html)
+        with _stage("render_report", recorder, tracker):
+            html = render_report(self._template_path, payload)
+        with _stage("write_report", recorder, tracker):
+            write_report(request.save_path, html)
+        tracker.finish()
 
         _log_info_end("generate_single_report", start)
         return html
 
-    def generate_compare(self, request: CompareReportRequest) -> str:
+    def _generate_compare(
+        self,
+        request: CompareReportRequest,
+        tracker: ProgressTracker,
+        recorder: DiagnosticsRecorder,
+    ) -> str:
         start = _log_info_start("generate_compare_report")
         _log_debug_counts("left", request.left)
         _log_debug_counts("right", request.right)
+        left_facts = FrameFacts(request.left)
+        right_facts = FrameFacts(request.right)
 
         warnings = _collect_input_warnings(request.left) + _collect_input_warnings(
             request.right
@@ -264,25 +507,50 @@ class ReportPipeline:
         for warning in warnings:
             _logger.warning("generate_compare_report: %s", warning)
 
-        base_summary = summarize_comparison(
-            request.left,
-            request.right,
-            left_id=request.left_name,
-            right_id=request.right_name,
-        )
+        with _stage("summarize_comparison", recorder, tracker):
+            base_summary = summarize_comparison(
+                request.left,
+                request.right,
+                left_id=request.left_name,
+                right_id=request.right_name,
+                approximate_duplicates=request.approximate_duplicates,
+                left_facts=left_facts,
+                right_facts=right_facts,
+            )
         target_columns = _optional_target_columns(request.target_columns)
-        left_only_profiles, right_only_profiles = compare_column_profiles(
-            request.left,
-            request.right,
-            target_columns=target_columns,
-            explicit_types=request.explicit_types,
-        )
-        compare_profiles = compare_common_column_profiles(
-            request.left,
-            request.right,
-            target_columns=target_columns,
-            explicit_types=request.explicit_types,
-        )
+        with _stage("profile_unmatched_columns", recorder, tracker):
+            left_only_profiles, right_only_profiles = compare_column_profiles(
+                request.left,
+                request.right,
+                target_columns=target_columns,
+                explicit_types=request.explicit_types,
+                recorder=recorder,
+                tracker=tracker,
+                left_facts=left_facts,
+                right_facts=right_facts,
+            )
+        with _stage("profile_common_columns", recorder, tracker):
+            compare_profiles = compare_common_column_profiles(
+                request.left,
+                request.right,
+                target_columns=target_columns,
+                explicit_types=request.explicit_types,
+                recorder=recorder,
+                tracker=tracker,
+                left_facts=left_facts,
+                right_facts=right_facts,
+            )
+        with _stage("compute_association_drift", recorder, tracker):
+            association_drift, association_column_limit = compute_association_drift(
+                request.left,
+                request.right,
+                recorder=recorder,
+                tracker=tracker,
+                left_facts=left_facts,
+                right_facts=right_facts,
+                max_columns=request.association_max_columns,
+                mutual_information=request.association_mutual_information,
+            )
         comparison_summary = ComparisonSummary(
             left_dataset=base_summary.left_dataset,
             right_dataset=base_summary.right_dataset,
@@ -291,15 +559,21 @@ class ReportPipeline:
             type_mismatches=base_summary.type_mismatches,
             column_profiles_left_only=left_only_profiles,
             column_profiles_right_only=right_only_profiles,
+            association_drift=association_drift,
+            association_column_limit=association_column_limit,
         )
         payload = build_compare_report_payload(
             warnings=warnings,
             comparison_summary=comparison_summary,
             compare_column_profiles=compare_profiles,
             histogram_bins=self._histogram_bins,
+            diagnostics=recorder.build() if request.include_diagnostics else None,
         )
-        html = render_report(self._template_path, payload)
-        _write_report(request.save_path, html)
+        with _stage("render_report", recorder, tracker):
+            html = render_report(self._template_path, payload)
+        with _stage("write_report", recorder, tracker):
+            write_report(request.save_path, html)
+        tracker.finish()
 
         _log_info_end("generate_compare_report", start)
         return html
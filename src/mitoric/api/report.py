@@ -1,43 +1,110 @@
-"""Report generation entry points."""
+"""Report generation entry points.
+
+The pipeline (and with it Polars, every profiling module and Jinja2) is imported
+on the first call so that ``import mitoric`` stays cheap for short-lived workers.
+
+The ``agenerate_*`` variants run the same pipeline on a bounded thread pool so
+an asyncio service can queue many reports without blocking its event loop.
+Polars releases the GIL for its kernels, so threads are enough to keep the
+profiling off the loop.
+"""
 
 from __future__ import annotations
 
-import polars as pl
+import os
+import threading
+from functools import partial
+from typing import TYPE_CHECKING
 
-from mitoric.api.pipeline import (
-    CompareReportRequest,
-    ReportPipeline,
-    SingleReportRequest,
-)
 from mitoric.models.base import ExplicitType
+from mitoric.profiling.utils.progress import (
+    CancellationToken,
+    ProgressCallback,
+    ProgressTracker,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+    import polars as pl
+
+ASYNC_REPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def _default_executor() -> Executor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(
+                max_workers=ASYNC_REPORT_WORKERS, thread_name_prefix="mitoric"
+            )
+        return _executor
 
 
 def generate_single_report(
-    frame: pl.DataFrame,
+    frame: pl.DataFrame | pl.LazyFrame,
     *,
     target_columns: list[str] | None = None,
     explicit_types: list[ExplicitType] | None = None,
     save_path: str | None = None,
+    include_diagnostics: bool = False,
+    unnest_structs: bool = False,
+    strict_projection: bool = False,
+    approximate_duplicates: bool = False,
+    association_tolerance: float | None = None,
+    association_target: str | None = None,
+    association_max_columns: int | None = None,
+    association_mutual_information: bool = False,
+    progress: ProgressCallback | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> str:
+    from mitoric.api.pipeline import ReportPipeline, SingleReportRequest
+
     request = SingleReportRequest.from_raw(
         frame,
         target_columns=target_columns,
         explicit_types=explicit_types,
         save_path=save_path,
+        include_diagnostics=include_diagnostics,
+        unnest_structs=unnest_structs,
+        strict_projection=strict_projection,
+        approximate_duplicates=approximate_duplicates,
+        association_tolerance=association_tolerance,
+        association_target=association_target,
+        association_max_columns=association_max_columns,
+        association_mutual_information=association_mutual_information,
+    )
+    return ReportPipeline().generate_single(
+        request, tracker=ProgressTracker(progress, cancel_token)
     )
-    return ReportPipeline().generate_single(request)
 
 
 def generate_compare_report(
-    left: pl.DataFrame,
-    right: pl.DataFrame,
+    left: pl.DataFrame | pl.LazyFrame,
+    right: pl.DataFrame | pl.LazyFrame,
     *,
     target_columns: list[str] | None = None,
     explicit_types: list[ExplicitType] | None = None,
     save_path: str | None = None,
     left_name: str | None = None,
     right_name: str | None = None,
+    include_diagnostics: bool = False,
+    unnest_structs: bool = False,
+    strict_projection: bool = False,
+    approximate_duplicates: bool = False,
+    association_max_columns: int | None = None,
+    association_mutual_information: bool = False,
+    progress: ProgressCallback | None = None,
+    cancel_token: CancellationToken | None = None,
 ) -> str:
+    from mitoric.api.pipeline import CompareReportRequest, ReportPipeline
+
     request = CompareReportRequest.from_raw(
         left,
         right,
@@ -46,5 +113,118 @@ def generate_compare_report(
         save_path=save_path,
         left_name=left_name,
         right_name=right_name,
+        include_diagnostics=include_diagnostics,
+        unnest_structs=unnest_structs,
+        strict_projection=strict_projection,
+        approximate_duplicates=approximate_duplicates,
+        association_max_columns=association_max_columns,
+        association_mutual_information=association_mutual_information,
+    )
+    return ReportPipeline().generate_compare(
+        request, tracker=ProgressTracker(progress, cancel_token)
+    )
+
+
+async def agenerate_single_report(
+    frame: pl.DataFrame | pl.LazyFrame,
+    *,
+    target_columns: list[str] | None = None,
+    explicit_types: list[ExplicitType] | None = None,
+    save_path: str | None = None,
+    include_diagnostics: bool = False,
+    unnest_structs: bool = False,
+    strict_projection: bool = False,
+    approximate_duplicates: bool = False,
+    association_tolerance: float | None = None,
+    association_target: str | None = None,
+    association_max_columns: int | None = None,
+    association_mutual_information: bool = False,
+    progress: ProgressCallback | None = None,
+    cancel_token: CancellationToken | None = None,
+    executor: Executor | None = None,
+) -> str:
+    token = cancel_token or CancellationToken()
+    generate = partial(
+        generate_single_report,
+        frame,
+        target_columns=target_columns,
+        explicit_types=explicit_types,
+        include_diagnostics=include_diagnostics,
+        unnest_structs=unnest_structs,
+        strict_projection=strict_projection,
+        approximate_duplicates=approximate_duplicates,
+        association_tolerance=association_tolerance,
+        association_target=association_target,
+        association_max_columns=association_max_columns,
+        association_mutual_information=association_mutual_information,
+        progress=progress,
+        cancel_token=token,
+    )
+    return await _run_and_save(generate, save_path, token, executor)
+
+
+async def agenerate_compare_report(
+    left: pl.DataFrame | pl.LazyFrame,
+    right: pl.DataFrame | pl.LazyFrame,
+    *,
+    target_columns: list[str] | None = None,
+    explicit_types: list[ExplicitType] | None = None,
+    save_path: str | None = None,
+    left_name: str | None = None,
+    right_name: str | None = None,
+    include_diagnostics: bool = False,
+    unnest_structs: bool = False,
+    strict_projection: bool = False,
+    approximate_duplicates: bool = False,
+    association_max_columns: int | None = None,
+    association_mutual_information: bool = False,
+    progress: ProgressCallback | None = None,
+    cancel_token: CancellationToken | None = None,
+    executor: Executor | None = None,
+) -> str:
+    token = cancel_token or CancellationToken()
+    generate = partial(
+        generate_compare_report,
+        left,
+        right,
+        target_columns=target_columns,
+        explicit_types=explicit_types,
+        left_name=left_name,
+        right_name=right_name,
+        include_diagnostics=include_diagnostics,
+        unnest_structs=unnest_structs,
+        strict_projection=strict_projection,
+        approximate_duplicates=approximate_duplicates,
+        association_max_columns=association_max_columns,
+        association_mutual_information=association_mutual_information,
+        progress=progress,
+        cancel_token=token,
+    )
+    return await _run_and_save(generate, save_path, token, executor)
+
+
+async def _run_and_save(
+    generate: Callable[[], str],
+    save_path: str | None,
+    token: CancellationToken,
+    executor: Executor | None,
+) -> str:
+    import asyncio
+    import contextvars
+
+    from mitoric.api.pipeline import normalize_save_path, write_report
+
+    normalized_save_path = normalize_save_path(save_path)
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    future = loop.run_in_executor(
+        executor or _default_executor(), partial(context.run, generate)
     )
-    return ReportPipeline().generate_compare(request)
+    try:
+        html = await future
+    except asyncio.CancelledError:
+        # The worker thread cannot be interrupted; stop it at its next checkpoint.
+        token.cancel()
+        raise
+    await asyncio.to_thread(write_report, normalized_save_path, html)
+    return html
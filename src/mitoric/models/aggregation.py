@@ -5,12 +5,14 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 from mitoric.models.base import (
+    AssociationMetric,
     AssociationValue,
     ColumnCount,
     ColumnName,
     ColumnType,
     DatasetId,
     DuplicateRowCount,
+    EncodedMatrix,
     MemoryBytes,
     MissingCount,
     MissingRate,
@@ -158,6 +160,16 @@ class ListProfile:
     length_stats: ListLengthStats
     length_histograms: list[Histogram] = field(default_factory=list)
     value_samples: list[str] = field(default_factory=list)
+    element_count: int = 0
+    profiled_element_count: int = 0
+    element_numeric_profile: NumericProfile | None = None
+    element_categorical_profile: CategoricalProfile | None = None
+
+
+@dataclass(frozen=True)
+class BinaryProfile:
+    prefix_bytes: int
+    top_prefixes: list[CategoryCount] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -188,6 +200,7 @@ class ColumnProfile:
     text_profile: TextProfile | None = None
     datetime_profile: DatetimeProfile | None = None
     list_profile: ListProfile | None = None
+    binary_profile: BinaryProfile | None = None
     value_samples: list[str] = field(default_factory=list)
 
 
@@ -206,11 +219,61 @@ class Association:
     value: AssociationValue
 
 
+@dataclass(frozen=True)
+class AssociationDrift:
+    """One metric's score of a column pair in both datasets."""
+
+    column: ColumnName
+    other_column: ColumnName
+    metric: AssociationMetric
+    left_value: AssociationValue
+    right_value: AssociationValue
+    change: AssociationValue
+
+
+@dataclass(frozen=True)
+class TargetAssociation:
+    feature: ColumnName
+    metric: AssociationMetric
+    value: AssociationValue
+
+
+@dataclass(frozen=True)
+class AssociationMatrix:
+    """Every pair score of one family over ``columns``, quantized to bytes.
+
+    ``values`` is the base64 of one uint8 per pair ``(i, j)`` with ``i < j``,
+    in row-major order: ``round(score * 254)``, or 255 for a pair that was
+    not scored. ``signed`` scores in [-1, 1] are stored as
+    ``round((score + 1) / 2 * 254)``.
+    """
+
+    columns: list[ColumnName] = field(default_factory=list)
+    values: EncodedMatrix = EncodedMatrix("")
+    signed: bool = False
+
+
+@dataclass(frozen=True)
+class AssociationColumnLimit:
+    """Columns left out of associations by ``max_columns`` (per column kind)."""
+
+    max_columns: ColumnCount
+    omitted_columns: list[ColumnName] = field(default_factory=list)
+
+
 @dataclass(frozen=True)
 class AssociationSummary:
     numeric_numeric: list[Association]
     categorical_categorical: list[Association]
     numeric_categorical: list[Association]
+    numeric_numeric_spearman: list[Association] = field(default_factory=list)
+    mutual_information: list[Association] = field(default_factory=list)
+    numeric_numeric_matrix: AssociationMatrix | None = None
+    categorical_categorical_matrix: AssociationMatrix | None = None
+    mutual_information_matrix: AssociationMatrix | None = None
+    target: ColumnName | None = None
+    target_associations: list[TargetAssociation] = field(default_factory=list)
+    column_limit: AssociationColumnLimit | None = None
 
 
 @dataclass(frozen=True)
@@ -240,3 +303,5 @@ class ComparisonSummary:
     type_mismatches: list[TypeMismatch]
     column_profiles_left_only: list[ColumnProfile]
     column_profiles_right_only: list[ColumnProfile]
+    association_drift: list[AssociationDrift] = field(default_factory=list)
+    association_column_limit: AssociationColumnLimit | None = None
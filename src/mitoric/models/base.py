@@ -38,6 +38,16 @@ class ColumnType(str, Enum):
         return self.value
 
 
+class AssociationMetric(str, Enum):
+    PEARSON = "pearson"
+    CORRELATION_RATIO = "correlation_ratio"
+    CRAMERS_V = "cramers_v"
+    MUTUAL_INFORMATION = "mutual_information"
+
+    def __str__(self) -> str:
+        return self.value
+
+
 ReportMode = NewType("ReportMode", str)
 SavePath = NewType("SavePath", str)
 
@@ -55,10 +65,16 @@ NullRate = NewType("NullRate", float)
 OutlierRate = NewType("OutlierRate", float)
 SuppressedCount = NewType("SuppressedCount", int)
 AssociationValue = NewType("AssociationValue", float)
+EncodedMatrix = NewType("EncodedMatrix", str)
 RowCountDelta = NewType("RowCountDelta", int)
 WarningMessage = NewType("WarningMessage", str)
 HtmlString = NewType("HtmlString", str)
 GeneratedAt = NewType("GeneratedAt", str)
+StageName = NewType("StageName", str)
+ElapsedSeconds = NewType("ElapsedSeconds", float)
+PairCount = NewType("PairCount", int)
+DtypeName = NewType("DtypeName", str)
+ApproximationNote = NewType("ApproximationNote", str)
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,49 @@
+"""Report generation cost diagnostics."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from mitoric.models.base import (
+    ApproximationNote,
+    ColumnName,
+    ColumnType,
+    DtypeName,
+    ElapsedSeconds,
+    PairCount,
+    StageName,
+    UniqueCount,
+)
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    stage: StageName
+    elapsed_seconds: ElapsedSeconds
+
+
+@dataclass(frozen=True)
+class ColumnTiming:
+    column_name: ColumnName
+    dtype: DtypeName
+    data_type: ColumnType
+    unique_count: UniqueCount
+    elapsed_seconds: ElapsedSeconds
+
+
+@dataclass(frozen=True)
+class AssociationPairCounts:
+    numeric_numeric: PairCount
+    categorical_categorical: PairCount
+    numeric_categorical: PairCount
+    numeric_numeric_spearman: PairCount
+    mutual_information: PairCount
+
+
+@dataclass(frozen=True)
+class ReportDiagnostics:
+    total_seconds: ElapsedSeconds
+    stages: list[StageTiming]
+    slowest_columns: list[ColumnTiming]
+    association_pairs: AssociationPairCounts
+    approximations: list[ApproximationNote] = field(default_factory=list)
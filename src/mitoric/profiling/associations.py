@@ -2,158 +2,977 @@
 
 from __future__ import annotations
 
+import base64
+import contextvars
 import math
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from itertools import chain, combinations
+from typing import TypeVar
 
 import polars as pl
 
-from mitoric.models.aggregation import Association, AssociationSummary
-from mitoric.models.base import AssociationValue, ColumnName, ColumnType
-from mitoric.profiling.utils.type_utils import (
-    classify_column_type,
-    needs_basic_statistics_only,
-    normalize_numeric_series,
+from mitoric.models.aggregation import (
+    Association,
+    AssociationColumnLimit,
+    AssociationDrift,
+    AssociationMatrix,
+    AssociationSummary,
+    TargetAssociation,
+)
+from mitoric.models.base import (
+    AssociationMetric,
+    AssociationValue,
+    ColumnCount,
+    ColumnName,
+    ColumnType,
+    EncodedMatrix,
+)
+from mitoric.profiling.facts import FrameFacts
+from mitoric.profiling.histograms.builder import (
+    float_bin_expression,
+    integer_bin_expression,
+)
+from mitoric.profiling.histograms.config import HISTOGRAM_BINS
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
+from mitoric.profiling.utils.progress import ProgressTracker
+from mitoric.profiling.utils.scan_accounting import (
+    PassKind,
+    record_pass,
+    scanning_columns,
 )
 
 _TOP_ASSOCIATIONS = 20
 _MAX_ASSOCIATION_ROWS = 50_000
+_COLUMN_KINDS = ("numeric", "categorical", "datetime")
+_SCREENING_ROWS = 5_000
+# Correlations of a block run as one query; contingency tables one per pair.
+_CORRELATION_BLOCK_PAIRS = 256
+_CONTINGENCY_BLOCK_PAIRS = 32
+# Mutual information bins numeric and datetime columns as coarsely as the
+# report's coarsest histogram.
+_MI_BINS = HISTOGRAM_BINS[0]
+_MATRIX_SCALE = 254
+_MATRIX_UNSCORED = 255
+
+ASSOCIATION_WORKERS = min(4, os.cpu_count() or 1)
+
+_Pair = tuple[str, str]
+_ColumnKinds = tuple[list[str], list[str], list[str]]
+_Advance = Callable[[int], None]
+_Score = TypeVar("_Score")
+_Scorer = Callable[[pl.DataFrame, list[_Pair]], dict[_Pair, _Score]]
 
 
-def _limit_association_rows(frame: pl.DataFrame) -> pl.DataFrame:
+def _limit_association_rows(
+    frame: pl.DataFrame, recorder: DiagnosticsRecorder | None
+) -> pl.DataFrame:
     if frame.height > _MAX_ASSOCIATION_ROWS:
+        if recorder is not None:
+            recorder.record_approximation(
+                f"Associations use the first {_MAX_ASSOCIATION_ROWS} of "
+                f"{frame.height} rows."
+            )
         return frame.head(_MAX_ASSOCIATION_ROWS)
     return frame
 
 
-def _pearson(frame: pl.DataFrame, left: str, right: str) -> float:
-    subset = frame.select([pl.col(left), pl.col(right)]).drop_nulls()
-    if subset.height < 2:
-        return 0.0
-    cov, var_left, var_right = subset.select(
-        ((pl.col(left) - pl.col(left).mean()) * (pl.col(right) - pl.col(right).mean()))
-        .sum()
-        .alias("cov"),
-        ((pl.col(left) - pl.col(left).mean()) ** 2).sum().alias("var_left"),
-        ((pl.col(right) - pl.col(right).mean()) ** 2).sum().alias("var_right"),
+def _limit_association_columns(
+    kinds: _ColumnKinds,
+    max_columns: int | None,
+    recorder: DiagnosticsRecorder | None,
+) -> tuple[_ColumnKinds, AssociationColumnLimit | None]:
+    """Keep the first ``max_columns`` numeric, categorical and datetime columns.
+
+    Pairs grow quadratically with width, so callers profiling very wide frames
+    may cap each kind; the columns left out are returned for the report.
+    """
+    if max_columns is None:
+        return kinds, None
+    omitted: list[ColumnName] = []
+    for columns, kind in zip(kinds, _COLUMN_KINDS, strict=True):
+        if len(columns) > max_columns:
+            omitted.extend(ColumnName(name) for name in columns[max_columns:])
+            if recorder is not None:
+                recorder.record_approximation(
+                    f"Associations use the first {max_columns} of "
+                    f"{len(columns)} {kind} columns."
+                )
+    numeric_columns, categorical_columns, datetime_columns = kinds
+    limited = (
+        numeric_columns[:max_columns],
+        categorical_columns[:max_columns],
+        datetime_columns[:max_columns],
+    )
+    if not omitted:
+        return limited, None
+    return limited, AssociationColumnLimit(
+        max_columns=ColumnCount(max_columns), omitted_columns=omitted
+    )
+
+
+def _pearson_scores(frame: pl.DataFrame, pairs: list[_Pair]) -> dict[_Pair, float]:
+    for left, right in pairs:
+        with scanning_columns(left, right):
+            record_pass(PassKind.SCAN)
+    # One query for every pair; pl.corr skips rows where either side is null,
+    # and yields NaN for fewer than two rows or a constant side.
+    values = frame.select(
+        pl.corr(left, right).alias(str(index))
+        for index, (left, right) in enumerate(pairs)
+    ).row(0)
+    return {
+        pair: _finite_score(value) for pair, value in zip(pairs, values, strict=True)
+    }
+
+
+def _pearson_drift_scores(
+    frame: pl.DataFrame, pairs: list[_Pair], *, side: str
+) -> dict[_Pair, tuple[float, float]]:
+    for left, right in pairs:
+        with scanning_columns(left, right):
+            record_pass(PassKind.SCAN)
+    # One query for every pair and both sides.
+    rows = (
+        frame.group_by(side)
+        .agg(
+            pl.corr(left, right).alias(str(index))
+            for index, (left, right) in enumerate(pairs)
+        )
+        .iter_rows()
+    )
+    values = {side_value: side_values for side_value, *side_values in rows}
+    return {
+        pair: (
+            _finite_score(values[0][index]) if 0 in values else 0.0,
+            _finite_score(values[1][index]) if 1 in values else 0.0,
+        )
+        for index, pair in enumerate(pairs)
+    }
+
+
+def _finite_score(value: float | None) -> float:
+    return float(value) if value is not None and math.isfinite(value) else 0.0
+
+
+def _rank_columns(frame: pl.DataFrame, columns: list[str]) -> pl.DataFrame:
+    """Average ranks of every column, computed once and shared by all pairs.
+
+    Each column is ranked over its own non-null values, so for pairs with
+    nulls in different rows Spearman is the Pearson correlation of those
+    ranks over the rows both sides have. NaN and infinite values are treated
+    as missing; ``rank`` would otherwise place NaN above every number.
+    """
+    ranked_columns: list[pl.Expr] = []
+    for name in columns:
+        with scanning_columns(name):
+            record_pass(PassKind.COPY)
+        value = pl.col(name)
+        if frame.schema[name].is_float():
+            value = pl.when(value.is_finite()).then(value)
+        ranked_columns.append(value.rank("average").alias(name))
+    return frame.select(ranked_columns)
+
+
+def _category_codes(frame: pl.DataFrame, columns: list[str]) -> pl.DataFrame:
+    """Dense integer codes (``1..cardinality``, nulls kept) for every column."""
+    for name in columns:
+        with scanning_columns(name):
+            record_pass(PassKind.COPY)
+    return frame.select(pl.col(name).rank("dense") for name in columns)
+
+
+def _cramers_v(
+    codes: pl.DataFrame, left: str, right: str, side: str | None
+) -> dict[int, float]:
+    """Cramer's V of one pair, keyed by side.
+
+    With ``side`` naming a column of ``codes`` holding ``0`` or ``1``, each side
+    is its own table; otherwise every row is side ``0``.
+    """
+    # Both codes are packed into one cell key, so the joint counts are a single
+    # group_by over integers and only the non-zero cells of the table exist.
+    record_pass(PassKind.SCAN)
+    right_cardinality = codes.get_column(right).max()
+    if not isinstance(right_cardinality, int):
+        return {}
+    stride = right_cardinality + 1
+    # The side is packed into the cell key too, as its lowest digit.
+    sides = 1 if side is None else 2
+    cell = pl.col(left).cast(pl.UInt64) * stride + pl.col(right)
+    if side is not None:
+        cell = cell * sides + pl.col(side)
+    record_pass(PassKind.HASH_AGGREGATION)
+    counts = (
+        codes.select(cell.alias("cell"))
+        .drop_nulls()
+        .group_by("cell")
+        .len()
+        # Fixed cell order keeps the float sums below independent of threading.
+        .sort("cell")
+        .select(
+            (pl.col("cell") % sides).alias("side"),
+            (pl.col("cell") // sides // stride).alias("row"),
+            (pl.col("cell") // sides % stride).alias("col"),
+            pl.col("len").cast(pl.Float64).alias("count"),
+        )
+    )
+    # chi2 = n * (sum(count^2 / (row_total * col_total)) - 1), summed over the
+    # observed cells; zero cells contribute nothing to the sum. The totals are
+    # windows, computed before the group_by as Polars before 1.35 rejects
+    # windows inside ``agg``.
+    count = pl.col("count")
+    record_pass(PassKind.HASH_AGGREGATION)
+    row_levels = pl.col("row").n_unique()
+    record_pass(PassKind.HASH_AGGREGATION)
+    col_levels = pl.col("col").n_unique()
+    rows = (
+        counts.with_columns(
+            (count.sum().over("side", "row") * count.sum().over("side", "col")).alias(
+                "margins"
+            )
+        )
+        .group_by("side", maintain_order=True)
+        .agg(
+            count.sum().alias("n"),
+            pl.min_horizontal(row_levels, col_levels).alias("k"),
+            (count**2 / pl.col("margins")).sum().alias("ratio_sum"),
+        )
+        .iter_rows()
+    )
+    scores: dict[int, float] = {}
+    for side_value, n, k, ratio_sum in rows:
+        chi2 = float(n) * (float(ratio_sum) - 1.0) if k > 1 and n else 0.0
+        scores[side_value] = math.sqrt(chi2 / (float(n) * (k - 1))) if chi2 > 0 else 0.0
+    return scores
+
+
+def _cramers_v_scores(codes: pl.DataFrame, pairs: list[_Pair]) -> dict[_Pair, float]:
+    scores: dict[_Pair, float] = {}
+    for left, right in pairs:
+        with scanning_columns(left, right):
+            scores[(left, right)] = _cramers_v(codes, left, right, None).get(0, 0.0)
+    return scores
+
+
+def _cramers_v_drift_scores(
+    codes: pl.DataFrame, pairs: list[_Pair], *, side: str
+) -> dict[_Pair, tuple[float, float]]:
+    scores: dict[_Pair, tuple[float, float]] = {}
+    for left, right in pairs:
+        with scanning_columns(left, right):
+            sides = _cramers_v(codes, left, right, side)
+        scores[(left, right)] = (sides.get(0, 0.0), sides.get(1, 0.0))
+    return scores
+
+
+def _binned_codes(frame: pl.DataFrame, columns: list[str]) -> pl.DataFrame:
+    """Histogram bin index of every numeric or datetime value.
+
+    Bins use the histogram builder's edges at its coarsest bin count; temporal
+    values are binned on their physical integers. Nulls and non-finite floats
+    have no bin.
+    """
+    if not columns:
+        return pl.DataFrame()
+    prepared_columns: list[pl.Expr] = []
+    for name in columns:
+        with scanning_columns(name):
+            record_pass(PassKind.COPY)
+        value = pl.col(name)
+        dtype = frame.schema[name]
+        if dtype.is_temporal():
+            value = value.to_physical()
+        elif dtype.is_decimal():
+            value = value.cast(pl.Float64)
+        if dtype.is_float() or dtype.is_decimal():
+            value = pl.when(value.is_finite()).then(value)
+        prepared_columns.append(value.alias(name))
+    prepared = frame.select(prepared_columns)
+    bound_columns: list[pl.Expr] = []
+    for name in columns:
+        with scanning_columns(name):
+            record_pass(PassKind.SCAN)
+            bound_columns.append(pl.col(name).min())
+            record_pass(PassKind.SCAN)
+            bound_columns.append(pl.col(name).max())
+    bounds = prepared.select(
+        bound.alias(str(index)) for index, bound in enumerate(bound_columns)
     ).row(0)
-    if cov is None or var_left is None or var_right is None:
-        return 0.0
-    if var_left == 0 or var_right == 0:
-        return 0.0
-    return float(cov) / math.sqrt(float(var_left) * float(var_right))
-
-
-def _cramers_v(frame: pl.DataFrame, left: str, right: str) -> float:
-    subset = frame.select([pl.col(left), pl.col(right)]).drop_nulls()
-    if subset.height == 0:
-        return 0.0
-    counts = subset.group_by([left, right]).len().rename({"len": "count"})
-    if counts.height == 0:
-        return 0.0
-    row_values = subset.select(pl.col(left).unique())
-    col_values = subset.select(pl.col(right).unique())
-    full_table = (
-        row_values.join(col_values, how="cross")
-        .join(counts, on=[left, right], how="left")
-        .with_columns(pl.col("count").fill_null(0))
-    )
-    row_totals = full_table.group_by(left).agg(pl.sum("count").alias("row_total"))
-    col_totals = full_table.group_by(right).agg(pl.sum("count").alias("col_total"))
-    k = min(row_totals.height, col_totals.height)
-    if k <= 1:
-        return 0.0
-    n = full_table.select(pl.sum("count")).row(0)[0]
-    if not n:
-        return 0.0
-    joined = full_table.join(row_totals, on=left).join(col_totals, on=right)
-    expected = pl.col("row_total") * pl.col("col_total") / pl.lit(n)
-    chi2 = joined.select(((pl.col("count") - expected) ** 2 / expected).sum()).row(0)[0]
-    if chi2 is None or chi2 == 0:
-        return 0.0
-    return math.sqrt(float(chi2) / (float(n) * (k - 1)))
-
-
-def _correlation_ratio(frame: pl.DataFrame, numeric: str, categorical: str) -> float:
-    subset = frame.select([pl.col(numeric), pl.col(categorical)]).drop_nulls()
-    if subset.height == 0:
-        return 0.0
-    mean_total = subset.select(pl.col(numeric).mean()).row(0)[0]
-    if mean_total is None:
-        return 0.0
-    grouped = subset.group_by(categorical).agg(
-        pl.col(numeric).mean().alias("group_mean"),
-        pl.len().alias("group_count"),
-    )
-    numerator = grouped.select(
-        (pl.col("group_count") * (pl.col("group_mean") - pl.lit(mean_total)) ** 2).sum()
-    ).row(0)[0]
-    denominator = subset.select(
-        ((pl.col(numeric) - pl.lit(mean_total)) ** 2).sum()
-    ).row(0)[0]
-    if numerator is None or denominator is None or denominator == 0:
-        return 0.0
-    return math.sqrt(float(numerator) / float(denominator))
-
-
-def compute_associations(frame: pl.DataFrame) -> AssociationSummary:
-    frame = _limit_association_rows(frame)
+    bins: list[pl.Expr] = []
+    for index, name in enumerate(columns):
+        raw_min, raw_max = bounds[2 * index], bounds[2 * index + 1]
+        dtype = prepared.schema[name]
+        if raw_min is None or raw_max is None or raw_min == raw_max:
+            bin_expr = pl.when(pl.col(name).is_not_null()).then(pl.lit(0, pl.UInt16))
+        elif dtype.is_integer():
+            integer_min, integer_max = int(raw_min), int(raw_max)
+            width = max(1, math.ceil((integer_max - integer_min + 1) / _MI_BINS))
+            bin_expr = integer_bin_expression(
+                dtype, integer_min, width, _MI_BINS, column=name
+            )
+        else:
+            min_value = float(raw_min)
+            bin_expr = float_bin_expression(
+                min_value,
+                (float(raw_max) - min_value) / _MI_BINS,
+                _MI_BINS,
+                column=name,
+            )
+        bins.append(bin_expr.alias(name))
+    return prepared.select(bins)
+
+
+def _mutual_information(
+    codes: pl.DataFrame, pairs: list[_Pair], side: str | None
+) -> dict[tuple[int, int], float]:
+    """Normalized mutual information of every pair in one query.
+
+    Each pair's codes are packed into one cell key and counted by a group_by
+    over integers, so only the non-zero cells of its table exist; the tables
+    of all pairs are then reduced together. Marginals are taken over those
+    cells, i.e. over the rows both sides have, and MI is normalized by the
+    geometric mean of the two entropies.
+
+    With ``side`` naming a column of ``codes`` holding ``0`` or ``1``, each
+    side is its own table and the result is keyed by ``(pair index, side)``;
+    otherwise every row is side ``0``.
+    """
+    right_columns = list(dict.fromkeys(right for _, right in pairs))
+    maxima = codes.select(pl.col(right_columns).max()).row(0, named=True)
+    # The side is packed into the cell key too, as its lowest digit.
+    sides = 1 if side is None else 2
+    tables: list[pl.LazyFrame] = []
+    for index, (left, right) in enumerate(pairs):
+        with scanning_columns(left, right):
+            record_pass(PassKind.SCAN)
+            record_pass(PassKind.HASH_AGGREGATION)
+        if maxima[right] is None:
+            continue
+        stride = maxima[right] + 1
+        cell = pl.col(left).cast(pl.UInt64) * stride + pl.col(right)
+        if side is not None:
+            cell = cell * sides + pl.col(side)
+        tables.append(
+            codes.lazy()
+            .select(cell.alias("cell"))
+            .drop_nulls()
+            .group_by("cell")
+            .len()
+            # Fixed cell order keeps the float sums below independent of threading.
+            .sort("cell")
+            .select(
+                pl.lit(index, pl.UInt32).alias("pair"),
+                (pl.col("cell") % sides).alias("side"),
+                (pl.col("cell") // sides // stride).alias("row"),
+                (pl.col("cell") // sides % stride).alias("col"),
+                pl.col("len").cast(pl.Float64).alias("count"),
+            )
+        )
+    if not tables:
+        return {}
+    # Marginals are windows over the cells; Polars before 1.35 rejects windows
+    # inside ``agg``, so they are columns by the time the tables are reduced.
+    probability = pl.col("probability")
+    row_probability = pl.col("row_probability")
+    col_probability = pl.col("col_probability")
+    rows = (
+        pl.concat(tables)
+        .with_columns(
+            (pl.col("count") / pl.col("count").sum().over("pair", "side")).alias(
+                "probability"
+            )
+        )
+        .with_columns(
+            probability.sum().over("pair", "side", "row").alias("row_probability"),
+            probability.sum().over("pair", "side", "col").alias("col_probability"),
+        )
+        .group_by("pair", "side", maintain_order=True)
+        .agg(
+            (probability * (probability / (row_probability * col_probability)).log())
+            .sum()
+            .alias("information"),
+            -(probability * row_probability.log()).sum().alias("left_entropy"),
+            -(probability * col_probability.log()).sum().alias("right_entropy"),
+        )
+        .collect()
+        .iter_rows()
+    )
+    scores: dict[tuple[int, int], float] = {}
+    for index, side_value, information, left_entropy, right_entropy in rows:
+        score = 0.0
+        if left_entropy > 0 and right_entropy > 0:
+            score = information / math.sqrt(left_entropy * right_entropy)
+        scores[(index, side_value)] = min(1.0, max(0.0, score))
+    return scores
+
+
+def _mutual_information_scores(
+    codes: pl.DataFrame, pairs: list[_Pair]
+) -> dict[_Pair, float]:
+    scores = _mutual_information(codes, pairs, None)
+    return {pair: scores.get((index, 0), 0.0) for index, pair in enumerate(pairs)}
+
+
+def _mutual_information_drift_scores(
+    codes: pl.DataFrame, pairs: list[_Pair], *, side: str
+) -> dict[_Pair, tuple[float, float]]:
+    scores = _mutual_information(codes, pairs, side)
+    return {
+        pair: (scores.get((index, 0), 0.0), scores.get((index, 1), 0.0))
+        for index, pair in enumerate(pairs)
+    }
+
+
+def _correlation_ratios(
+    frame: pl.DataFrame,
+    numeric_columns: list[str],
+    categorical: str,
+    side: str | None,
+) -> dict[tuple[str, int], float]:
+    """Correlation ratio of every numeric column against one categorical.
+
+    A single group_by collects each numeric column's non-null count, mean and
+    variance per category; the total sum of squares is the within-group part
+    plus the between-group part, so no second pass over the rows is needed.
+    Rows where either side is null are excluded per pair, as before.
+
+    Ratios are keyed by ``(numeric column, side)``. With ``side`` naming a
+    column of ``frame`` holding ``0`` or ``1``, each side has its own groups;
+    otherwise every row is side ``0``.
+    """
+    for name in numeric_columns:
+        with scanning_columns(name, categorical):
+            record_pass(PassKind.HASH_AGGREGATION)
+            record_pass(PassKind.SCAN)
+    keys = [categorical] if side is None else [side, categorical]
+    grouped = (
+        frame.group_by(keys)
+        .agg(
+            aggregation
+            for index, name in enumerate(numeric_columns)
+            for aggregation in (
+                pl.col(name).count().alias(f"count_{index}"),
+                pl.col(name).mean().alias(f"mean_{index}"),
+                pl.col(name).var(ddof=0).alias(f"var_{index}"),
+            )
+        )
+        .filter(pl.col(categorical).is_not_null())
+        .sort(keys)
+    )
+    sums: list[pl.Expr] = []
+    for index in range(len(numeric_columns)):
+        count = pl.col(f"count_{index}")
+        group_mean = pl.col(f"mean_{index}")
+        total_mean = (count * group_mean).sum() / count.sum()
+        sums.extend(
+            [
+                (count * (group_mean - total_mean) ** 2)
+                .sum()
+                .alias(f"between_{index}"),
+                (count * pl.col(f"var_{index}")).sum().alias(f"within_{index}"),
+            ]
+        )
+    if side is None:
+        rows = [(0, *grouped.select(sums).row(0))]
+    else:
+        rows = grouped.group_by(side, maintain_order=True).agg(sums).rows()
+    ratios: dict[tuple[str, int], float] = {}
+    for side_value, *row in rows:
+        for index, name in enumerate(numeric_columns):
+            between, within = row[2 * index], row[2 * index + 1]
+            denominator = (between or 0.0) + (within or 0.0)
+            if between is None or denominator == 0 or not math.isfinite(denominator):
+                ratios[(name, side_value)] = 0.0
+                continue
+            ratios[(name, side_value)] = math.sqrt(float(between) / float(denominator))
+    return ratios
+
+
+def _correlation_ratio_scores(
+    frame: pl.DataFrame, pairs: list[_Pair]
+) -> dict[_Pair, float]:
+    numeric_by_categorical: dict[str, list[str]] = {}
+    for numeric, categorical in pairs:
+        numeric_by_categorical.setdefault(categorical, []).append(numeric)
+    scores: dict[_Pair, float] = {}
+    for categorical, numeric_columns in numeric_by_categorical.items():
+        ratios = _correlation_ratios(frame, numeric_columns, categorical, None)
+        for numeric in numeric_columns:
+            scores[(numeric, categorical)] = ratios[(numeric, 0)]
+    return scores
+
+
+def _correlation_ratio_drift_scores(
+    frame: pl.DataFrame, pairs: list[_Pair], *, side: str
+) -> dict[_Pair, tuple[float, float]]:
+    numeric_by_categorical: dict[str, list[str]] = {}
+    for numeric, categorical in pairs:
+        numeric_by_categorical.setdefault(categorical, []).append(numeric)
+    scores: dict[_Pair, tuple[float, float]] = {}
+    for categorical, numeric_columns in numeric_by_categorical.items():
+        ratios = _correlation_ratios(frame, numeric_columns, categorical, side)
+        for numeric in numeric_columns:
+            scores[(numeric, categorical)] = (
+                ratios.get((numeric, 0), 0.0),
+                ratios.get((numeric, 1), 0.0),
+            )
+    return scores
+
+
+def _slices(pairs: list[_Pair], size: int) -> list[list[_Pair]]:
+    return [pairs[start : start + size] for start in range(0, len(pairs), size)]
+
+
+def _blocks_by_categorical(pairs: list[_Pair]) -> list[list[_Pair]]:
+    blocks: dict[str, list[_Pair]] = {}
+    for pair in pairs:
+        blocks.setdefault(pair[1], []).append(pair)
+    return list(blocks.values())
+
+
+@contextmanager
+def _block_executor(workers: int) -> Iterator[Executor | None]:
+    if workers <= 1:
+        yield None
+        return
+    executor = ThreadPoolExecutor(
+        max_workers=workers, thread_name_prefix="mitoric-associations"
+    )
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _score_blocks(
+    score: _Scorer[_Score],
+    source: pl.DataFrame,
+    blocks: list[list[_Pair]],
+    advance: _Advance,
+    executor: Executor | None,
+) -> dict[_Pair, _Score]:
+    """Score pair blocks, in parallel when an executor is given.
+
+    Results are merged in block order, so the outcome does not depend on which
+    worker finishes first. Progress and cancellation stay on the calling thread.
+    """
+    scores: dict[_Pair, _Score] = {}
+    if executor is None:
+        for block in blocks:
+            scores.update(score(source, block))
+            advance(len(block))
+        return scores
+    # Each block runs in its own copy of the caller's context so scan
+    # accounting keeps attributing passes to the active ledger.
+    futures = [
+        executor.submit(contextvars.copy_context().run, score, source, block)
+        for block in blocks
+    ]
+    try:
+        for block, future in zip(blocks, futures, strict=True):
+            scores.update(future.result())
+            advance(len(block))
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+    return scores
+
+
+def _screening_sample(
+    frame: pl.DataFrame, tolerance: float, recorder: DiagnosticsRecorder | None
+) -> pl.DataFrame:
+    sample = frame.gather_every(math.ceil(frame.height / _SCREENING_ROWS))
+    if recorder is not None:
+        recorder.record_approximation(
+            f"Association pairs were screened on {sample.height} of "
+            f"{frame.height} rows; only pairs scoring within {tolerance} of the "
+            f"top {_TOP_ASSOCIATIONS} were computed exactly."
+        )
+    return sample
+
+
+def _screen(scores: dict[_Pair, float], tolerance: float) -> list[_Pair]:
+    if len(scores) <= _TOP_ASSOCIATIONS:
+        return list(scores)
+    cutoff = sorted(scores.values(), reverse=True)[_TOP_ASSOCIATIONS - 1]
+    return [pair for pair, value in scores.items() if value >= cutoff - tolerance]
+
+
+def _pair_columns(pairs: list[_Pair]) -> list[str]:
+    return list(dict.fromkeys(chain.from_iterable(pairs)))
+
+
+def _to_associations(scores: dict[_Pair, float]) -> list[Association]:
+    return [
+        Association(
+            left=ColumnName(left),
+            right=ColumnName(right),
+            value=AssociationValue(value),
+        )
+        for (left, right), value in scores.items()
+    ]
+
+
+def _association_matrix(
+    columns: list[str], scores: dict[_Pair, float], *, signed: bool = False
+) -> AssociationMatrix:
+    # Scores in [0, 1] quantized to 1/254 steps: plenty for a colour scale,
+    # and one byte per pair keeps wide reports small. Signed scores are first
+    # mapped from [-1, 1] onto [0, 1].
+    def level(score: float) -> float:
+        if signed:
+            score = (score + 1.0) / 2.0
+        return min(1.0, max(0.0, score))
+
+    values = bytes(
+        _MATRIX_UNSCORED
+        if (score := scores.get(pair)) is None
+        else round(level(score) * _MATRIX_SCALE)
+        for pair in combinations(columns, 2)
+    )
+    return AssociationMatrix(
+        columns=[ColumnName(name) for name in columns],
+        values=EncodedMatrix(base64.b64encode(values).decode("ascii")),
+        signed=signed,
+    )
+
+
+def _association_columns(
+    frame: pl.DataFrame, facts: FrameFacts, progress: ProgressTracker
+) -> tuple[list[str], list[str], list[str]]:
+    """Numeric, categorical (including boolean) and datetime columns, in order."""
     numeric_columns: list[str] = []
     categorical_columns: list[str] = []
-    numeric_overrides: list[pl.Series] = []
-
+    datetime_columns: list[str] = []
     for name in frame.columns:
-        series = frame.get_column(name)
-        if needs_basic_statistics_only(series.dtype):
+        progress.checkpoint()
+        column_facts = facts.column(name)
+        if column_facts.basic_statistics_only:
             continue
-        kind = classify_column_type(series)
-        if kind == ColumnType.BOOLEAN:
-            kind = ColumnType.CATEGORICAL
-        if kind == ColumnType.NUMERIC:
-            numeric_columns.append(name)
-            normalized_series, _ = normalize_numeric_series(series)
-            numeric_overrides.append(normalized_series.rename(name))
-        elif kind == ColumnType.CATEGORICAL:
-            categorical_columns.append(name)
+        with scanning_columns(name):
+            kind = column_facts.column_type
+            if kind == ColumnType.BOOLEAN:
+                kind = ColumnType.CATEGORICAL
+            if kind == ColumnType.NUMERIC:
+                numeric_columns.append(name)
+            elif kind == ColumnType.CATEGORICAL:
+                categorical_columns.append(name)
+            elif kind == ColumnType.DATETIME:
+                datetime_columns.append(name)
+    return numeric_columns, categorical_columns, datetime_columns
+
 
+def _with_normalized_numeric(
+    frame: pl.DataFrame, facts: FrameFacts, numeric_columns: list[str]
+) -> pl.DataFrame:
+    # Shared facts may describe more rows than ``frame``; their numeric views
+    # are cut to its height.
+    numeric_overrides: list[pl.Series] = []
+    for name in numeric_columns:
+        with scanning_columns(name):
+            normalized_series, _ = facts.column(name).normalized_numeric
+        numeric_overrides.append(normalized_series.head(frame.height).rename(name))
     if numeric_overrides:
         frame = frame.with_columns(numeric_overrides)
+    return frame
 
-    numeric_numeric: list[Association] = []
-    categorical_categorical: list[Association] = []
-    numeric_categorical: list[Association] = []
-
-    for i, left in enumerate(numeric_columns):
-        for right in numeric_columns[i + 1 :]:
-            value = _pearson(frame, left, right)
-            numeric_numeric.append(
-                Association(
-                    left=ColumnName(left),
-                    right=ColumnName(right),
-                    value=AssociationValue(value),
-                )
+
+def _compute_target_associations(
+    frame: pl.DataFrame,
+    target: str,
+    numeric_columns: list[str],
+    categorical_columns: list[str],
+    *,
+    recorder: DiagnosticsRecorder | None,
+    progress: ProgressTracker,
+    workers: int | None,
+) -> AssociationSummary:
+    """Score every feature against ``target`` with the metric their types call for.
+
+    Pearson r for numeric pairs, the correlation ratio for numeric against
+    categorical (in either role) and Cramér's V for categorical pairs. With a
+    categorical target all numeric features share one group_by; with a numeric
+    target all numeric features share one correlation query.
+    """
+    numeric_features = [name for name in numeric_columns if name != target]
+    categorical_features = [name for name in categorical_columns if name != target]
+    if target in numeric_columns:
+        numeric_pairs = [(name, target) for name in numeric_features]
+        mixed_pairs = [(target, name) for name in categorical_features]
+        categorical_pairs: list[_Pair] = []
+    else:
+        numeric_pairs = []
+        mixed_pairs = [(name, target) for name in numeric_features]
+        categorical_pairs = [(name, target) for name in categorical_features]
+
+    total_pairs = len(numeric_pairs) + len(mixed_pairs) + len(categorical_pairs)
+    done_pairs = 0
+
+    def advance(count: int) -> None:
+        nonlocal done_pairs
+        done_pairs += count
+        progress.advance(done_pairs, total_pairs)
+
+    with _block_executor(workers or ASSOCIATION_WORKERS) as executor:
+        codes = _category_codes(frame, _pair_columns(categorical_pairs))
+        scored = [
+            (
+                AssociationMetric.PEARSON,
+                _score_blocks(
+                    _pearson_scores,
+                    frame,
+                    _slices(numeric_pairs, _CORRELATION_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+            ),
+            (
+                AssociationMetric.CORRELATION_RATIO,
+                _score_blocks(
+                    _correlation_ratio_scores,
+                    frame,
+                    _blocks_by_categorical(mixed_pairs),
+                    advance,
+                    executor,
+                ),
+            ),
+            (
+                AssociationMetric.CRAMERS_V,
+                _score_blocks(
+                    _cramers_v_scores,
+                    codes,
+                    _slices(categorical_pairs, _CONTINGENCY_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+            ),
+        ]
+
+    if recorder is not None:
+        recorder.record_association_pairs(
+            numeric_numeric=len(numeric_pairs),
+            categorical_categorical=len(categorical_pairs),
+            numeric_categorical=len(mixed_pairs),
+            # Target rankings use neither rank correlation nor mutual information.
+            numeric_numeric_spearman=0,
+            mutual_information=0,
+        )
+    target_associations = [
+        TargetAssociation(
+            feature=ColumnName(right if left == target else left),
+            metric=metric,
+            value=AssociationValue(value),
+        )
+        for metric, scores in scored
+        for (left, right), value in scores.items()
+    ]
+    # Signed Pearson values rank by strength, like the unsigned metrics.
+    target_associations.sort(key=lambda item: (-abs(item.value), str(item.feature)))
+    return AssociationSummary(
+        numeric_numeric=[],
+        categorical_categorical=[],
+        numeric_categorical=[],
+        target=ColumnName(target),
+        target_associations=target_associations,
+    )
+
+
+def compute_associations(
+    frame: pl.DataFrame,
+    *,
+    recorder: DiagnosticsRecorder | None = None,
+    tracker: ProgressTracker | None = None,
+    facts: FrameFacts | None = None,
+    screening_tolerance: float | None = None,
+    workers: int | None = None,
+    target: str | None = None,
+    max_columns: int | None = None,
+    mutual_information: bool = False,
+) -> AssociationSummary:
+    """Score numeric, categorical and mixed column pairs and keep the top ones.
+
+    With ``screening_tolerance`` set, frames longer than the screening sample
+    are first scored on an evenly spaced sample of rows. Only pairs whose
+    sampled score is within the tolerance of the sampled top-20 cut-off are
+    then computed exactly, so the ranking can differ from the exact one only
+    for pairs whose sampled score misses by more than the tolerance.
+
+    Pairs are scored in blocks on up to ``workers`` threads (default
+    :data:`ASSOCIATION_WORKERS`); Polars releases the GIL inside each query.
+
+    Normalized mutual information, which needs one contingency table per
+    pair of any column kinds, is scored only with ``mutual_information`` set;
+    the summary's ``mutual_information_matrix`` is otherwise ``None``. The
+    Pearson and Cramer's V scores of every pair are always kept as matrices
+    (Pearson signed) for the report's heatmaps.
+
+    With ``max_columns`` set, only the first ``max_columns`` columns of each
+    kind are paired; the summary's ``column_limit`` lists the others.
+
+    With ``target`` set, only the pairs of every other column with that
+    column are scored, and all of them are ranked; see
+    :func:`_compute_target_associations`. Screening and ``max_columns``,
+    which exist for the quadratic all-pairs case, are then skipped.
+    """
+    progress = tracker or ProgressTracker()
+    frame = _limit_association_rows(frame, recorder)
+    # Shared facts describe the full frame; their numeric views are cut to the
+    # association rows below.
+    frame_facts = facts or FrameFacts(frame)
+    kinds = _association_columns(frame, frame_facts, progress)
+
+    column_limit = None
+    if target is not None:
+        if target not in kinds[0] and target not in kinds[1]:
+            raise ValueError(
+                f"association target must be a numeric or categorical column: "
+                f"{target!r}"
             )
+    else:
+        kinds, column_limit = _limit_association_columns(kinds, max_columns, recorder)
+    numeric_columns, categorical_columns, datetime_columns = kinds
+    frame = _with_normalized_numeric(frame, frame_facts, numeric_columns)
+    if target is not None:
+        return _compute_target_associations(
+            frame,
+            target,
+            numeric_columns,
+            categorical_columns,
+            recorder=recorder,
+            progress=progress,
+            workers=workers,
+        )
+
+    numeric_pairs = list(combinations(numeric_columns, 2))
+    categorical_pairs = list(combinations(categorical_columns, 2))
+    mixed_pairs = [
+        (numeric, categorical)
+        for categorical in categorical_columns
+        for numeric in numeric_columns
+    ]
+    spearman_pairs = numeric_pairs
+    information_columns = [*numeric_columns, *datetime_columns, *categorical_columns]
+    information_pairs = (
+        list(combinations(information_columns, 2)) if mutual_information else []
+    )
+
+    with _block_executor(workers or ASSOCIATION_WORKERS) as executor:
 
-    for i, left in enumerate(categorical_columns):
-        for right in categorical_columns[i + 1 :]:
-            value = _cramers_v(frame, left, right)
-            categorical_categorical.append(
-                Association(
-                    left=ColumnName(left),
-                    right=ColumnName(right),
-                    value=AssociationValue(value),
+        def score_families(
+            source: pl.DataFrame,
+            advance: _Advance,
+        ) -> tuple[dict[_Pair, float], ...]:
+            ranks = _rank_columns(source, _pair_columns(spearman_pairs))
+            coded_columns = set(_pair_columns([*categorical_pairs, *information_pairs]))
+            codes = _category_codes(
+                source, [name for name in categorical_columns if name in coded_columns]
+            ).hstack(
+                _binned_codes(
+                    source,
+                    [
+                        name
+                        for name in [*numeric_columns, *datetime_columns]
+                        if name in coded_columns
+                    ],
                 )
             )
+            return (
+                _score_blocks(
+                    _pearson_scores,
+                    source,
+                    _slices(numeric_pairs, _CORRELATION_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+                _score_blocks(
+                    _pearson_scores,
+                    ranks,
+                    _slices(spearman_pairs, _CORRELATION_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+                _score_blocks(
+                    _cramers_v_scores,
+                    codes,
+                    _slices(categorical_pairs, _CONTINGENCY_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+                _score_blocks(
+                    _correlation_ratio_scores,
+                    source,
+                    _blocks_by_categorical(mixed_pairs),
+                    advance,
+                    executor,
+                ),
+                _score_blocks(
+                    _mutual_information_scores,
+                    codes,
+                    _slices(information_pairs, _CONTINGENCY_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+            )
 
-    for numeric in numeric_columns:
-        for categorical in categorical_columns:
-            value = _correlation_ratio(frame, numeric, categorical)
-            numeric_categorical.append(
-                Association(
-                    left=ColumnName(numeric),
-                    right=ColumnName(categorical),
-                    value=AssociationValue(value),
-                )
+        if screening_tolerance is not None and frame.height > _SCREENING_ROWS:
+            sample = _screening_sample(frame, screening_tolerance, recorder)
+
+            def screen_checkpoint(_: int) -> None:
+                progress.checkpoint()
+
+            (
+                numeric_pairs,
+                spearman_pairs,
+                categorical_pairs,
+                mixed_pairs,
+                information_pairs,
+            ) = (
+                _screen(scores, screening_tolerance)
+                for scores in score_families(sample, screen_checkpoint)
             )
 
+        total_pairs = (
+            len(numeric_pairs)
+            + len(spearman_pairs)
+            + len(categorical_pairs)
+            + len(mixed_pairs)
+            + len(information_pairs)
+        )
+        done_pairs = 0
+
+        def advance(count: int) -> None:
+            nonlocal done_pairs
+            done_pairs += count
+            progress.advance(done_pairs, total_pairs)
+
+        (
+            numeric_numeric_scores,
+            spearman_scores,
+            categorical_scores,
+            mixed_scores,
+            information_scores,
+        ) = score_families(frame, advance)
+
+    numeric_numeric = _to_associations(numeric_numeric_scores)
+    numeric_numeric_spearman = _to_associations(spearman_scores)
+    categorical_categorical = _to_associations(categorical_scores)
+    numeric_categorical = _to_associations(mixed_scores)
+    information_associations = _to_associations(information_scores)
+
+    if recorder is not None:
+        recorder.record_association_pairs(
+            numeric_numeric=len(numeric_numeric),
+            categorical_categorical=len(categorical_categorical),
+            numeric_categorical=len(numeric_categorical),
+            numeric_numeric_spearman=len(numeric_numeric_spearman),
+            mutual_information=len(information_associations),
+        )
+
     def _top(entries: list[Association]) -> list[Association]:
         ordered = sorted(
             entries,
@@ -165,4 +984,192 @@ def compute_associations(frame: pl.DataFrame) -> AssociationSummary:
         numeric_numeric=_top(numeric_numeric),
         categorical_categorical=_top(categorical_categorical),
         numeric_categorical=_top(numeric_categorical),
+        numeric_numeric_spearman=_top(numeric_numeric_spearman),
+        mutual_information=_top(information_associations),
+        numeric_numeric_matrix=_association_matrix(
+            numeric_columns, numeric_numeric_scores, signed=True
+        ),
+        categorical_categorical_matrix=_association_matrix(
+            categorical_columns, categorical_scores
+        ),
+        mutual_information_matrix=(
+            _association_matrix(information_columns, information_scores)
+            if mutual_information
+            else None
+        ),
+        column_limit=column_limit,
+    )
+
+
+def compute_association_drift(
+    left: pl.DataFrame,
+    right: pl.DataFrame,
+    *,
+    recorder: DiagnosticsRecorder | None = None,
+    tracker: ProgressTracker | None = None,
+    left_facts: FrameFacts | None = None,
+    right_facts: FrameFacts | None = None,
+    workers: int | None = None,
+    max_columns: int | None = None,
+    mutual_information: bool = False,
+) -> tuple[list[AssociationDrift], AssociationColumnLimit | None]:
+    """Pairs of common columns whose association changed most.
+
+    Pearson r, Cramer's V and the correlation ratio are scored on both sides,
+    and normalized mutual information too with ``mutual_information`` set.
+    Both frames are stacked and coded together, so a category or a histogram
+    bin has the same code on either side. Each pair is then scored once for
+    both sides, with the side as a group key or packed into the cell key,
+    instead of running the association stage once per frame. ``max_columns``
+    caps the common columns of each kind as in :func:`compute_associations`;
+    the columns it leaves out are returned alongside the pairs.
+    """
+    progress = tracker or ProgressTracker()
+    left = _limit_association_rows(left, recorder)
+    right = _limit_association_rows(right, recorder)
+    left_kinds = _association_columns(left, left_facts or FrameFacts(left), progress)
+    right_kinds = _association_columns(
+        right, right_facts or FrameFacts(right), progress
+    )
+    common_numeric, common_categorical, common_datetime = (
+        [name for name in left_names if name in set(right_names)]
+        for left_names, right_names in zip(left_kinds, right_kinds, strict=True)
+    )
+    (numeric_columns, categorical_columns, datetime_columns), column_limit = (
+        _limit_association_columns(
+            (common_numeric, common_categorical, common_datetime),
+            max_columns,
+            recorder,
+        )
+    )
+    # Only mutual information pairs datetime columns. Their values are binned
+    # on their physical integers, which only line up when both sides share
+    # the dtype (and time unit).
+    datetime_columns = [
+        name
+        for name in datetime_columns
+        if mutual_information and left.schema[name] == right.schema[name]
+    ]
+    numeric_pairs = list(combinations(numeric_columns, 2))
+    categorical_pairs = list(combinations(categorical_columns, 2))
+    mixed_pairs = [
+        (numeric, categorical)
+        for categorical in categorical_columns
+        for numeric in numeric_columns
+    ]
+    columns = [*numeric_columns, *datetime_columns, *categorical_columns]
+    information_pairs = list(combinations(columns, 2)) if mutual_information else []
+    if len(columns) < 2:
+        return [], column_limit
+
+    side = "side"
+    while side in columns:
+        side = f"_{side}"
+    combined = pl.concat(
+        [
+            _with_normalized_numeric(frame, facts or FrameFacts(frame), numeric_columns)
+            .select(
+                *numeric_columns,
+                *datetime_columns,
+                *(pl.col(name).cast(pl.String) for name in categorical_columns),
+            )
+            .with_columns(pl.lit(index, pl.UInt8).alias(side))
+            for index, (frame, facts) in enumerate(
+                ((left, left_facts), (right, right_facts))
+            )
+        ],
+        how="vertical_relaxed",
+    )
+    binned_columns = [*numeric_columns, *datetime_columns] if mutual_information else []
+    codes = (
+        _category_codes(combined, categorical_columns)
+        .hstack(_binned_codes(combined, binned_columns))
+        .with_columns(combined.get_column(side))
+    )
+
+    total_pairs = (
+        len(numeric_pairs)
+        + len(categorical_pairs)
+        + len(mixed_pairs)
+        + len(information_pairs)
+    )
+    done_pairs = 0
+
+    def advance(count: int) -> None:
+        nonlocal done_pairs
+        done_pairs += count
+        progress.advance(done_pairs, total_pairs)
+
+    with _block_executor(workers or ASSOCIATION_WORKERS) as executor:
+        families = (
+            (
+                AssociationMetric.PEARSON,
+                _score_blocks(
+                    partial(_pearson_drift_scores, side=side),
+                    combined,
+                    _slices(numeric_pairs, _CORRELATION_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+            ),
+            (
+                AssociationMetric.CRAMERS_V,
+                _score_blocks(
+                    partial(_cramers_v_drift_scores, side=side),
+                    codes,
+                    _slices(categorical_pairs, _CONTINGENCY_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+            ),
+            (
+                AssociationMetric.CORRELATION_RATIO,
+                _score_blocks(
+                    partial(_correlation_ratio_drift_scores, side=side),
+                    combined,
+                    _blocks_by_categorical(mixed_pairs),
+                    advance,
+                    executor,
+                ),
+            ),
+            (
+                AssociationMetric.MUTUAL_INFORMATION,
+                _score_blocks(
+                    partial(_mutual_information_drift_scores, side=side),
+                    codes,
+                    _slices(information_pairs, _CONTINGENCY_BLOCK_PAIRS),
+                    advance,
+                    executor,
+                ),
+            ),
+        )
+    if recorder is not None:
+        recorder.record_association_pairs(
+            numeric_numeric=len(numeric_pairs),
+            categorical_categorical=len(categorical_pairs),
+            numeric_categorical=len(mixed_pairs),
+            numeric_numeric_spearman=0,
+            mutual_information=len(information_pairs),
+        )
+
+    drift = [
+        AssociationDrift(
+            column=ColumnName(column),
+            other_column=ColumnName(other_column),
+            metric=metric,
+            left_value=AssociationValue(left_value),
+            right_value=AssociationValue(right_value),
+            change=AssociationValue(right_value - left_value),
+        )
+        for metric, scores in families
+        for (column, other_column), (left_value, right_value) in scores.items()
+    ]
+    drift.sort(
+        key=lambda item: (
+            -abs(item.change),
+            str(item.column),
+            str(item.other_column),
+            str(item.metric),
+        )
     )
+    return drift[:_TOP_ASSOCIATIONS], column_limit
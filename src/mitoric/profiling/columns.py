@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import time
+
 import polars as pl
 
 from mitoric.models.aggregation import ColumnProfile, CompareColumnProfile
@@ -16,43 +18,122 @@ from mitoric.models.base import (
     ZeroCount,
 )
 from mitoric.profiling.compare.histograms import build_compare_histograms_for_column
+from mitoric.profiling.facts import ColumnFacts, FrameFacts
+from mitoric.profiling.profiles.binary import build_binary_profile
 from mitoric.profiling.profiles.categorical import build_categorical_profile
 from mitoric.profiling.profiles.datetime import build_datetime_profile
 from mitoric.profiling.profiles.list_profile import build_list_profile
 from mitoric.profiling.profiles.numeric import build_numeric_profile
 from mitoric.profiling.profiles.text import build_text_profile
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
+from mitoric.profiling.utils.progress import ProgressTracker
 from mitoric.profiling.utils.sampling import collect_sample_values
-from mitoric.profiling.utils.type_utils import (
-    infer_column_type,
-    is_numeric_dtype,
-    needs_basic_statistics_only,
-    normalize_numeric_series,
+from mitoric.profiling.utils.scan_accounting import (
+    PassKind,
+    record_pass,
+    scanning_columns,
 )
+from mitoric.profiling.utils.type_utils import is_binary_dtype, is_numeric_dtype
+
+
+def _explicit_type_map(
+    explicit_types: list[ExplicitType] | None,
+) -> dict[ColumnName, ColumnType]:
+    # The first entry for a column wins, as with a linear scan of the list.
+    mapping: dict[ColumnName, ColumnType] = {}
+    for explicit in explicit_types or []:
+        mapping.setdefault(explicit.column_name, explicit.data_type)
+    return mapping
+
+
+def _profile_column(
+    facts: ColumnFacts,
+    *,
+    row_count: int,
+    explicit_types: dict[ColumnName, ColumnType],
+    include_details: bool,
+) -> ColumnProfile:
+    series = facts.series
+    column_name = ColumnName(series.name)
+    data_type = explicit_types.get(column_name) or facts.column_type
+
+    null_count = facts.null_count
+    non_null_count = row_count - null_count
+    null_rate = null_count / row_count if row_count else 0.0
+    unique_count = facts.unique_count
+    zero_count = 0
+    numeric_input = series
+    numeric_is_integer = False
+    if data_type == ColumnType.NUMERIC:
+        numeric_input, numeric_is_integer = facts.normalized_numeric
+        zero_count = _count_zeros(numeric_input)
+    elif is_numeric_dtype(series.dtype):
+        zero_count = _count_zeros(series)
+
+    detail_supported = not facts.basic_statistics_only
+
+    numeric_profile = None
+    categorical_profile = None
+    text_profile = None
+    datetime_profile = None
+    list_profile = None
+    binary_profile = None
+    value_samples: list[str] = []
 
+    if include_details and detail_supported:
+        if data_type == ColumnType.NUMERIC:
+            numeric_profile = build_numeric_profile(
+                numeric_input, is_integer=numeric_is_integer
+            )
+        elif data_type in (ColumnType.CATEGORICAL, ColumnType.BOOLEAN):
+            record_pass(PassKind.COPY)
+            category_series = series.drop_nulls()
+            record_pass(PassKind.COPY)
+            category_series = category_series.cast(pl.Utf8)
+            if data_type == ColumnType.BOOLEAN:
+                record_pass(PassKind.COPY)
+                category_series = category_series.str.to_titlecase()
+            categorical_profile = build_categorical_profile(
+                category_series, unique_count
+            )
+        # The text and datetime builders drop nulls themselves.
+        elif data_type == ColumnType.TEXT:
+            record_pass(PassKind.COPY)
+            text_profile = build_text_profile(series.cast(pl.Utf8))
+        elif data_type == ColumnType.DATETIME:
+            datetime_profile = build_datetime_profile(series)
+        elif data_type == ColumnType.LIST:
+            list_profile = build_list_profile(series)
+        if is_binary_dtype(series.dtype):
+            binary_profile = build_binary_profile(series)
 
-def _apply_explicit_type(
-    column_name: ColumnName, explicit_types: list[ExplicitType], inferred: ColumnType
-) -> ColumnType:
-    for explicit in explicit_types:
-        if explicit.column_name == column_name:
-            return explicit.data_type
-    return inferred
+    if data_type == ColumnType.STRUCT or include_details and not detail_supported:
+        value_samples = collect_sample_values(series)
+
+    return ColumnProfile(
+        column_name=column_name,
+        data_type=data_type,
+        non_null_count=NonNullCount(non_null_count),
+        null_count=NullCount(null_count),
+        null_rate=NullRate(null_rate),
+        unique_count=UniqueCount(unique_count),
+        zero_count=ZeroCount(zero_count),
+        numeric_profile=numeric_profile,
+        categorical_profile=categorical_profile,
+        text_profile=text_profile,
+        datetime_profile=datetime_profile,
+        list_profile=list_profile,
+        binary_profile=binary_profile,
+        value_samples=value_samples,
+    )
 
 
-def _unique_count(series: pl.Series) -> int:
-    # Struct/List types with Null fields may cause PanicException (inherits BaseException)
-    if isinstance(series.dtype, (pl.Struct, pl.List)):
-        raw_values = series.to_list()
-        has_null = any(v is None for v in raw_values)
-        non_null_reprs = {repr(v) for v in raw_values if v is not None}
-        return len(non_null_reprs) + (1 if has_null else 0)
-    try:
-        return series.n_unique()
-    except Exception:
-        raw_values = series.to_list()
-        has_null = any(v is None for v in raw_values)
-        non_null_reprs = {repr(v) for v in raw_values if v is not None}
-        return len(non_null_reprs) + (1 if has_null else 0)
+def _count_zeros(values: pl.Series) -> int:
+    # Nulls compare as null and are not summed.
+    record_pass(PassKind.COPY)
+    is_zero = values.eq(0)
+    record_pass(PassKind.SCAN)
+    return int(is_zero.sum())
 
 
 def profile_columns(
@@ -60,81 +141,39 @@ def profile_columns(
     *,
     target_columns: list[str] | None,
     explicit_types: list[ExplicitType] | None,
+    recorder: DiagnosticsRecorder | None = None,
+    tracker: ProgressTracker | None = None,
+    facts: FrameFacts | None = None,
 ) -> list[ColumnProfile]:
-    explicit_list = explicit_types or []
+    frame_facts = facts or FrameFacts(frame)
+    explicit_by_name = _explicit_type_map(explicit_types)
     target_set = {ColumnName(name) for name in target_columns or []}
     profiles: list[ColumnProfile] = []
     row_count = frame.height
+    progress = tracker or ProgressTracker()
+    total = frame.width
 
-    for name in frame.columns:
-        series = frame.get_column(name)
-        column_name = ColumnName(name)
-        inferred = infer_column_type(series)
-        data_type = _apply_explicit_type(column_name, explicit_list, inferred)
-
-        null_count = series.null_count()
-        non_null_count = row_count - null_count
-        null_rate = null_count / row_count if row_count else 0.0
-        unique_count = _unique_count(series)
-        zero_count = 0
-        numeric_input = series
-        numeric_is_integer = False
-        if data_type == ColumnType.NUMERIC:
-            numeric_input, numeric_is_integer = normalize_numeric_series(series)
-            zero_count = int(numeric_input.drop_nulls().eq(0).sum())
-        elif is_numeric_dtype(series.dtype):
-            zero_count = int(series.drop_nulls().eq(0).sum())
-
-        include_details = not target_set or column_name in target_set
-        detail_supported = not needs_basic_statistics_only(series.dtype)
-
-        numeric_profile = None
-        categorical_profile = None
-        text_profile = None
-        datetime_profile = None
-        list_profile = None
-        value_samples: list[str] = []
-
-        if include_details and detail_supported:
-            if data_type == ColumnType.NUMERIC:
-                numeric_profile = build_numeric_profile(
-                    numeric_input.drop_nulls().cast(pl.Float64),
-                    is_integer=numeric_is_integer,
-                )
-            elif data_type in (ColumnType.CATEGORICAL, ColumnType.BOOLEAN):
-                category_series = series.drop_nulls().cast(pl.Utf8)
-                if data_type == ColumnType.BOOLEAN:
-                    category_series = category_series.str.to_titlecase()
-                categorical_profile = build_categorical_profile(
-                    category_series, unique_count
-                )
-            elif data_type == ColumnType.TEXT:
-                text_profile = build_text_profile(series.drop_nulls().cast(pl.Utf8))
-            elif data_type == ColumnType.DATETIME:
-                datetime_profile = build_datetime_profile(series.drop_nulls())
-            elif data_type == ColumnType.LIST:
-                list_profile = build_list_profile(series)
-
-        if data_type == ColumnType.STRUCT or include_details and not detail_supported:
-            value_samples = collect_sample_values(series)
-
-        profiles.append(
-            ColumnProfile(
-                column_name=column_name,
-                data_type=data_type,
-                non_null_count=NonNullCount(non_null_count),
-                null_count=NullCount(null_count),
-                null_rate=NullRate(null_rate),
-                unique_count=UniqueCount(unique_count),
-                zero_count=ZeroCount(zero_count),
-                numeric_profile=numeric_profile,
-                categorical_profile=categorical_profile,
-                text_profile=text_profile,
-                datetime_profile=datetime_profile,
-                list_profile=list_profile,
-                value_samples=value_samples,
+    for index, name in enumerate(frame.columns):
+        progress.checkpoint()
+        column_start = time.perf_counter()
+        column_facts = frame_facts.column(name)
+        with scanning_columns(name):
+            profile = _profile_column(
+                column_facts,
+                row_count=row_count,
+                explicit_types=explicit_by_name,
+                include_details=not target_set or ColumnName(name) in target_set,
             )
-        )
+        profiles.append(profile)
+        if recorder is not None:
+            recorder.record_column(
+                profile.column_name,
+                dtype=str(column_facts.series.dtype),
+                data_type=profile.data_type,
+                unique_count=profile.unique_count,
+                elapsed_seconds=time.perf_counter() - column_start,
+            )
+        progress.advance(index + 1, total)
 
     return profiles
 
@@ -145,6 +184,10 @@ def compare_column_profiles(
     *,
     target_columns: list[str] | None = None,
     explicit_types: list[ExplicitType] | None = None,
+    recorder: DiagnosticsRecorder | None = None,
+    tracker: ProgressTracker | None = None,
+    left_facts: FrameFacts | None = None,
+    right_facts: FrameFacts | None = None,
 ) -> tuple[list[ColumnProfile], list[ColumnProfile]]:
     target_set = set(target_columns) if target_columns else None
     left_column_names = [
@@ -153,11 +196,13 @@ def compare_column_profiles(
     right_column_names = [
         name for name in right.columns if target_set is None or name in target_set
     ]
+    left_name_set = set(left_column_names)
+    right_name_set = set(right_column_names)
     left_only_columns = [
-        name for name in left_column_names if name not in right_column_names
+        name for name in left_column_names if name not in right_name_set
     ]
     right_only_columns = [
-        name for name in right_column_names if name not in left_column_names
+        name for name in right_column_names if name not in left_name_set
     ]
 
     left_profiles = (
@@ -165,6 +210,9 @@ def compare_column_profiles(
             left.select(left_only_columns),
             target_columns=None,
             explicit_types=explicit_types,
+            recorder=recorder,
+            tracker=tracker,
+            facts=left_facts,
         )
         if left_only_columns
         else []
@@ -174,6 +222,9 @@ def compare_column_profiles(
             right.select(right_only_columns),
             target_columns=None,
             explicit_types=explicit_types,
+            recorder=recorder,
+            tracker=tracker,
+            facts=right_facts,
         )
         if right_only_columns
         else []
@@ -187,6 +238,10 @@ def compare_common_column_profiles(
     *,
     target_columns: list[str] | None = None,
     explicit_types: list[ExplicitType] | None = None,
+    recorder: DiagnosticsRecorder | None = None,
+    tracker: ProgressTracker | None = None,
+    left_facts: FrameFacts | None = None,
+    right_facts: FrameFacts | None = None,
 ) -> list[CompareColumnProfile]:
     target_set = set(target_columns) if target_columns else None
     left_column_names = [
@@ -195,7 +250,8 @@ def compare_common_column_profiles(
     right_column_names = [
         name for name in right.columns if target_set is None or name in target_set
     ]
-    common_columns = [name for name in left_column_names if name in right_column_names]
+    right_name_set = set(right_column_names)
+    common_columns = [name for name in left_column_names if name in right_name_set]
     if not common_columns:
         return []
 
@@ -203,27 +259,36 @@ def compare_common_column_profiles(
         left.select(common_columns),
         target_columns=None,
         explicit_types=explicit_types,
+        recorder=recorder,
+        tracker=tracker,
+        facts=left_facts,
     )
     right_profiles = profile_columns(
         right.select(common_columns),
         target_columns=None,
         explicit_types=explicit_types,
+        recorder=recorder,
+        tracker=tracker,
+        facts=right_facts,
     )
     left_by_name = {profile.column_name: profile for profile in left_profiles}
     right_by_name = {profile.column_name: profile for profile in right_profiles}
 
+    progress = tracker or ProgressTracker()
     compare_profiles: list[CompareColumnProfile] = []
-    for column_name in common_columns:
+    for index, column_name in enumerate(common_columns):
+        progress.checkpoint()
         left_profile = left_by_name.get(ColumnName(column_name))
         right_profile = right_by_name.get(ColumnName(column_name))
         if left_profile is None or right_profile is None:
             continue
-        histograms = build_compare_histograms_for_column(
-            left[column_name],
-            right[column_name],
-            left_profile.data_type,
-            right_profile.data_type,
-        )
+        with scanning_columns(column_name):
+            histograms = build_compare_histograms_for_column(
+                left[column_name],
+                right[column_name],
+                left_profile.data_type,
+                right_profile.data_type,
+            )
         compare_profiles.append(
             CompareColumnProfile(
                 column_name=ColumnName(column_name),
@@ -232,4 +297,5 @@ def compare_common_column_profiles(
                 histograms=histograms,
             )
         )
+        progress.advance(index + 1, len(common_columns))
     return compare_profiles
@@ -10,11 +10,14 @@ import polars as pl
 from mitoric.models.aggregation import CompareHistogram
 from mitoric.models.base import ColumnType
 from mitoric.profiling.histograms.builder import (
+    float_bin_expression,
     format_datetime_bin,
+    integer_bin_expression,
     normalize_datetime_values,
 )
 from mitoric.profiling.histograms.config import HISTOGRAM_BINS
 from mitoric.profiling.utils.constants import TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
 from mitoric.profiling.utils.type_utils import (
     normalize_numeric_series,
 )
@@ -27,7 +30,9 @@ def build_compare_numeric_histograms(
     *,
     is_integer: bool,
 ) -> list[CompareHistogram]:
+    record_pass(PassKind.COPY)
     left_series = left_values.drop_nulls()
+    record_pass(PassKind.COPY)
     right_series = right_values.drop_nulls()
     if left_series.len() == 0 and right_series.len() == 0:
         return [
@@ -46,8 +51,21 @@ def build_compare_numeric_histograms(
     right_series = (
         right_series.rename("value") if right_series.name != "value" else right_series
     )
-    all_series = pl.concat([left_series, right_series], how="vertical")
-    unique_series = all_series.unique().sort()
+    record_pass(PassKind.HASH_AGGREGATION)
+    left_unique = left_series.unique()
+    record_pass(PassKind.HASH_AGGREGATION)
+    right_unique = right_series.unique()
+    # Sides may differ in width (e.g. Int8 vs Int32); only the distinct values
+    # are brought to a common dtype.
+    unique_series = (
+        pl.concat(
+            [left_unique.to_frame(), right_unique.to_frame()],
+            how="vertical_relaxed",
+        )
+        .to_series()
+        .unique()
+        .sort()
+    )
     if unique_series.len() <= TOP_VALUES_LIMIT:
         left_counts_map = _value_counts_map(left_series)
         right_counts_map = _value_counts_map(right_series)
@@ -67,12 +85,14 @@ def build_compare_numeric_histograms(
             )
         ]
 
-    min_value = _required_float(all_series.min())
-    max_value = _required_float(all_series.max())
+    raw_min = unique_series.min()
+    raw_max = unique_series.max()
+    min_value = _required_float(raw_min)
+    max_value = _required_float(raw_max)
     span = max_value - min_value
     histograms: list[CompareHistogram] = []
     for bin_count in HISTOGRAM_BINS:
-        if span == 0:
+        if raw_min == raw_max:
             label = _format_number_label(min_value, is_integer)
             histograms.append(
                 CompareHistogram(
@@ -84,18 +104,23 @@ def build_compare_numeric_histograms(
             )
             continue
         if is_integer:
-            integer_min = int(min_value)
-            integer_max = int(max_value)
+            integer_min = _required_integer(raw_min)
+            integer_max = _required_integer(raw_max)
             range_size = integer_max - integer_min + 1
             width = max(1, math.ceil(range_size / bin_count))
             edges = [integer_min + width * i for i in range(bin_count + 1)]
-            bin_expr = (
-                ((pl.col("value").cast(pl.Int64) - integer_min) // width)
-                .clip(lower_bound=0, upper_bound=bin_count - 1)
-                .alias("bin")
+            left_counts_map = _bin_counts_map(
+                left_series,
+                integer_bin_expression(
+                    left_series.dtype, integer_min, width, bin_count
+                ),
+            )
+            right_counts_map = _bin_counts_map(
+                right_series,
+                integer_bin_expression(
+                    right_series.dtype, integer_min, width, bin_count
+                ),
             )
-            left_counts_map = _bin_counts_map(left_series, bin_expr)
-            right_counts_map = _bin_counts_map(right_series, bin_expr)
             left_counts = [left_counts_map.get(i, 0) for i in range(bin_count)]
             right_counts = [right_counts_map.get(i, 0) for i in range(bin_count)]
             labels = []
@@ -115,12 +140,7 @@ def build_compare_numeric_histograms(
 
         width = span / bin_count
         edges = [min_value + width * i for i in range(bin_count + 1)]
-        bin_expr = (
-            pl.when(pl.col("value") == max_value)
-            .then(bin_count - 1)
-            .otherwise(((pl.col("value") - min_value) / width).cast(pl.Int64))
-            .alias("bin")
-        )
+        bin_expr = float_bin_expression(min_value, width, bin_count)
         left_counts_map = _bin_counts_map(left_series, bin_expr)
         right_counts_map = _bin_counts_map(right_series, bin_expr)
         left_counts = [left_counts_map.get(i, 0) for i in range(bin_count)]
@@ -143,7 +163,9 @@ def build_compare_numeric_histograms(
 def build_compare_categorical_histograms(
     left_values: pl.Series, right_values: pl.Series
 ) -> list[CompareHistogram]:
+    record_pass(PassKind.COPY)
     left_series = left_values.drop_nulls()
+    record_pass(PassKind.COPY)
     right_series = right_values.drop_nulls()
     if left_series.len() == 0 and right_series.len() == 0:
         return []
@@ -153,7 +175,9 @@ def build_compare_categorical_histograms(
     right_series = (
         right_series.rename("value") if right_series.name != "value" else right_series
     )
+    record_pass(PassKind.COPY)
     combined = pl.concat([left_series, right_series], how="vertical")
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = combined.value_counts().sort(["count", "value"], descending=[True, False])
     left_counts_map = _value_counts_map(left_series)
     right_counts_map = _value_counts_map(right_series)
@@ -192,18 +216,27 @@ def build_compare_categorical_histograms(
 def build_compare_text_length_histograms(
     left_values: pl.Series, right_values: pl.Series
 ) -> list[CompareHistogram]:
-    left_lengths = left_values.drop_nulls().str.len_chars().cast(pl.Float64)
-    right_lengths = right_values.drop_nulls().str.len_chars().cast(pl.Float64)
     return build_compare_numeric_histograms(
-        left_lengths, right_lengths, is_integer=True
+        _text_lengths(left_values), _text_lengths(right_values), is_integer=True
     )
 
 
+def _text_lengths(values: pl.Series) -> pl.Series:
+    record_pass(PassKind.COPY)
+    series = values.drop_nulls()
+    record_pass(PassKind.COPY)
+    lengths = series.str.len_chars()
+    record_pass(PassKind.COPY)
+    return lengths.cast(pl.Float64)
+
+
 def build_compare_datetime_histograms(
     left_values: pl.Series,
     right_values: pl.Series,
 ) -> list[CompareHistogram]:
+    record_pass(PassKind.COPY)
     left_series = left_values.drop_nulls()
+    record_pass(PassKind.COPY)
     right_series = right_values.drop_nulls()
     if left_series.len() == 0 and right_series.len() == 0:
         return []
@@ -222,7 +255,9 @@ def build_compare_datetime_histograms(
         if right_numeric.name != "value"
         else right_numeric
     )
+    record_pass(PassKind.COPY)
     all_values = pl.concat([left_numeric, right_numeric], how="vertical")
+    record_pass(PassKind.HASH_AGGREGATION)
     unique_series = all_values.unique().sort()
     if unique_series.len() <= TOP_VALUES_LIMIT:
         left_counts_map = _value_counts_map(left_numeric)
@@ -245,7 +280,9 @@ def build_compare_datetime_histograms(
             )
         ]
 
+    record_pass(PassKind.SCAN)
     min_value = _required_float(all_values.min())
+    record_pass(PassKind.SCAN)
     max_value = _required_float(all_values.max())
     span = max_value - min_value
     histograms: list[CompareHistogram] = []
@@ -314,33 +351,41 @@ def build_compare_histograms_for_column(
         right_numeric, right_is_integer = normalize_numeric_series(right_series)
         is_integer = left_is_integer and right_is_integer
         return build_compare_numeric_histograms(
-            left_numeric.drop_nulls().cast(pl.Float64),
-            right_numeric.drop_nulls().cast(pl.Float64),
-            is_integer=is_integer,
+            left_numeric, right_numeric, is_integer=is_integer
         )
     if left_type in (ColumnType.CATEGORICAL, ColumnType.BOOLEAN):
-        left_values = left_series.drop_nulls().cast(pl.Utf8)
-        right_values = right_series.drop_nulls().cast(pl.Utf8)
-        if left_type == ColumnType.BOOLEAN:
-            left_values = left_values.str.to_titlecase()
-            right_values = right_values.str.to_titlecase()
-        return build_compare_categorical_histograms(left_values, right_values)
-    if left_type == ColumnType.TEXT:
-        return build_compare_text_length_histograms(
-            left_series.drop_nulls().cast(pl.Utf8),
-            right_series.drop_nulls().cast(pl.Utf8),
+        is_boolean = left_type == ColumnType.BOOLEAN
+        return build_compare_categorical_histograms(
+            _category_labels(left_series, is_boolean=is_boolean),
+            _category_labels(right_series, is_boolean=is_boolean),
         )
+    # The histogram builders drop nulls themselves.
+    if left_type == ColumnType.TEXT:
+        record_pass(PassKind.COPY)
+        left_text = left_series.cast(pl.Utf8)
+        record_pass(PassKind.COPY)
+        right_text = right_series.cast(pl.Utf8)
+        return build_compare_text_length_histograms(left_text, right_text)
     if left_type == ColumnType.DATETIME:
-        return build_compare_datetime_histograms(
-            left_series.drop_nulls(),
-            right_series.drop_nulls(),
-        )
+        return build_compare_datetime_histograms(left_series, right_series)
     return []
 
 
+def _category_labels(series: pl.Series, *, is_boolean: bool) -> pl.Series:
+    record_pass(PassKind.COPY)
+    values = series.drop_nulls()
+    record_pass(PassKind.COPY)
+    labels = values.cast(pl.Utf8)
+    if is_boolean:
+        record_pass(PassKind.COPY)
+        labels = labels.str.to_titlecase()
+    return labels
+
+
 def _value_counts_map(series: pl.Series) -> dict[float | str, int]:
     if series.len() == 0:
         return {}
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts()
     return {row["value"]: int(row["count"]) for row in counts.iter_rows(named=True)}
 
@@ -348,6 +393,7 @@ def _value_counts_map(series: pl.Series) -> dict[float | str, int]:
 def _bin_counts_map(series: pl.Series, bin_expr: pl.Expr) -> dict[int, int]:
     if series.len() == 0:
         return {}
+    record_pass(PassKind.HASH_AGGREGATION)
     df = (
         pl.DataFrame({"value": series})
         .with_columns(bin_expr)
@@ -358,6 +404,12 @@ def _bin_counts_map(series: pl.Series, bin_expr: pl.Expr) -> dict[int, int]:
     return {int(row["bin"]): int(row["len"]) for row in df.iter_rows(named=True)}
 
 
+def _required_integer(value: object | None) -> int:
+    if isinstance(value, int):
+        return value
+    return int(_required_float(value))
+
+
 def _required_float(value: object | None) -> float:
     if value is None:
         raise ValueError("value is required")
@@ -25,45 +25,47 @@ from mitoric.models.base import (
     RowCount,
     RowCountDelta,
 )
-from mitoric.profiling.utils.type_utils import classify_column_type, infer_column_type
+from mitoric.profiling.facts import FrameFacts
+from mitoric.profiling.utils.hashing import count_distinct_rows
+from mitoric.profiling.utils.scan_accounting import (
+    PassKind,
+    record_pass,
+    scanning_columns,
+)
 
 
-def _get_sortable_columns(frame: pl.DataFrame) -> list[str]:
-    """Return column names that can be used for uniqueness checks (sortable types)."""
-    sortable_columns = []
-    for name in frame.columns:
-        dtype = frame.get_column(name).dtype
-        # List and Struct types cannot be sorted in Polars
-        if not isinstance(dtype, (pl.List, pl.Struct)):
-            sortable_columns.append(name)
-    return sortable_columns
+def _count_duplicate_rows(frame: pl.DataFrame, *, approximate: bool) -> int:
+    with scanning_columns(*frame.columns):
+        record_pass(PassKind.SCAN)
+        record_pass(PassKind.HASH_AGGREGATION)
+    return frame.height - count_distinct_rows(frame, approximate=approximate)
 
 
-def summarize_dataset(frame: pl.DataFrame, dataset_id: str) -> DatasetSummary:
+def summarize_dataset(
+    frame: pl.DataFrame,
+    dataset_id: str,
+    *,
+    approximate_duplicates: bool = False,
+    facts: FrameFacts | None = None,
+) -> DatasetSummary:
+    frame_facts = facts or FrameFacts(frame)
     row_count = frame.height
     column_count = frame.width
     total_cells = row_count * column_count
 
-    null_counts = frame.null_count().row(0) if column_count > 0 else []
-    missing_cells = sum(int(value) for value in null_counts)
+    missing_cells = sum(frame_facts.column(name).null_count for name in frame.columns)
     missing_rate = missing_cells / total_cells if total_cells else 0.0
 
-    # Exclude unsortable columns (List, Struct) for duplicate detection
-    sortable_cols = _get_sortable_columns(frame)
-    if row_count and sortable_cols:
-        subset_frame = frame.select(sortable_cols)
-        duplicate_rows = row_count - subset_frame.unique(maintain_order=True).height
-    elif row_count:
-        # All columns are unsortable (List/Struct only), use repr-based comparison
-        unique_rows = len({tuple(repr(v) for v in row) for row in frame.iter_rows()})
-        duplicate_rows = row_count - unique_rows
-    else:
-        duplicate_rows = 0
+    duplicate_rows = (
+        _count_duplicate_rows(frame, approximate=approximate_duplicates)
+        if row_count and column_count
+        else 0
+    )
 
     type_counter: Counter[ColumnType] = Counter()
     for name in frame.columns:
-        series = frame.get_column(name)
-        type_counter[classify_column_type(series)] += 1
+        with scanning_columns(name):
+            type_counter[frame_facts.column(name).column_type] += 1
 
     type_counts = TypeCounts(
         numeric=ColumnCount(type_counter.get(ColumnType.NUMERIC, 0)),
@@ -91,9 +93,24 @@ def summarize_comparison(
     *,
     left_id: str,
     right_id: str,
+    approximate_duplicates: bool = False,
+    left_facts: FrameFacts | None = None,
+    right_facts: FrameFacts | None = None,
 ) -> ComparisonSummary:
-    left_summary = summarize_dataset(left, dataset_id=left_id)
-    right_summary = summarize_dataset(right, dataset_id=right_id)
+    left_facts = left_facts or FrameFacts(left)
+    right_facts = right_facts or FrameFacts(right)
+    left_summary = summarize_dataset(
+        left,
+        dataset_id=left_id,
+        approximate_duplicates=approximate_duplicates,
+        facts=left_facts,
+    )
+    right_summary = summarize_dataset(
+        right,
+        dataset_id=right_id,
+        approximate_duplicates=approximate_duplicates,
+        facts=right_facts,
+    )
 
     left_columns = set(left.columns)
     right_columns = set(right.columns)
@@ -103,8 +120,9 @@ def summarize_comparison(
 
     mismatches: list[TypeMismatch] = []
     for name in matched:
-        left_type = infer_column_type(left.get_column(name))
-        right_type = infer_column_type(right.get_column(name))
+        with scanning_columns(name):
+            left_type = left_facts.column(name).column_type
+            right_type = right_facts.column(name).column_type
         if left_type != right_type:
             mismatches.append(
                 TypeMismatch(
@@ -0,0 +1,91 @@
+"""Per-column facts shared by the profiling stages of a report run.
+
+Summaries, column profiles and associations all need the inferred type, null
+and distinct counts and the numeric view of the same columns. A
+:class:`FrameFacts` built once per frame computes each of them on first use and
+hands the cached value to every later stage.
+"""
+
+from __future__ import annotations
+
+from functools import cached_property
+
+import polars as pl
+
+from mitoric.models.base import ColumnType
+from mitoric.profiling.utils.hashing import count_distinct_rows
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
+from mitoric.profiling.utils.type_utils import (
+    classify_column_type,
+    needs_basic_statistics_only,
+    normalize_numeric_series,
+)
+
+
+def _hashed_unique_count(series: pl.Series) -> int:
+    non_null = series.drop_nulls()
+    has_null = non_null.len() < series.len()
+    return count_distinct_rows(non_null.to_frame()) + (1 if has_null else 0)
+
+
+def _repr_unique_count(series: pl.Series) -> int:
+    raw_values = series.to_list()
+    has_null = any(v is None for v in raw_values)
+    non_null_reprs = {repr(v) for v in raw_values if v is not None}
+    return len(non_null_reprs) + (1 if has_null else 0)
+
+
+class ColumnFacts:
+    def __init__(self, series: pl.Series) -> None:
+        self.series = series
+
+    @cached_property
+    def column_type(self) -> ColumnType:
+        return classify_column_type(self.series)
+
+    @cached_property
+    def basic_statistics_only(self) -> bool:
+        return needs_basic_statistics_only(self.series.dtype)
+
+    @cached_property
+    def null_count(self) -> int:
+        return self.series.null_count()
+
+    @cached_property
+    def unique_count(self) -> int:
+        record_pass(PassKind.HASH_AGGREGATION)
+        # Struct/List types with Null fields may cause PanicException (inherits
+        # BaseException) in n_unique, so nested values are counted by hashing.
+        if isinstance(self.series.dtype, (pl.Struct, pl.List)):
+            return _hashed_unique_count(self.series)
+        try:
+            return self.series.n_unique()
+        except Exception:
+            # Object columns hold Python values that Polars cannot hash by value.
+            return _repr_unique_count(self.series)
+
+    @cached_property
+    def normalized_numeric(self) -> tuple[pl.Series, bool]:
+        """``normalize_numeric_series`` output: the numeric view and its integer flag."""
+        return normalize_numeric_series(self.series)
+
+
+class FrameFacts:
+    """Lazily populated :class:`ColumnFacts` for every column of one frame.
+
+    Facts are keyed by column name, so they stay valid for column subsets of
+    the frame they were built from (``frame.select(...)``) but not for row
+    subsets.
+    """
+
+    def __init__(self, frame: pl.DataFrame) -> None:
+        self.frame = frame
+        self._columns: dict[str, ColumnFacts] | None = None
+
+    def column(self, name: str) -> ColumnFacts:
+        if self._columns is None:
+            # One pass over the frame instead of a name lookup per column.
+            self._columns = {
+                series.name: ColumnFacts(series) for series in self.frame.get_columns()
+            }
+        return self._columns[name]
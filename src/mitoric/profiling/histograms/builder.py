@@ -11,10 +11,19 @@ import polars as pl
 from mitoric.models.aggregation import Histogram, HistogramBin, LabeledHistogram
 from mitoric.profiling.histograms.config import HISTOGRAM_BINS
 from mitoric.profiling.utils.constants import TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
+
+_WIDER_SIGNED_DTYPES: dict[pl.DataType, pl.DataType] = {
+    pl.Int8(): pl.Int16(),
+    pl.Int16(): pl.Int32(),
+    pl.UInt8(): pl.Int16(),
+    pl.UInt16(): pl.Int32(),
+}
 
 
 def build_numeric_histograms(values: pl.Series, *, is_integer: bool) -> list[Histogram]:
     histograms: list[Histogram] = []
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     if series.len() == 0:
         for bin_count in HISTOGRAM_BINS:
@@ -23,6 +32,7 @@ def build_numeric_histograms(values: pl.Series, *, is_integer: bool) -> list[His
 
     if series.name != "value":
         series = series.rename("value")
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts().sort("value")
     unique_count = counts.height
     if unique_count <= TOP_VALUES_LIMIT:
@@ -36,11 +46,15 @@ def build_numeric_histograms(values: pl.Series, *, is_integer: bool) -> list[His
         ]
         return [Histogram(bin_count=unique_count, bins=bins)]
 
-    min_value = _require_float_value(series.min())
-    max_value = _require_float_value(series.max())
+    record_pass(PassKind.SCAN)
+    raw_min = series.min()
+    record_pass(PassKind.SCAN)
+    raw_max = series.max()
+    min_value = _require_float_value(raw_min)
+    max_value = _require_float_value(raw_max)
     span = max_value - min_value
     for bin_count in HISTOGRAM_BINS:
-        if span == 0:
+        if raw_min == raw_max:
             bins = [
                 HistogramBin(
                     lower=min_value,
@@ -51,27 +65,16 @@ def build_numeric_histograms(values: pl.Series, *, is_integer: bool) -> list[His
             histograms.append(Histogram(bin_count=bin_count, bins=bins))
             continue
         if is_integer:
-            integer_min = int(min_value)
-            integer_max = int(max_value)
+            integer_min = _require_integer_value(raw_min)
+            integer_max = _require_integer_value(raw_max)
             range_size = integer_max - integer_min + 1
             width = max(1, math.ceil(range_size / bin_count))
             edges = [integer_min + width * i for i in range(bin_count + 1)]
-            df = pl.DataFrame({"value": series})
-            counts_df = (
-                df.with_columns(
-                    ((pl.col("value").cast(pl.Int64) - integer_min) // width)
-                    .clip(lower_bound=0, upper_bound=bin_count - 1)
-                    .alias("bin")
-                )
-                .group_by("bin")
-                .len()
-                .sort("bin")
+            counts = _bin_counts(
+                series,
+                integer_bin_expression(series.dtype, integer_min, width, bin_count),
+                bin_count,
             )
-            counts_by_bin = {
-                int(row["bin"]): int(row["len"])
-                for row in counts_df.iter_rows(named=True)
-            }
-            counts = [counts_by_bin.get(index, 0) for index in range(bin_count)]
             bins = [
                 HistogramBin(
                     lower=float(edges[i]),
@@ -84,22 +87,11 @@ def build_numeric_histograms(values: pl.Series, *, is_integer: bool) -> list[His
             continue
         width = span / bin_count
         edges = [min_value + width * i for i in range(bin_count + 1)]
-        df = pl.DataFrame({"value": series})
-        counts_df = (
-            df.with_columns(
-                pl.when(pl.col("value") == max_value)
-                .then(bin_count - 1)
-                .otherwise(((pl.col("value") - min_value) / width).cast(pl.Int64))
-                .alias("bin")
-            )
-            .group_by("bin")
-            .len()
-            .sort("bin")
+        counts = _bin_counts(
+            series,
+            float_bin_expression(min_value, width, bin_count),
+            bin_count,
         )
-        counts_by_bin = {
-            int(row["bin"]): int(row["len"]) for row in counts_df.iter_rows(named=True)
-        }
-        counts = [counts_by_bin.get(index, 0) for index in range(bin_count)]
         bins = [
             HistogramBin(lower=edges[i], upper=edges[i + 1], count=counts[i])
             for i in range(bin_count)
@@ -108,14 +100,63 @@ def build_numeric_histograms(values: pl.Series, *, is_integer: bool) -> list[His
     return histograms
 
 
+def integer_bin_expression(
+    dtype: pl.DataType,
+    integer_min: int,
+    width: int,
+    bin_count: int,
+    *,
+    column: str = "value",
+) -> pl.Expr:
+    """Bin index of ``column`` for integer bins, computed on the native dtype.
+
+    Offsets from a non-negative minimum always fit unsigned integers; other
+    inputs are widened only as far as ``value - integer_min`` needs.
+    """
+    value = pl.col(column)
+    if not (dtype.is_unsigned_integer() and integer_min >= 0):
+        value = value.cast(_WIDER_SIGNED_DTYPES.get(dtype, pl.Int64))
+    return (
+        ((value - integer_min) // width)
+        .clip(lower_bound=0, upper_bound=bin_count - 1)
+        .cast(pl.UInt16)
+        .alias("bin")
+    )
+
+
+def float_bin_expression(
+    min_value: float, width: float, bin_count: int, *, column: str = "value"
+) -> pl.Expr:
+    """Bin index of ``column`` for equal-width bins, computed on the native dtype."""
+    # The maximum (and values Float32 rounding pushes past the last edge) land
+    # in the last bin.
+    return (
+        ((pl.col(column) - min_value) / width)
+        .clip(lower_bound=0, upper_bound=bin_count - 1)
+        .cast(pl.UInt16)
+        .alias("bin")
+    )
+
+
+def _bin_counts(series: pl.Series, bin_expr: pl.Expr, bin_count: int) -> list[int]:
+    record_pass(PassKind.HASH_AGGREGATION)
+    counts_df = pl.DataFrame({"value": series}).select(bin_expr).group_by("bin").len()
+    counts_by_bin = {
+        int(row["bin"]): int(row["len"]) for row in counts_df.iter_rows(named=True)
+    }
+    return [counts_by_bin.get(index, 0) for index in range(bin_count)]
+
+
 def build_categorical_histograms(
     values: pl.Series, unique_count: int
 ) -> list[LabeledHistogram]:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     if series.len() == 0:
         return []
     if series.name != "value":
         series = series.rename("value")
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts().sort(["count", "value"], descending=[True, False])
     if unique_count <= TOP_VALUES_LIMIT:
         labels = [str(row["value"]) for row in counts.iter_rows(named=True)]
@@ -135,6 +176,7 @@ def build_categorical_histograms(
 def normalize_datetime_values(
     values: pl.Series,
 ) -> tuple[pl.Series, pl.Series, bool]:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     if series.len() == 0:
         return (
@@ -144,25 +186,33 @@ def normalize_datetime_values(
         )
 
     is_time = series.dtype == pl.Time
+    # string labels plus numeric positions
     if is_time:
+        record_pass(PassKind.COPY)
         normalized = series.cast(pl.Utf8)
+        record_pass(PassKind.COPY)
         numeric = series.cast(pl.Int64) / 1_000_000_000
         if normalized.name != "value":
             normalized = normalized.rename("value")
-        return normalized, numeric.cast(pl.Float64).rename("numeric"), True
+        return normalized, numeric.rename("numeric"), True
 
     if series.dtype == pl.Duration:
+        record_pass(PassKind.COPY)
         normalized = series.cast(pl.Utf8)
+        record_pass(PassKind.COPY)
         numeric = series.cast(pl.Int64).cast(pl.Float64)
         if normalized.name != "value":
             normalized = normalized.rename("value")
         return normalized, numeric.rename("numeric"), False
 
+    record_pass(PassKind.COPY)
     if series.dtype == pl.Datetime:
         date_series = series.dt.date()
     else:
         date_series = series.cast(pl.Date)
+    record_pass(PassKind.COPY)
     normalized = date_series.cast(pl.Utf8)
+    record_pass(PassKind.COPY)
     numeric = date_series.cast(pl.Int64).cast(pl.Float64)
     if normalized.name != "value":
         normalized = normalized.rename("value")
@@ -221,6 +271,13 @@ def _require_float_value(value: object | None) -> float:
     raise TypeError("value must be numeric")
 
 
+def _require_integer_value(value: object | None) -> int:
+    # Large Int64/UInt64 values are kept exact instead of going through float.
+    if isinstance(value, int):
+        return value
+    return int(_require_float_value(value))
+
+
 def _format_time_label(value: float) -> str:
     time_value = (dt.datetime(1970, 1, 1) + dt.timedelta(seconds=value)).time()
     timespec = "microseconds" if time_value.microsecond else "seconds"
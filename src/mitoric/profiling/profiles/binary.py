@@ -0,0 +1,48 @@
+"""Binary column profiling."""
+
+from __future__ import annotations
+
+import polars as pl
+
+from mitoric.models.aggregation import BinaryProfile, CategoryCount
+from mitoric.profiling.utils.constants import BINARY_PREFIX_BYTES, TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
+
+_HAS_BINARY_HEAD = hasattr(pl.col("value").bin, "head")
+
+
+def build_binary_profile(
+    values: pl.Series, *, prefix_bytes: int = BINARY_PREFIX_BYTES
+) -> BinaryProfile:
+    """Count the most frequent leading bytes, which usually identify the format.
+
+    Byte lengths are profiled as numeric values like any other Binary column;
+    this adds the magic-byte view. Only the first ``prefix_bytes`` of each value
+    are hex-encoded, so large blobs are never copied in full (Polars releases
+    before 1.35 lack ``bin.head``; there values are encoded, then truncated).
+    """
+    record_pass(PassKind.COPY)
+    values = values.drop_nulls()
+    if _HAS_BINARY_HEAD:
+        record_pass(PassKind.COPY)
+        heads = values.bin.head(prefix_bytes)
+        record_pass(PassKind.COPY)
+        prefixes = heads.bin.encode("hex")
+    else:
+        record_pass(PassKind.COPY)
+        encoded = values.bin.encode("hex")
+        record_pass(PassKind.COPY)
+        prefixes = encoded.str.slice(0, 2 * prefix_bytes)
+    record_pass(PassKind.HASH_AGGREGATION)
+    counts = (
+        prefixes.rename("value")
+        .value_counts()
+        .sort(["count", "value"], descending=[True, False])
+    )
+    return BinaryProfile(
+        prefix_bytes=prefix_bytes,
+        top_prefixes=[
+            CategoryCount(category=str(row["value"]), count=int(row["count"]))
+            for row in counts.head(TOP_VALUES_LIMIT).iter_rows(named=True)
+        ],
+    )
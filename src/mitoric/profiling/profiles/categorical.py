@@ -8,15 +8,18 @@ from mitoric.models.aggregation import CategoricalProfile, CategoryCount
 from mitoric.models.base import SuppressedCount
 from mitoric.profiling.histograms.builder import build_categorical_histograms
 from mitoric.profiling.utils.constants import TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
 from mitoric.profiling.utils.type_utils import TEXT_CARDINALITY_THRESHOLD
 
 
 def build_categorical_profile(
     values: pl.Series, unique_count: int
 ) -> CategoricalProfile:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     if series.name != "value":
         series = series.rename("value")
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts().sort(["count", "value"], descending=[True, False])
     top_categories = [
         CategoryCount(category=str(row["value"]), count=int(row["count"]))
@@ -10,11 +10,13 @@ from mitoric.profiling.histograms.builder import (
     normalize_datetime_values,
 )
 from mitoric.profiling.utils.constants import TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
 
 
 def build_datetime_profile(
     values: pl.Series,
 ) -> DatetimeProfile:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     if series.len() == 0:
         return DatetimeProfile(
@@ -24,13 +26,19 @@ def build_datetime_profile(
             top_values=[],
         )
     normalized, numeric_values, is_time = normalize_datetime_values(series)
+    record_pass(PassKind.COPY)
     normalized_sorted = normalized.sort()
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = normalized.value_counts().sort(
         ["count", "value"], descending=[True, False]
     )
+    record_pass(PassKind.SCAN)
+    min_datetime = str(normalized_sorted.min())
+    record_pass(PassKind.SCAN)
+    max_datetime = str(normalized_sorted.max())
     return DatetimeProfile(
-        min_datetime=str(normalized_sorted.min()),
-        max_datetime=str(normalized_sorted.max()),
+        min_datetime=min_datetime,
+        max_datetime=max_datetime,
         histograms=build_datetime_histograms(numeric_values, is_time=is_time),
         top_values=_top_datetime_values(counts),
     )
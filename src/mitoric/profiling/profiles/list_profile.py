@@ -2,38 +2,113 @@
 
 from __future__ import annotations
 
+import math
+
 import polars as pl
 
-from mitoric.models.aggregation import Histogram, ListLengthStats, ListProfile
+from mitoric.models.aggregation import (
+    CategoricalProfile,
+    Histogram,
+    ListLengthStats,
+    ListProfile,
+    NumericProfile,
+)
+from mitoric.models.base import ColumnType
 from mitoric.profiling.histograms.builder import build_numeric_histograms
+from mitoric.profiling.profiles.categorical import build_categorical_profile
+from mitoric.profiling.profiles.numeric import build_numeric_profile
+from mitoric.profiling.utils.constants import ELEMENT_PROFILE_LIMIT
 from mitoric.profiling.utils.sampling import collect_sample_values
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
+from mitoric.profiling.utils.type_utils import (
+    classify_column_type,
+    needs_basic_statistics_only,
+    normalize_numeric_series,
+)
 
 
 def build_list_profile(values: pl.Series) -> ListProfile:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
-    list_values = (
-        series.arr.to_list() if str(series.dtype).startswith("Array") else series
-    )
-    lengths = list_values.list.len()
+    dtype = series.dtype
+    is_array = isinstance(dtype, pl.Array)
+    record_pass(PassKind.COPY)
+    if isinstance(dtype, pl.Array):
+        # Every Array value has the dtype's width (``arr.len`` needs Polars 1.25+).
+        lengths = pl.repeat(dtype.size, series.len(), dtype=pl.UInt32, eager=True)
+    else:
+        lengths = series.list.len()
 
     length_stats = _build_length_stats(lengths)
     length_histograms = _build_length_histograms(lengths)
-    value_samples = collect_sample_values(list_values)
+    value_samples = collect_sample_values(series)
+
+    element_count = int(lengths.sum()) if not lengths.is_empty() else 0
+    elements = _sample_elements(series, is_array=is_array, element_count=element_count)
+    numeric_profile, categorical_profile = _build_element_profiles(elements)
 
     return ListProfile(
         length_stats=length_stats,
         length_histograms=length_histograms,
         value_samples=value_samples,
+        element_count=element_count,
+        profiled_element_count=elements.len(),
+        element_numeric_profile=numeric_profile,
+        element_categorical_profile=categorical_profile,
     )
 
 
+def _sample_elements(
+    series: pl.Series, *, is_array: bool, element_count: int
+) -> pl.Series:
+    """Flatten the lists into one element series of at most ELEMENT_PROFILE_LIMIT.
+
+    Whole lists are thinned out before flattening so that very large columns are
+    never exploded in full; a few very long lists are thinned after it.
+    """
+    if element_count > ELEMENT_PROFILE_LIMIT:
+        record_pass(PassKind.COPY)
+        series = series.gather_every(math.ceil(element_count / ELEMENT_PROFILE_LIMIT))
+    record_pass(PassKind.COPY)
+    elements = series.arr.explode() if is_array else series.list.explode()
+    record_pass(PassKind.COPY)
+    elements = elements.drop_nulls()
+    if elements.len() > ELEMENT_PROFILE_LIMIT:
+        record_pass(PassKind.COPY)
+        elements = elements.gather_every(
+            math.ceil(elements.len() / ELEMENT_PROFILE_LIMIT)
+        )
+    return elements
+
+
+def _build_element_profiles(
+    elements: pl.Series,
+) -> tuple[NumericProfile | None, CategoricalProfile | None]:
+    if elements.is_empty() or needs_basic_statistics_only(elements.dtype):
+        return None, None
+    element_type = classify_column_type(elements)
+    if element_type == ColumnType.NUMERIC:
+        numeric_values, is_integer = normalize_numeric_series(elements)
+        return build_numeric_profile(numeric_values, is_integer=is_integer), None
+    if element_type in (ColumnType.CATEGORICAL, ColumnType.TEXT, ColumnType.BOOLEAN):
+        record_pass(PassKind.COPY)
+        category_values = elements.cast(pl.Utf8)
+        record_pass(PassKind.HASH_AGGREGATION)
+        return None, build_categorical_profile(category_values, elements.n_unique())
+    return None, None
+
+
 def _build_length_stats(lengths: pl.Series) -> ListLengthStats:
     if lengths.is_empty():
         return ListLengthStats(mean=0.0, median=0.0, minimum=0, maximum=0)
 
+    record_pass(PassKind.SCAN)
     mean_value = lengths.mean()
+    record_pass(PassKind.SCAN)
     median_value = lengths.median()
+    record_pass(PassKind.SCAN)
     min_value = lengths.min()
+    record_pass(PassKind.SCAN)
     max_value = lengths.max()
     return ListLengthStats(
         mean=_require_float_value(mean_value),
@@ -44,8 +119,7 @@ def _build_length_stats(lengths: pl.Series) -> ListLengthStats:
 
 
 def _build_length_histograms(lengths: pl.Series) -> list[Histogram]:
-    length_values = lengths.cast(pl.Float64)
-    return build_numeric_histograms(length_values, is_integer=True)
+    return build_numeric_histograms(lengths, is_integer=True)
 
 
 def _require_float_value(value: object | None) -> float:
@@ -16,9 +16,11 @@ from mitoric.models.aggregation import (
 from mitoric.models.base import OutlierRate
 from mitoric.profiling.histograms.builder import build_numeric_histograms
 from mitoric.profiling.utils.constants import EXTREMES_LIMIT, TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
 
 
 def build_numeric_profile(values: pl.Series, *, is_integer: bool) -> NumericProfile:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     stats = _numeric_stats(series)
     outlier_rate = _outlier_rate(
@@ -26,6 +28,7 @@ def build_numeric_profile(values: pl.Series, *, is_integer: bool) -> NumericProf
         stats.quantiles[0].value if stats.quantiles else 0.0,
         stats.quantiles[-1].value if stats.quantiles else 0.0,
         stats.iqr,
+        is_integer=is_integer,
     )
     return NumericProfile(
         is_integer=is_integer,
@@ -51,11 +54,16 @@ def _numeric_stats(values: pl.Series) -> NumericStats:
             iqr=0.0,
         )
 
+    record_pass(PassKind.SCAN)
     mean = _require_float_value(values.mean())
+    record_pass(PassKind.SCAN)
     median = _require_float_value(values.median())
+    record_pass(PassKind.SCAN)
     variance = _require_float_value(values.var(ddof=0))
     std = math.sqrt(variance)
+    record_pass(PassKind.SCAN)
     q1 = _require_float_value(values.quantile(0.25, interpolation="lower"))
+    record_pass(PassKind.SCAN)
     q3 = _require_float_value(values.quantile(0.75, interpolation="lower"))
     iqr = q3 - q1
     quantiles = [
@@ -63,9 +71,13 @@ def _numeric_stats(values: pl.Series) -> NumericStats:
         QuantileValue(quantile=0.5, value=median),
         QuantileValue(quantile=0.75, value=q3),
     ]
+    record_pass(PassKind.SCAN)
+    minimum = _require_float_value(values.min())
+    record_pass(PassKind.SCAN)
+    maximum = _require_float_value(values.max())
     return NumericStats(
-        minimum=_require_float_value(values.min()),
-        maximum=_require_float_value(values.max()),
+        minimum=minimum,
+        maximum=maximum,
         mean=mean,
         median=median,
         std=std,
@@ -75,17 +87,31 @@ def _numeric_stats(values: pl.Series) -> NumericStats:
     )
 
 
-def _outlier_rate(values: pl.Series, q1: float, q3: float, iqr: float) -> float:
+def _outlier_rate(
+    values: pl.Series, q1: float, q3: float, iqr: float, *, is_integer: bool
+) -> float:
     if values.len() == 0 or iqr == 0.0:
         return 0.0
-    lower = q1 - 1.5 * iqr
-    upper = q3 + 1.5 * iqr
+    lower: float = q1 - 1.5 * iqr
+    upper: float = q3 + 1.5 * iqr
+    if is_integer and values.dtype.is_integer():
+        # Integer bounds compare on the native dtype; float bounds would cast
+        # the whole column to Float64. Clamped to the data range (which holds
+        # both quartiles) they always fit the dtype.
+        record_pass(PassKind.SCAN)
+        minimum = _require_int_value(values.min())
+        record_pass(PassKind.SCAN)
+        maximum = _require_int_value(values.max())
+        lower = min(max(math.ceil(lower), minimum), maximum)
+        upper = max(min(math.floor(upper), maximum), minimum)
+    record_pass(PassKind.SCAN)
     outliers = ((values < lower) | (values > upper)).sum()
     return int(outliers) / values.len()
 
 
 def _top_numeric_values(values: pl.Series) -> list[NumericValueCount]:
     series = values.rename("value") if values.name != "value" else values
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts().sort(["count", "value"], descending=[True, False])
     return [
         NumericValueCount(value=float(row["value"]), count=int(row["count"]))
@@ -97,6 +123,7 @@ def _extreme_numeric_values(
     values: pl.Series, reverse: bool
 ) -> list[NumericValueCount]:
     series = values.rename("value") if values.name != "value" else values
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts().sort("value", descending=reverse)
     return [
         NumericValueCount(value=float(row["value"]), count=int(row["count"]))
@@ -104,6 +131,12 @@ def _extreme_numeric_values(
     ]
 
 
+def _require_int_value(value: object | None) -> int:
+    if not isinstance(value, int):
+        raise TypeError("value must be an integer")
+    return value
+
+
 def _require_float_value(value: object | None) -> float:
     if value is None:
         raise ValueError("value is required")
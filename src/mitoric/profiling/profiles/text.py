@@ -7,18 +7,25 @@ import polars as pl
 from mitoric.models.aggregation import TextLengthStats, TextProfile, TokenCount
 from mitoric.profiling.histograms.builder import build_numeric_histograms
 from mitoric.profiling.utils.constants import TOP_VALUES_LIMIT
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
 
 
 def build_text_profile(values: pl.Series) -> TextProfile:
+    record_pass(PassKind.COPY)
     series = values.drop_nulls()
     if series.name != "value":
         series = series.rename("value")
 
+    record_pass(PassKind.COPY)
     lengths = series.str.len_chars()
     if lengths.len() > 0:
+        record_pass(PassKind.SCAN)
         mean_value = lengths.mean()
+        record_pass(PassKind.SCAN)
         median_value = lengths.median()
+        record_pass(PassKind.SCAN)
         min_value = lengths.min()
+        record_pass(PassKind.SCAN)
         max_value = lengths.max()
         length_stats = TextLengthStats(
             mean=_require_float_value(mean_value),
@@ -28,11 +35,13 @@ def build_text_profile(values: pl.Series) -> TextProfile:
         )
     else:
         length_stats = TextLengthStats(mean=0.0, median=0.0, minimum=0, maximum=0)
+    record_pass(PassKind.HASH_AGGREGATION)
     counts = series.value_counts().sort(["count", "value"], descending=[True, False])
     top_tokens = [
         TokenCount(token=str(row["value"]), count=int(row["count"]))
         for row in counts.head(TOP_VALUES_LIMIT).iter_rows(named=True)
     ]
+    record_pass(PassKind.COPY)
     length_histograms = build_numeric_histograms(
         lengths.cast(pl.Float64), is_integer=True
     )
@@ -3,3 +3,6 @@
 TOP_VALUES_LIMIT = 10
 EXTREMES_LIMIT = 5
 SAMPLE_VALUES_LIMIT = 5
+SLOWEST_COLUMNS_LIMIT = 10
+ELEMENT_PROFILE_LIMIT = 1_000_000
+BINARY_PREFIX_BYTES = 4
@@ -0,0 +1,122 @@
+"""Collect timing and cost information while a report is generated."""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from mitoric.models.base import (
+    ApproximationNote,
+    ColumnName,
+    ColumnType,
+    DtypeName,
+    ElapsedSeconds,
+    PairCount,
+    StageName,
+    UniqueCount,
+)
+from mitoric.models.diagnostics import (
+    AssociationPairCounts,
+    ColumnTiming,
+    ReportDiagnostics,
+    StageTiming,
+)
+from mitoric.profiling.utils.constants import SLOWEST_COLUMNS_LIMIT
+
+
+class DiagnosticsRecorder:
+    """Mutable collector fed by the pipeline stages of a single report run.
+
+    Column timings recorded more than once under the same name (for example the
+    left and right side of a comparison) are accumulated.
+    """
+
+    def __init__(self) -> None:
+        self._started_at = time.perf_counter()
+        self._stages: list[StageTiming] = []
+        self._columns: dict[ColumnName, ColumnTiming] = {}
+        self._pairs = AssociationPairCounts(
+            numeric_numeric=PairCount(0),
+            categorical_categorical=PairCount(0),
+            numeric_categorical=PairCount(0),
+            numeric_numeric_spearman=PairCount(0),
+            mutual_information=PairCount(0),
+        )
+        self._approximations: list[ApproximationNote] = []
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._stages.append(
+                StageTiming(
+                    stage=StageName(name), elapsed_seconds=ElapsedSeconds(elapsed)
+                )
+            )
+
+    def record_column(
+        self,
+        column_name: ColumnName,
+        *,
+        dtype: str,
+        data_type: ColumnType,
+        unique_count: int,
+        elapsed_seconds: float,
+    ) -> None:
+        previous = self._columns.get(column_name)
+        total = elapsed_seconds + (previous.elapsed_seconds if previous else 0.0)
+        self._columns[column_name] = ColumnTiming(
+            column_name=column_name,
+            dtype=DtypeName(dtype),
+            data_type=data_type,
+            unique_count=UniqueCount(
+                max(unique_count, previous.unique_count if previous else 0)
+            ),
+            elapsed_seconds=ElapsedSeconds(total),
+        )
+
+    def record_association_pairs(
+        self,
+        *,
+        numeric_numeric: int,
+        categorical_categorical: int,
+        numeric_categorical: int,
+        numeric_numeric_spearman: int,
+        mutual_information: int,
+    ) -> None:
+        self._pairs = AssociationPairCounts(
+            numeric_numeric=PairCount(self._pairs.numeric_numeric + numeric_numeric),
+            categorical_categorical=PairCount(
+                self._pairs.categorical_categorical + categorical_categorical
+            ),
+            numeric_categorical=PairCount(
+                self._pairs.numeric_categorical + numeric_categorical
+            ),
+            numeric_numeric_spearman=PairCount(
+                self._pairs.numeric_numeric_spearman + numeric_numeric_spearman
+            ),
+            mutual_information=PairCount(
+                self._pairs.mutual_information + mutual_information
+            ),
+        )
+
+    def record_approximation(self, note: str) -> None:
+        if note not in self._approximations:
+            self._approximations.append(ApproximationNote(note))
+
+    def build(self, *, slowest_limit: int = SLOWEST_COLUMNS_LIMIT) -> ReportDiagnostics:
+        slowest = sorted(
+            self._columns.values(),
+            key=lambda item: (-float(item.elapsed_seconds), str(item.column_name)),
+        )
+        return ReportDiagnostics(
+            total_seconds=ElapsedSeconds(time.perf_counter() - self._started_at),
+            stages=list(self._stages),
+            slowest_columns=slowest[:slowest_limit],
+            association_pairs=self._pairs,
+            approximations=list(self._approximations),
+        )
@@ -0,0 +1,88 @@
+"""Distinct counting by hashing, for every dtype including List and Struct."""
+
+from __future__ import annotations
+
+from functools import cache
+
+import polars as pl
+
+_NESTED = (pl.List, pl.Array, pl.Struct)
+
+
+def count_distinct_rows(frame: pl.DataFrame, *, approximate: bool = False) -> int:
+    """Count distinct rows of ``frame`` with one row-hashing pass.
+
+    ``hash_rows`` works on nested dtypes (including Struct fields of type Null)
+    without materializing Python objects; Polars releases before 1.32 cannot
+    hash List columns, so there nested columns are hashed through their value
+    reprs instead. Unless ``approximate`` is set, rows sharing a hash are
+    compared with the first row of their hash group so that collisions are not
+    merged.
+    """
+    if frame.height == 0:
+        return 0
+    frame = _hashable_frame(frame)
+    hashes = frame.hash_rows()
+    distinct = hashes.n_unique()
+    if approximate or distinct == frame.height:
+        return distinct
+    return distinct + _count_hash_collisions(frame, hashes)
+
+
+@cache
+def _supports_nested_hashing() -> bool:
+    """Return whether ``hash_rows`` accepts List columns (Polars 1.32+)."""
+    try:
+        pl.DataFrame({"value": [[1]]}).hash_rows()
+    except pl.exceptions.InvalidOperationError:
+        return False
+    return True
+
+
+def _hashable_frame(frame: pl.DataFrame) -> pl.DataFrame:
+    """Replace nested columns by their value reprs where they cannot be hashed."""
+    if _supports_nested_hashing():
+        return frame
+    nested = [
+        name for name, dtype in frame.schema.items() if isinstance(dtype, _NESTED)
+    ]
+    if not nested:
+        return frame
+    return frame.with_columns(
+        pl.Series(
+            name,
+            [repr(value) for value in frame.get_column(name).to_list()],
+            dtype=pl.String,
+        )
+        for name in nested
+    )
+
+
+def _count_hash_collisions(frame: pl.DataFrame, hashes: pl.Series) -> int:
+    """Return how many extra distinct rows hide behind shared row hashes."""
+    shared = hashes.is_duplicated()
+    candidates = frame.filter(shared)
+    groups = (
+        hashes.filter(shared)
+        .to_frame("hash")
+        .with_row_index("index")
+        .with_columns(pl.col("index").min().over("hash").alias("first"))
+    )
+    first_rows = candidates[groups.get_column("first")]
+    matches = candidates.select(
+        pl.all_horizontal(
+            pl.col(name).eq_missing(first_rows.get_column(name))
+            for name in candidates.columns
+        )
+    ).to_series()
+    if matches.all():
+        return 0
+
+    # Real collisions are rare; settle only the affected hash groups exactly.
+    colliding_hashes = groups.filter(~matches).get_column("hash").unique()
+    in_collision = groups.get_column("hash").is_in(colliding_hashes.to_list())
+    colliding = candidates.filter(in_collision)
+    distinct_rows = {
+        tuple(repr(value) for value in row) for row in colliding.iter_rows()
+    }
+    return len(distinct_rows) - colliding_hashes.len()
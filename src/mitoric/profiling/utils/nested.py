@@ -0,0 +1,55 @@
+"""Struct flattening so nested fields can be profiled like flat columns."""
+
+from __future__ import annotations
+
+from collections import Counter
+
+import polars as pl
+
+STRUCT_FIELD_SEPARATOR = "."
+
+
+def _struct_leaves(series: pl.Series, path: str) -> list[pl.Series]:
+    dtype = series.dtype
+    if not isinstance(dtype, pl.Struct) or not dtype.fields:
+        return [series.rename(path)]
+    leaves: list[pl.Series] = []
+    for field in dtype.fields:
+        leaves.extend(
+            _struct_leaves(
+                series.struct.field(field.name),
+                f"{path}{STRUCT_FIELD_SEPARATOR}{field.name}",
+            )
+        )
+    return leaves
+
+
+def unnest_struct_columns(frame: pl.DataFrame) -> pl.DataFrame:
+    """Replace every Struct column by its leaf fields, named by dotted path.
+
+    Fields are taken with ``struct.field``, which reuses the field buffers, so
+    nothing is converted to Python. A null struct gives nulls in all its leaves.
+    """
+    if not any(isinstance(dtype, pl.Struct) for dtype in frame.dtypes):
+        return frame
+    columns: list[pl.Series] = []
+    for series in frame.get_columns():
+        columns.extend(_struct_leaves(series, series.name))
+    duplicated = sorted(
+        name
+        for name, count in Counter(series.name for series in columns).items()
+        if count > 1
+    )
+    if duplicated:
+        raise ValueError(
+            f"unnesting Struct columns produces duplicate column names: {duplicated}"
+        )
+    return pl.DataFrame(columns)
+
+
+def struct_leaf_columns(frame: pl.DataFrame, column_name: str) -> list[str]:
+    """Return the leaf paths of ``column_name`` in ``frame`` before unnesting."""
+    return [
+        series.name
+        for series in _struct_leaves(frame.get_column(column_name), column_name)
+    ]
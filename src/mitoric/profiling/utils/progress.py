@@ -0,0 +1,76 @@
+"""Progress reporting and cooperative cancellation for report runs."""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Protocol
+
+from mitoric.models.base import StageName
+
+
+class ReportCancelledError(Exception):
+    """Raised at the next checkpoint after a run's token has been cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe flag checked between columns, association pairs and stages."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+
+@dataclass(frozen=True)
+class ProgressUpdate:
+    stage: StageName
+    completed: int
+    total: int
+
+
+class ProgressCallback(Protocol):
+    def __call__(self, update: ProgressUpdate, /) -> None: ...
+
+
+class ProgressTracker:
+    """Forward progress to a callback and stop the run once it is cancelled.
+
+    The pipeline opens each stage with :meth:`begin`, which reports ``0`` of
+    ``0`` items; profiling loops then report how many of their items are done
+    via :meth:`advance`. :meth:`finish` reports the ``complete`` stage.
+    """
+
+    def __init__(
+        self,
+        callback: ProgressCallback | None = None,
+        cancel_token: CancellationToken | None = None,
+    ) -> None:
+        self._callback = callback
+        self._cancel_token = cancel_token
+        self._stage = StageName("")
+
+    def checkpoint(self) -> None:
+        if self._cancel_token is not None and self._cancel_token.cancelled:
+            raise ReportCancelledError(f"report cancelled during {self._stage}")
+
+    def begin(self, stage: str) -> None:
+        self._stage = StageName(stage)
+        self.advance(0, 0)
+
+    def advance(self, completed: int, total: int) -> None:
+        self.checkpoint()
+        if self._callback is not None:
+            self._callback(
+                ProgressUpdate(stage=self._stage, completed=completed, total=total)
+            )
+
+    def finish(self) -> None:
+        self._stage = StageName("complete")
+        if self._callback is not None:
+            self._callback(ProgressUpdate(stage=self._stage, completed=1, total=1))
@@ -0,0 +1,111 @@
+"""Accounting of full-column passes issued while profiling.
+
+Builders call :func:`record_pass` once, directly before every Polars operation
+that touches a whole column, so adding an operation without its call shows up
+in review next to the code. Nothing is recorded unless a ledger is active via
+:func:`track_scans`, so the hooks cost a single context lookup in normal runs.
+Passes are attributed to the columns set by the innermost
+:func:`scanning_columns` block, which lets leaf builders stay unaware of the
+column they are working on.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from enum import Enum
+
+from mitoric.models.base import ColumnName
+
+
+class PassKind(str, Enum):
+    SCAN = "scan"
+    COPY = "copy"
+    HASH_AGGREGATION = "hash_aggregation"
+
+    def __str__(self) -> str:
+        return self.value
+
+
+@dataclass(frozen=True)
+class ColumnPassCount:
+    column_name: ColumnName
+    scans: int
+    copies: int
+    hash_aggregations: int
+
+    @property
+    def total(self) -> int:
+        return self.scans + self.copies + self.hash_aggregations
+
+
+class ScanLedger:
+    def __init__(self) -> None:
+        self._counts: dict[ColumnName, Counter[PassKind]] = {}
+        # Association blocks record from worker threads sharing one ledger.
+        self._lock = threading.Lock()
+
+    def record(self, column_name: ColumnName, kind: PassKind) -> None:
+        with self._lock:
+            self._counts.setdefault(column_name, Counter())[kind] += 1
+
+    def passes(self, column_name: str) -> ColumnPassCount:
+        counts = self._counts.get(ColumnName(column_name), Counter())
+        return ColumnPassCount(
+            column_name=ColumnName(column_name),
+            scans=counts[PassKind.SCAN],
+            copies=counts[PassKind.COPY],
+            hash_aggregations=counts[PassKind.HASH_AGGREGATION],
+        )
+
+    def report(self) -> list[ColumnPassCount]:
+        entries = [self.passes(name) for name in self._counts]
+        return sorted(entries, key=lambda item: (-item.total, str(item.column_name)))
+
+    def format_report(self) -> str:
+        lines = ["column\tscans\tcopies\thash_aggregations\ttotal"]
+        for entry in self.report():
+            lines.append(
+                f"{entry.column_name}\t{entry.scans}\t{entry.copies}\t"
+                f"{entry.hash_aggregations}\t{entry.total}"
+            )
+        return "\n".join(lines)
+
+
+_ACTIVE_LEDGER: ContextVar[ScanLedger | None] = ContextVar(
+    "mitoric_scan_ledger", default=None
+)
+_CURRENT_COLUMNS: ContextVar[tuple[ColumnName, ...]] = ContextVar(
+    "mitoric_scan_columns", default=()
+)
+
+
+@contextmanager
+def track_scans() -> Iterator[ScanLedger]:
+    ledger = ScanLedger()
+    token = _ACTIVE_LEDGER.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _ACTIVE_LEDGER.reset(token)
+
+
+@contextmanager
+def scanning_columns(*column_names: str) -> Iterator[None]:
+    token = _CURRENT_COLUMNS.set(tuple(ColumnName(name) for name in column_names))
+    try:
+        yield
+    finally:
+        _CURRENT_COLUMNS.reset(token)
+
+
+def record_pass(kind: PassKind) -> None:
+    ledger = _ACTIVE_LEDGER.get()
+    if ledger is None:
+        return
+    for column_name in _CURRENT_COLUMNS.get():
+        ledger.record(column_name, kind)
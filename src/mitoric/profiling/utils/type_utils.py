@@ -5,8 +5,11 @@ from __future__ import annotations
 import polars as pl
 
 from mitoric.models.base import ColumnType
+from mitoric.profiling.utils.scan_accounting import PassKind, record_pass
 
 TEXT_CARDINALITY_THRESHOLD = 100
+_DISTINCT_PROBE_ROWS = 1_024
+_HAS_BINARY_SIZE = hasattr(pl.col("value").bin, "size")
 _NUMERIC_DTYPES: tuple[object, ...] = (
     pl.Int8,
     pl.Int16,
@@ -46,14 +49,6 @@ def _matches_dtype(dtype: pl.DataType, targets: tuple[object, ...]) -> bool:
     return any(dtype == target for target in targets)
 
 
-def _binary_length_or_none(value: object) -> int | None:
-    if value is None:
-        return None
-    if isinstance(value, (bytes, bytearray)):
-        return len(value)
-    raise TypeError("binary value must be bytes-like")
-
-
 def is_numeric_dtype(dtype: pl.DataType) -> bool:
     if getattr(dtype, "is_numeric", None) and dtype.is_numeric():
         return True
@@ -129,22 +124,56 @@ def needs_basic_statistics_only(dtype: pl.DataType) -> bool:
 
 def normalize_numeric_series(series: pl.Series) -> tuple[pl.Series, bool]:
     if is_binary_dtype(series.dtype):
-        numeric_series = series.map_elements(
-            _binary_length_or_none, return_dtype=pl.UInt32, skip_nulls=False
-        )
-        return numeric_series.rename(series.name), True
+        record_pass(PassKind.COPY)
+        return _binary_lengths(series).rename(series.name), True
 
     if series.dtype == pl.Time:
+        record_pass(PassKind.COPY)
         numeric_series = series.cast(pl.Int64)
         return numeric_series.rename(series.name), True
 
     if series.dtype == pl.Duration:
-        numeric_series = series.cast(pl.Int64).cast(pl.Float64) / 1_000_000_000
+        # The Int64 cast only reinterprets; the division yields Float64.
+        record_pass(PassKind.COPY)
+        numeric_series = series.cast(pl.Int64) / 1_000_000_000
         return numeric_series.rename(series.name), False
 
+    if not is_numeric_dtype(series.dtype):
+        # Explicit numeric types on e.g. String columns need real numbers.
+        record_pass(PassKind.COPY)
+        return series.cast(pl.Float64), False
+
     return series, is_integer_dtype(series.dtype)
 
 
+def _binary_lengths(series: pl.Series) -> pl.Series:
+    if _HAS_BINARY_SIZE:
+        return series.bin.size()
+    # Polars before 1.11 has no bin.size; two hex digits encode each byte.
+    return series.bin.encode("hex").str.len_bytes() // 2
+
+
+def exceeds_distinct_count(series: pl.Series, limit: int) -> bool:
+    """Return whether ``series`` holds more than ``limit`` distinct values.
+
+    Slices of doubling length are deduplicated into a running set of at most
+    ``limit + 1`` values, so high-cardinality columns are settled after the
+    first few thousand rows instead of a full hash aggregation.
+    """
+    seen = series.clear()
+    offset = 0
+    length = _DISTINCT_PROBE_ROWS
+    while offset < series.len():
+        chunk = series.slice(offset, length)
+        seen = pl.concat([seen, chunk.unique()]).unique()
+        if seen.len() > limit:
+            return True
+        offset += length
+        length *= 2
+    record_pass(PassKind.HASH_AGGREGATION)
+    return False
+
+
 def classify_column_type(series: pl.Series) -> ColumnType:
     dtype = series.dtype
     if dtype == pl.Boolean:
@@ -162,10 +191,9 @@ def classify_column_type(series: pl.Series) -> ColumnType:
     if is_binary_dtype(dtype):
         return ColumnType.NUMERIC
     if is_string_dtype(dtype):
-        unique_count = series.n_unique()
         return (
             ColumnType.TEXT
-            if unique_count > TEXT_CARDINALITY_THRESHOLD
+            if exceeds_distinct_count(series, TEXT_CARDINALITY_THRESHOLD)
             else ColumnType.CATEGORICAL
         )
     return ColumnType.CATEGORICAL
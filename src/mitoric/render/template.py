@@ -2,13 +2,16 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from pathlib import Path
-
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from typing import TYPE_CHECKING
 
 from mitoric.render.formatters import _format_bytes, _format_float, _format_number
 from mitoric.reporting.payload_schema import ReportPayload
 
+if TYPE_CHECKING:
+    from jinja2 import Environment
+
 
 def _finalize(value: object) -> object:
     if isinstance(value, float):
@@ -16,13 +19,22 @@ def _finalize(value: object) -> object:
     return value
 
 
-def render_report(template_path: Path, payload: ReportPayload) -> str:
+@lru_cache(maxsize=8)
+def _environment(template_dir: str) -> Environment:
+    # Jinja2 is only needed once a report is rendered; importing it here keeps
+    # it off the import path of the package and of the profiling modules.
+    from jinja2 import Environment, FileSystemLoader, select_autoescape
+
     env = Environment(
-        loader=FileSystemLoader(str(template_path.parent)),
+        loader=FileSystemLoader(template_dir),
         autoescape=select_autoescape(["html", "xml"]),
         finalize=_finalize,
     )
     env.filters["format_number"] = _format_number
     env.filters["format_bytes"] = _format_bytes
-    template = env.get_template(template_path.name)
+    return env
+
+
+def render_report(template_path: Path, payload: ReportPayload) -> str:
+    template = _environment(str(template_path.parent)).get_template(template_path.name)
     return template.render(payload=payload)
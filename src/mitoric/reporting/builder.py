@@ -14,6 +14,7 @@ from mitoric.models.aggregation import (
     DatasetSummary,
 )
 from mitoric.models.base import WarningMessage
+from mitoric.models.diagnostics import ReportDiagnostics
 from mitoric.reporting.payload_schema import (
     AssociationSummaryPayload,
     ColumnProfilePayload,
@@ -21,10 +22,19 @@ from mitoric.reporting.payload_schema import (
     CompareReportPayload,
     ComparisonSummaryPayload,
     DatasetSummaryPayload,
+    ReportDiagnosticsPayload,
     SingleReportPayload,
 )
 
 
+def _build_diagnostics_payload(
+    diagnostics: ReportDiagnostics | None,
+) -> ReportDiagnosticsPayload | None:
+    if diagnostics is None:
+        return None
+    return cast(ReportDiagnosticsPayload, asdict(diagnostics))
+
+
 def build_single_report_payload(
     *,
     warnings: list[WarningMessage],
@@ -32,6 +42,7 @@ def build_single_report_payload(
     column_profiles: list[ColumnProfile],
     associations: AssociationSummary,
     histogram_bins: Sequence[int],
+    diagnostics: ReportDiagnostics | None = None,
 ) -> SingleReportPayload:
     dataset_payload = cast(DatasetSummaryPayload, asdict(dataset_summary))
     column_payloads = [
@@ -45,6 +56,7 @@ def build_single_report_payload(
         "column_profiles": column_payloads,
         "associations": associations_payload,
         "histogram_bins": histogram_bins,
+        "diagnostics": _build_diagnostics_payload(diagnostics),
     }
 
 
@@ -54,6 +66,7 @@ def build_compare_report_payload(
     comparison_summary: ComparisonSummary,
     compare_column_profiles: list[CompareColumnProfile],
     histogram_bins: Sequence[int],
+    diagnostics: ReportDiagnostics | None = None,
 ) -> CompareReportPayload:
     comparison_payload = cast(ComparisonSummaryPayload, asdict(comparison_summary))
     compare_payloads = [
@@ -66,4 +79,5 @@ def build_compare_report_payload(
         "comparison_summary": comparison_payload,
         "compare_column_profiles": compare_payloads,
         "histogram_bins": histogram_bins,
+        "diagnostics": _build_diagnostics_payload(diagnostics),
     }
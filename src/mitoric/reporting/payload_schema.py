@@ -6,12 +6,17 @@ from collections.abc import Sequence
 from typing import Literal, TypedDict
 
 from mitoric.models.base import (
+    ApproximationNote,
+    AssociationMetric,
     AssociationValue,
     ColumnCount,
     ColumnName,
     ColumnType,
     DatasetId,
+    DtypeName,
     DuplicateRowCount,
+    ElapsedSeconds,
+    EncodedMatrix,
     MemoryBytes,
     MissingCount,
     MissingRate,
@@ -19,8 +24,10 @@ from mitoric.models.base import (
     NullCount,
     NullRate,
     OutlierRate,
+    PairCount,
     RowCount,
     RowCountDelta,
+    StageName,
     SuppressedCount,
     UniqueCount,
     WarningMessage,
@@ -143,6 +150,15 @@ class ListProfilePayload(TypedDict):
     length_stats: ListLengthStatsPayload
     length_histograms: list[HistogramPayload]
     value_samples: list[str]
+    element_count: int
+    profiled_element_count: int
+    element_numeric_profile: NumericProfilePayload | None
+    element_categorical_profile: CategoricalProfilePayload | None
+
+
+class BinaryProfilePayload(TypedDict):
+    prefix_bytes: int
+    top_prefixes: list[CategoryCountPayload]
 
 
 class DatetimeValueCountPayload(TypedDict):
@@ -170,6 +186,7 @@ class ColumnProfilePayload(TypedDict):
     text_profile: TextProfilePayload | None
     datetime_profile: DatetimeProfilePayload | None
     list_profile: ListProfilePayload | None
+    binary_profile: BinaryProfilePayload | None
     value_samples: list[str]
 
 
@@ -186,10 +203,44 @@ class AssociationPayload(TypedDict):
     value: AssociationValue
 
 
+class AssociationDriftPayload(TypedDict):
+    column: ColumnName
+    other_column: ColumnName
+    metric: AssociationMetric
+    left_value: AssociationValue
+    right_value: AssociationValue
+    change: AssociationValue
+
+
+class TargetAssociationPayload(TypedDict):
+    feature: ColumnName
+    metric: AssociationMetric
+    value: AssociationValue
+
+
+class AssociationMatrixPayload(TypedDict):
+    columns: list[ColumnName]
+    values: EncodedMatrix
+    signed: bool
+
+
+class AssociationColumnLimitPayload(TypedDict):
+    max_columns: ColumnCount
+    omitted_columns: list[ColumnName]
+
+
 class AssociationSummaryPayload(TypedDict):
     numeric_numeric: list[AssociationPayload]
     categorical_categorical: list[AssociationPayload]
     numeric_categorical: list[AssociationPayload]
+    numeric_numeric_spearman: list[AssociationPayload]
+    mutual_information: list[AssociationPayload]
+    numeric_numeric_matrix: AssociationMatrixPayload | None
+    categorical_categorical_matrix: AssociationMatrixPayload | None
+    mutual_information_matrix: AssociationMatrixPayload | None
+    target: ColumnName | None
+    target_associations: list[TargetAssociationPayload]
+    column_limit: AssociationColumnLimitPayload | None
 
 
 class ColumnMatchSummaryPayload(TypedDict):
@@ -216,6 +267,37 @@ class ComparisonSummaryPayload(TypedDict):
     type_mismatches: list[TypeMismatchPayload]
     column_profiles_left_only: list[ColumnProfilePayload]
     column_profiles_right_only: list[ColumnProfilePayload]
+    association_drift: list[AssociationDriftPayload]
+    association_column_limit: AssociationColumnLimitPayload | None
+
+
+class StageTimingPayload(TypedDict):
+    stage: StageName
+    elapsed_seconds: ElapsedSeconds
+
+
+class ColumnTimingPayload(TypedDict):
+    column_name: ColumnName
+    dtype: DtypeName
+    data_type: ColumnType
+    unique_count: UniqueCount
+    elapsed_seconds: ElapsedSeconds
+
+
+class AssociationPairCountsPayload(TypedDict):
+    numeric_numeric: PairCount
+    categorical_categorical: PairCount
+    numeric_categorical: PairCount
+    numeric_numeric_spearman: PairCount
+    mutual_information: PairCount
+
+
+class ReportDiagnosticsPayload(TypedDict):
+    total_seconds: ElapsedSeconds
+    stages: list[StageTimingPayload]
+    slowest_columns: list[ColumnTimingPayload]
+    association_pairs: AssociationPairCountsPayload
+    approximations: list[ApproximationNote]
 
 
 class SingleReportPayload(TypedDict):
@@ -225,6 +307,7 @@ class SingleReportPayload(TypedDict):
     column_profiles: list[ColumnProfilePayload]
     associations: AssociationSummaryPayload
     histogram_bins: Sequence[int]
+    diagnostics: ReportDiagnosticsPayload | None
 
 
 class CompareReportPayload(TypedDict):
@@ -233,6 +316,7 @@ class CompareReportPayload(TypedDict):
     comparison_summary: ComparisonSummaryPayload
     compare_column_profiles: list[CompareColumnProfilePayload]
     histogram_bins: Sequence[int]
+    diagnostics: ReportDiagnosticsPayload | None
 
 
 ReportPayload = SingleReportPayload | CompareReportPayload
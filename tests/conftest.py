@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterator
 from pathlib import Path
 
 import polars as pl
@@ -12,6 +13,11 @@ for path in (SRC_ROOT, PROJECT_ROOT):
     if str(path) not in sys.path:
         sys.path.append(str(path))
 
+from mitoric.profiling.utils.scan_accounting import (  # noqa: E402
+    ScanLedger,
+    track_scans,
+)
+
 
 @pytest.fixture
 def sample_frame() -> pl.DataFrame:
@@ -21,3 +27,10 @@ def sample_frame() -> pl.DataFrame:
             "city": ["A", "B", "A", "C"],
         }
     )
+
+
+@pytest.fixture
+def scan_ledger() -> Iterator[ScanLedger]:
+    """Count full-column passes issued by profiling code run inside the test."""
+    with track_scans() as ledger:
+        yield ledger
@@ -50,15 +50,34 @@ def test_compare_report_includes_variable_details() -> None:
     assert "right_counts" in html
 
 
-def test_compare_report_hides_associations_section() -> None:
-    left = pl.DataFrame({"id": [1, 2], "value": [10, 20]})
-    right = pl.DataFrame({"id": [1, 2], "value": [10, 25]})
+def test_compare_report_shows_association_drift() -> None:
+    left = pl.DataFrame(
+        {"value": [1, 2, 3, 4, 5, 6], "label": ["a", "a", "a", "b", "b", "b"]}
+    )
+    right = pl.DataFrame(
+        {"value": [1, 2, 3, 4, 5, 6], "label": ["a", "b", "a", "b", "a", "b"]}
+    )
 
     html = generate_compare_report(left, right)
+    information_html = generate_compare_report(
+        left, right, association_mutual_information=True
+    )
+
+    assert 'data-section="associations"' in html
+    assert "Association drift" in html
+    assert "value × label" in html
+    assert "Correlation ratio η" in html
+    assert "Normalized mutual information" not in html
+    assert "Normalized mutual information" in information_html
+
+
+def test_compare_report_lists_columns_left_out_of_association_drift() -> None:
+    frame = pl.DataFrame({"a": [1, 2, 3], "b": [2, 1, 3], "c": [3, 1, 2]})
+
+    html = generate_compare_report(frame, frame, association_max_columns=2)
 
-    assert 'data-section="associations"' not in html
-    assert 'data-target="associations"' not in html
-    assert "Associations" not in html
+    assert "data-association-column-limit" in html
+    assert "1 column is left out" in html
 
 
 def test_compare_report_hides_differences_section() -> None:
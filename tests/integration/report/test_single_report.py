@@ -75,3 +75,56 @@ def test_single_report_includes_text_top_values() -> None:
 
     assert "Most frequent values" in html
     assert "alpha" in html
+
+
+def test_single_report_diagnostics_section_is_optional() -> None:
+    frame = pl.DataFrame({"age": [10, 12, 12, 14], "city": ["A", "B", "A", "C"]})
+
+    default_html = generate_single_report(frame)
+    diagnostics_html = generate_single_report(frame, include_diagnostics=True)
+
+    assert 'data-section="diagnostics"' not in default_html
+    assert 'data-section="diagnostics"' in diagnostics_html
+    assert "Slowest columns" in diagnostics_html
+    assert "profile_columns" in diagnostics_html
+
+
+def test_single_report_profiles_struct_leaves_when_unnested() -> None:
+    frame = pl.DataFrame(
+        {"event": [{"kind": "click", "ms": 10}, {"kind": "view", "ms": 20}, None]}
+    )
+
+    html = generate_single_report(frame, unnest_structs=True)
+
+    assert 'data-column-name="event.kind"' in html
+    assert 'data-column-name="event.ms"' in html
+    assert 'data-column-name="event"' not in html
+
+
+def test_single_report_strict_projection_reads_only_target_columns(
+    tmp_path,
+) -> None:
+    path = tmp_path / "wide.parquet"
+    pl.DataFrame({"keep": [1, 2, 3], "skip": ["a", "b", "c"]}).write_parquet(path)
+
+    html = generate_single_report(
+        pl.scan_parquet(path), target_columns=["keep"], strict_projection=True
+    )
+
+    assert 'data-column-name="keep"' in html
+    assert 'data-column-name="skip"' not in html
+
+
+def test_single_report_shows_list_element_profiles() -> None:
+    frame = pl.DataFrame(
+        {
+            "scores": [[1.0, 2.5], [3.0], None],
+            "tags": [["red", "blue"], ["red"], []],
+        }
+    )
+
+    html = generate_single_report(frame)
+
+    assert 'data-list-elements="numeric"' in html
+    assert 'data-list-elements="categorical"' in html
+    assert "Element histogram" in html
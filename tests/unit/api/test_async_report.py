@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+import pytest
+
+from mitoric import (
+    CancellationToken,
+    ProgressUpdate,
+    agenerate_compare_report,
+    agenerate_single_report,
+    generate_single_report,
+)
+
+
+def test_agenerate_single_report_matches_sync_and_writes_file(tmp_path) -> None:
+    frame = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "x"]})
+    save_path = tmp_path / "nested" / "report.html"
+
+    html = asyncio.run(agenerate_single_report(frame, save_path=str(save_path)))
+
+    assert html == generate_single_report(frame)
+    assert save_path.read_text(encoding="utf-8") == html
+
+
+def test_agenerate_compare_report_runs_off_the_event_loop_thread() -> None:
+    frame = pl.DataFrame({"a": [1, 2, 3]})
+    threads: set[str] = set()
+
+    def record_thread(update: ProgressUpdate) -> None:
+        threads.add(threading.current_thread().name)
+
+    async def run() -> str:
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="worker") as pool:
+            return await agenerate_compare_report(
+                frame, frame, progress=record_thread, executor=pool
+            )
+
+    html = asyncio.run(run())
+
+    assert 'data-section="variables"' in html
+    assert threads
+    assert all(name.startswith("worker") for name in threads)
+
+
+def test_cancelling_the_task_cancels_the_token() -> None:
+    frame = pl.DataFrame({"a": list(range(10)), "b": list(range(10))})
+    token = CancellationToken()
+    started = threading.Event()
+    release = threading.Event()
+
+    def block_first_update(update: ProgressUpdate) -> None:
+        started.set()
+        release.wait(timeout=5)
+
+    async def run() -> None:
+        task = asyncio.create_task(
+            agenerate_single_report(
+                frame, progress=block_first_update, cancel_token=token
+            )
+        )
+        await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        release.set()
+
+    asyncio.run(run())
+
+    assert token.cancelled
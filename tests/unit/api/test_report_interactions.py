@@ -11,13 +11,58 @@ def test_report_interactions_metadata() -> None:
         {"age": ages, "city": ["A" if value % 2 == 0 else "B" for value in ages]}
     )
 
-    html = generate_single_report(frame)
+    html = generate_single_report(frame, association_mutual_information=True)
 
     assert 'data-column-name="age"' in html
     assert 'data-column-name="city"' in html
     assert 'data-section="variables"' in html
     assert 'data-section="associations"' in html
+    assert "Spearman ρ" in html
+    assert "Normalized mutual information" in html
+    assert 'aria-label="Information heatmap"' in html
     assert 'data-bin="10"' in html
     assert 'data-bin="15"' in html
     assert 'data-bin="30"' in html
     assert 'data-bin="50"' in html
+
+
+def test_report_leaves_out_mutual_information_by_default() -> None:
+    frame = pl.DataFrame({"a": [1.0, 2.0, 4.0], "b": [2.0, 1.0, 3.0]})
+
+    html = generate_single_report(frame)
+
+    assert "Spearman ρ" in html
+    assert "Normalized mutual information" not in html
+    assert 'aria-label="Information heatmap"' not in html
+    assert 'aria-label="Numerical heatmap"' in html
+
+
+def test_report_ranks_every_column_against_association_target() -> None:
+    ages = list(range(21))
+    frame = pl.DataFrame(
+        {
+            "age": ages,
+            "score": [value * 2 for value in ages],
+            "city": ["A" if value % 2 == 0 else "B" for value in ages],
+        }
+    )
+
+    html = generate_single_report(frame, association_target="age")
+
+    assert "Every column against age" in html
+    assert "score × age" in html
+    assert "city × age" in html
+    assert "Correlation ratio η" in html
+    assert "Spearman ρ" not in html
+
+
+def test_report_lists_columns_left_out_by_association_max_columns() -> None:
+    frame = pl.DataFrame({name: [1.0, 2.0, 4.0] for name in ("a", "b", "c", "d")})
+
+    limited = generate_single_report(frame, association_max_columns=2)
+    unlimited = generate_single_report(frame)
+
+    assert "data-association-column-limit" in limited
+    assert "first 2 columns of each kind" in limited
+    assert "c, d" in limited
+    assert "data-association-column-limit" not in unlimited
@@ -2,8 +2,21 @@ from __future__ import annotations
 
 import polars as pl
 
-from mitoric.api.pipeline import CompareReportRequest, SingleReportRequest
-from mitoric.models.base import ColumnName, DatasetId, SavePath
+from mitoric import generate_compare_report, generate_single_report
+from mitoric.api.pipeline import (
+    CompareReportRequest,
+    ReportPipeline,
+    SingleReportRequest,
+)
+from mitoric.models.base import (
+    ColumnName,
+    ColumnType,
+    DatasetId,
+    ExplicitType,
+    SavePath,
+)
+from mitoric.profiling import dataset
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
 
 
 def test_single_report_request_normalizes_inputs() -> None:
@@ -37,3 +50,97 @@ def test_compare_report_request_normalizes_labels() -> None:
 
     assert request.left_name == DatasetId("left")
     assert request.right_name == DatasetId("right")
+
+
+def test_single_report_request_unnests_structs_and_expands_targets() -> None:
+    frame = pl.DataFrame(
+        {
+            "id": [1, 2],
+            "event": [
+                {"kind": "click", "pos": {"x": 1.0, "y": 2.0}},
+                {"kind": "view", "pos": None},
+            ],
+        }
+    )
+
+    request = SingleReportRequest.from_raw(
+        frame,
+        target_columns=["event"],
+        explicit_types=[ExplicitType(ColumnName("event.pos.x"), ColumnType.NUMERIC)],
+        save_path=None,
+        unnest_structs=True,
+    )
+
+    assert request.frame.columns == ["id", "event.kind", "event.pos.x", "event.pos.y"]
+    assert request.frame.get_column("event.pos.y").to_list() == [2.0, None]
+    assert request.target_columns == [
+        ColumnName("event.kind"),
+        ColumnName("event.pos.x"),
+        ColumnName("event.pos.y"),
+    ]
+
+
+def test_report_requests_project_lazy_inputs_to_targets_in_strict_mode() -> None:
+    frame = pl.LazyFrame({"a": [1, 2], "b": [3, 4], "c": ["x", "y"]})
+
+    strict = SingleReportRequest.from_raw(
+        frame,
+        target_columns=["c", "a", "a"],
+        explicit_types=None,
+        save_path=None,
+        strict_projection=True,
+    )
+    relaxed = SingleReportRequest.from_raw(
+        frame, target_columns=["c"], explicit_types=None, save_path=None
+    )
+    compare = CompareReportRequest.from_raw(
+        frame,
+        frame.collect(),
+        target_columns=["b"],
+        explicit_types=None,
+        save_path=None,
+        left_name=None,
+        right_name=None,
+        strict_projection=True,
+    )
+
+    assert strict.frame.columns == ["c", "a"]
+    assert relaxed.frame.columns == ["a", "b", "c"]
+    assert compare.left.columns == ["b"]
+    assert compare.right.columns == ["b"]
+
+
+def test_report_pipeline_passes_approximate_duplicates(monkeypatch) -> None:
+    calls: list[bool] = []
+
+    def record(frame: pl.DataFrame, *, approximate: bool = False) -> int:
+        calls.append(approximate)
+        return frame.height
+
+    monkeypatch.setattr(dataset, "count_distinct_rows", record)
+    frame = pl.DataFrame({"value": [1, 1, 2]})
+
+    generate_single_report(frame, approximate_duplicates=True)
+    generate_compare_report(frame, frame, approximate_duplicates=True)
+    generate_single_report(frame)
+
+    assert calls == [True, True, True, False]
+
+
+def test_report_pipeline_records_stages_into_given_recorder() -> None:
+    request = SingleReportRequest.from_raw(
+        pl.DataFrame({"value": [1, 2, 3]}),
+        target_columns=None,
+        explicit_types=None,
+        save_path=None,
+    )
+    recorder = DiagnosticsRecorder()
+
+    ReportPipeline().generate_single(request, recorder=recorder)
+
+    stages = [str(timing.stage) for timing in recorder.build().stages]
+    assert stages[:3] == [
+        "summarize_dataset",
+        "profile_columns",
+        "compute_associations",
+    ]
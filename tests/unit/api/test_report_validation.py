@@ -71,6 +71,45 @@ def test_generate_single_report_invalid_explicit_type_column() -> None:
         )
 
 
+def test_generate_single_report_rejects_negative_association_tolerance() -> None:
+    frame = pl.DataFrame({"value": [1, 2, 3]})
+
+    with pytest.raises(ValueError, match="association_tolerance must be"):
+        generate_single_report(frame, association_tolerance=-0.1)
+
+
+def test_generate_single_report_rejects_unknown_association_target() -> None:
+    frame = pl.DataFrame({"value": [1, 2, 3]})
+
+    with pytest.raises(ValueError, match="association_target not found"):
+        generate_single_report(frame, association_target="label")
+
+
+@pytest.mark.parametrize(
+    "target",
+    [
+        pl.Series("label", [[1], [2], [3]]),
+        pl.Series("label", [None, None, None], dtype=pl.Null),
+        pl.Series("label", ["2024-01-01", "2024-01-02", "2024-01-03"]).str.to_date(),
+    ],
+    ids=["list", "null", "date"],
+)
+def test_generate_single_report_rejects_unsupported_association_target(
+    target: pl.Series,
+) -> None:
+    frame = pl.DataFrame({"value": [1, 2, 3]}).with_columns(target)
+
+    with pytest.raises(ValueError, match="association_target must be a numeric"):
+        generate_single_report(frame, association_target="label")
+
+
+def test_generate_single_report_rejects_non_positive_association_max_columns() -> None:
+    frame = pl.DataFrame({"value": [1, 2, 3]})
+
+    with pytest.raises(ValueError, match="association_max_columns must be"):
+        generate_single_report(frame, association_max_columns=0)
+
+
 def test_generate_single_report_empty_frame_warning() -> None:
     frame = pl.DataFrame()
 
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 import polars as pl
 
-from mitoric.profiling.compare.histograms import build_compare_numeric_histograms
+from mitoric.models.base import ColumnType
+from mitoric.profiling.compare.histograms import (
+    build_compare_histograms_for_column,
+    build_compare_numeric_histograms,
+)
 
 
 def test_build_compare_numeric_histograms_low_cardinality() -> None:
@@ -20,3 +24,30 @@ def test_build_compare_numeric_histograms_low_cardinality() -> None:
     assert histogram.labels == ["1", "2", "3"]
     assert histogram.left_counts == [1, 2, 0]
     assert histogram.right_counts == [1, 0, 1]
+
+
+def test_build_compare_numeric_histograms_mixes_integer_widths() -> None:
+    left_values = pl.Series("left", list(range(256)), dtype=pl.UInt8)
+    right_values = pl.Series("right", list(range(-100, 100)), dtype=pl.Int8)
+
+    histograms = build_compare_numeric_histograms(
+        left_values, right_values, is_integer=True
+    )
+
+    histogram = histograms[0]
+    assert histogram.labels[0] == "-100 - -65"
+    assert sum(histogram.left_counts) == 256
+    assert sum(histogram.right_counts) == 200
+
+
+def test_build_compare_histograms_for_explicit_numeric_string_column() -> None:
+    left_values = pl.Series("value", ["1", "2", "2"])
+    right_values = pl.Series("value", ["1", "3"])
+
+    histograms = build_compare_histograms_for_column(
+        left_values, right_values, ColumnType.NUMERIC, ColumnType.NUMERIC
+    )
+
+    histogram = histograms[0]
+    assert histogram.left_counts == [1, 2, 0]
+    assert histogram.right_counts == [1, 0, 1]
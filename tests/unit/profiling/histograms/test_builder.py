@@ -15,3 +15,13 @@ def test_build_numeric_histograms_constant_values() -> None:
         assert histogram.bins[0].lower == 2.0
         assert histogram.bins[0].upper == 2.0
         assert histogram.bins[0].count == 3
+
+
+def test_build_numeric_histograms_bins_full_int8_range_without_overflow() -> None:
+    values = pl.Series("values", list(range(-128, 128)), dtype=pl.Int8)
+
+    histograms = build_numeric_histograms(values, is_integer=True)
+
+    for histogram in histograms:
+        assert sum(bin.count for bin in histogram.bins) == 256
+        assert histogram.bins[0].lower == -128.0
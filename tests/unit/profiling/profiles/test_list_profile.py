@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import polars as pl
+
+from mitoric.profiling.profiles import list_profile
+from mitoric.profiling.profiles.list_profile import build_list_profile
+
+
+def test_list_profile_describes_numeric_elements() -> None:
+    series = pl.Series(
+        "embedding", [[1.0, 2.0], [3.0, None], None, []], dtype=pl.List(pl.Float64)
+    )
+
+    profile = build_list_profile(series)
+
+    assert profile.element_count == 4
+    assert profile.profiled_element_count == 3
+    assert profile.element_categorical_profile is None
+    assert profile.element_numeric_profile is not None
+    assert profile.element_numeric_profile.stats.maximum == 3.0
+    assert profile.element_numeric_profile.histograms
+
+
+def test_list_profile_counts_string_elements_of_arrays() -> None:
+    series = pl.Series(
+        "tags", [["a", "b"], ["a", "c"], ["a", None]], dtype=pl.Array(pl.String, 2)
+    )
+
+    profile = build_list_profile(series)
+
+    assert profile.length_stats.maximum == 2
+    assert profile.element_numeric_profile is None
+    assert profile.element_categorical_profile is not None
+    top = profile.element_categorical_profile.top_categories[0]
+    assert (top.category, top.count) == ("a", 3)
+
+
+def test_list_profile_caps_profiled_elements(monkeypatch) -> None:
+    monkeypatch.setattr(list_profile, "ELEMENT_PROFILE_LIMIT", 10)
+    series = pl.Series("values", [list(range(4))] * 20 + [list(range(100))])
+
+    profile = build_list_profile(series)
+
+    assert profile.element_count == 180
+    assert 0 < profile.profiled_element_count <= 10
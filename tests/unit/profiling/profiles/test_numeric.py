@@ -19,3 +19,22 @@ def test_build_numeric_profile_low_cardinality_histogram() -> None:
         (3.0, 3.0, 1),
     ]
     assert profile.outlier_rate == 0.0
+
+
+def test_build_numeric_profile_keeps_large_uint64_values_distinct() -> None:
+    base = 2**63
+    values = pl.Series("ids", [base, base, base + 1, base + 2], dtype=pl.UInt64)
+
+    profile = build_numeric_profile(values, is_integer=True)
+
+    # Through Float64 all three ids would collapse into a single value.
+    assert [item.count for item in profile.top_values] == [2, 1, 1]
+    assert profile.histograms[0].bin_count == 3
+
+
+def test_build_numeric_profile_outlier_rate_on_narrow_integers() -> None:
+    values = pl.Series("values", [1, 2, 2, 3, 3, 4, 120], dtype=pl.Int8)
+
+    profile = build_numeric_profile(values, is_integer=True)
+
+    assert profile.outlier_rate == 1 / 7
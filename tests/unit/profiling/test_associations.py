@@ -1,9 +1,18 @@
 from __future__ import annotations
 
+import base64
+import datetime as dt
+import math
+
 import polars as pl
 import pytest
 
-from mitoric.profiling.associations import compute_associations
+from mitoric.models.aggregation import AssociationColumnLimit
+from mitoric.models.base import AssociationMetric, ColumnCount, ColumnName
+from mitoric.profiling.associations import (
+    compute_association_drift,
+    compute_associations,
+)
 
 
 def test_association_metrics() -> None:
@@ -50,3 +59,244 @@ def test_associations_sorted_by_value() -> None:
 
     values = [item.value for item in summary.numeric_numeric]
     assert values == sorted(values, reverse=True)
+
+
+def test_spearman_detects_monotonic_non_linear_pairs() -> None:
+    frame = pl.DataFrame(
+        {
+            "x": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "cubed": [1.0, 8.0, 27.0, 64.0, 125.0, 216.0],
+        }
+    )
+
+    summary = compute_associations(frame)
+
+    assert summary.numeric_numeric[0].value < 0.95
+    assert summary.numeric_numeric_spearman[0].value == pytest.approx(1.0)
+
+
+def test_spearman_treats_nan_as_missing() -> None:
+    with_nan = pl.DataFrame(
+        {"a": [1.0, float("nan"), 3.0, 4.0, 5.0, 6.0], "b": [2, 1, 5, 3, 1, 7]}
+    )
+    with_null = with_nan.with_columns(pl.col("a").fill_nan(None))
+
+    summary = compute_associations(with_nan)
+    expected = compute_associations(with_null)
+
+    assert summary.numeric_numeric_spearman[0].value == pytest.approx(
+        expected.numeric_numeric_spearman[0].value
+    )
+
+
+def test_mutual_information_scores_pairs_across_column_types() -> None:
+    days = [dt.date(2024, 1, 1) + dt.timedelta(days=day) for day in range(40)]
+    frame = pl.DataFrame(
+        {
+            "amount": [float(index // 20) for index in range(40)],
+            "day": days,
+            "half": ["early" if index < 20 else "late" for index in range(40)],
+            "parity": ["even" if index % 2 == 0 else "odd" for index in range(40)],
+        }
+    )
+
+    summary = compute_associations(frame, mutual_information=True)
+
+    scores = {
+        (str(item.left), str(item.right)): item.value
+        for item in summary.mutual_information
+    }
+    assert scores[("amount", "half")] == pytest.approx(1.0)
+    # Two values against ten day bins: I = H(amount) = ln 2, H(day) = ln 10.
+    assert scores[("amount", "day")] == pytest.approx(
+        math.log(2) / math.sqrt(math.log(2) * math.log(10))
+    )
+    assert scores[("half", "parity")] == pytest.approx(0.0)
+
+
+def test_mutual_information_matrix_encodes_every_pair_as_bytes() -> None:
+    frame = pl.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0],
+            "b": [1.0, 2.0, 3.0, 4.0],
+            "label": ["x", "x", "x", "x"],
+        }
+    )
+
+    matrix = compute_associations(
+        frame, mutual_information=True
+    ).mutual_information_matrix
+
+    assert compute_associations(frame).mutual_information_matrix is None
+    assert matrix is not None
+    assert matrix.columns == ["a", "b", "label"]
+    # Pairs (a, b), (a, label), (b, label): one byte each, score * 254.
+    assert list(base64.b64decode(matrix.values)) == [254, 0, 0]
+
+
+def test_pearson_and_cramers_v_matrices_cover_every_pair() -> None:
+    frame = pl.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0],
+            "b": [1.0, 2.0, 3.0, 4.0],
+            "inverse": [4.0, 3.0, 2.0, 1.0],
+            "x": ["p", "p", "q", "q"],
+            "y": ["r", "r", "s", "s"],
+        }
+    )
+
+    summary = compute_associations(frame)
+
+    numeric = summary.numeric_numeric_matrix
+    assert numeric is not None
+    assert numeric.signed
+    assert numeric.columns == ["a", "b", "inverse"]
+    # (score + 1) / 2 * 254: r = 1 -> 254, r = -1 -> 0.
+    assert list(base64.b64decode(numeric.values)) == [254, 0, 0]
+    categorical = summary.categorical_categorical_matrix
+    assert categorical is not None
+    assert not categorical.signed
+    assert list(base64.b64decode(categorical.values)) == [254]
+
+
+def test_target_associations_rank_every_feature_by_strength() -> None:
+    frame = pl.DataFrame(
+        {
+            "label": ["a", "a", "b", "b", "a", "b"],
+            "inverse": [6.0, 5.0, 1.0, 2.0, 5.5, 1.5],
+            "noise": [1.0, 2.0, 1.0, 2.0, 2.0, 1.0],
+            "group": ["x", "x", "y", "y", "x", "y"],
+        }
+        | {f"extra{index}": [float(index)] * 6 for index in range(25)}
+    )
+
+    summary = compute_associations(frame, target="label")
+
+    assert summary.target == "label"
+    assert summary.numeric_numeric == []
+    assert len(summary.target_associations) == 28
+    first, second = summary.target_associations[:2]
+    assert (first.feature, first.metric) == ("group", AssociationMetric.CRAMERS_V)
+    assert first.value == pytest.approx(1.0)
+    assert second.feature == "inverse"
+    assert second.metric == AssociationMetric.CORRELATION_RATIO
+
+
+def test_numeric_target_ranks_negative_correlations_by_magnitude() -> None:
+    frame = pl.DataFrame(
+        {
+            "y": [1.0, 2.0, 3.0, 4.0],
+            "down": [8.0, 6.0, 4.0, 2.0],
+            "flat": [1.0, 2.0, 2.0, 1.0],
+        }
+    )
+
+    summary = compute_associations(frame, target="y")
+
+    assert [item.feature for item in summary.target_associations] == ["down", "flat"]
+    assert summary.target_associations[0].value == pytest.approx(-1.0)
+
+
+def test_target_associations_reject_unsupported_target() -> None:
+    frame = pl.DataFrame({"x": [1.0, 2.0], "when": [dt.date(2024, 1, 1)] * 2})
+
+    with pytest.raises(ValueError, match="numeric or categorical"):
+        compute_associations(frame, target="when")
+
+
+def test_association_drift_ranks_decoupled_pairs_first() -> None:
+    index = list(range(60))
+    left = pl.DataFrame(
+        {
+            "feature": [float(value) for value in index],
+            "label": ["low" if value < 30 else "high" for value in index],
+            "steady": ["x" if value % 2 else "y" for value in index],
+        }
+    )
+    # On the right the label no longer follows the feature, and a category
+    # appears that the left side never had.
+    right = pl.DataFrame(
+        {
+            "feature": [float(value) for value in index],
+            "label": [("low", "high", "new")[value % 3] for value in index],
+            "steady": ["x" if value % 2 else "y" for value in index],
+        }
+    )
+
+    drift, column_limit = compute_association_drift(
+        left, right, mutual_information=True
+    )
+
+    single = compute_associations(left, mutual_information=True)
+    information = {
+        (item.left, item.right): item.value for item in single.mutual_information
+    }
+    ratios = {
+        (item.left, item.right): item.value for item in single.numeric_categorical
+    }
+    by_metric = {
+        item.metric: item
+        for item in drift
+        if (item.column, item.other_column) == ("feature", "label")
+    }
+    top = by_metric[AssociationMetric.MUTUAL_INFORMATION]
+    assert top.left_value == pytest.approx(
+        information[(ColumnName("feature"), ColumnName("label"))]
+    )
+    assert top.right_value == pytest.approx(0.0)
+    assert top.change == pytest.approx(-top.left_value)
+    ratio = by_metric[AssociationMetric.CORRELATION_RATIO]
+    assert ratio.left_value == pytest.approx(
+        ratios[(ColumnName("feature"), ColumnName("label"))]
+    )
+    assert ratio.change < -0.5
+    assert column_limit is None
+
+
+def test_association_drift_scores_default_families_per_side() -> None:
+    index = [float(value) for value in range(40)]
+    left = pl.DataFrame(
+        {
+            "x": index,
+            "y": index,
+            "group": ["a" if value < 20 else "b" for value in index],
+            "kind": ["p" if value < 20 else "q" for value in index],
+        }
+    )
+    right = pl.DataFrame(
+        {
+            "x": index,
+            "y": index[::-1],
+            "group": ["a" if value < 20 else "b" for value in index],
+            "kind": ["p" if value % 2 else "q" for value in index],
+        }
+    )
+
+    drift, _ = compute_association_drift(left, right)
+
+    scores = {
+        (str(item.column), str(item.other_column), item.metric): (
+            item.left_value,
+            item.right_value,
+        )
+        for item in drift
+    }
+    assert scores[("x", "y", AssociationMetric.PEARSON)] == pytest.approx((1.0, -1.0))
+    assert scores[("group", "kind", AssociationMetric.CRAMERS_V)] == pytest.approx(
+        (1.0, 0.0)
+    )
+    assert AssociationMetric.MUTUAL_INFORMATION not in {item.metric for item in drift}
+    assert drift[0].metric == AssociationMetric.PEARSON
+
+
+def test_association_drift_needs_two_common_columns() -> None:
+    left = pl.DataFrame({"a": [1, 2, 3], "b": [1, 2, 3]})
+    right = pl.DataFrame({"a": [1, 2, 3], "c": [1, 2, 3]})
+
+    assert compute_association_drift(left, right) == ([], None)
+    assert compute_association_drift(left, left, max_columns=1) == (
+        [],
+        AssociationColumnLimit(
+            max_columns=ColumnCount(1), omitted_columns=[ColumnName("b")]
+        ),
+    )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import math
+
 import polars as pl
+import pytest
 
+from mitoric.models.base import ColumnName
+from mitoric.profiling import associations
 from mitoric.profiling.associations import compute_associations
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
 
 
 def test_associations_with_nulls_and_zero_variance() -> None:
@@ -18,6 +24,25 @@ def test_associations_with_nulls_and_zero_variance() -> None:
     assert summary.numeric_numeric[0].value == 0.0
 
 
+def test_numeric_associations_use_pairwise_complete_rows() -> None:
+    frame = pl.DataFrame(
+        {
+            "x": [1.0, 2.0, None, 4.0, 5.0],
+            "y": [2.0, None, 3.0, 8.0, 9.0],
+            "z": [None, 1.0, 2.0, 3.0, 4.0],
+        }
+    )
+
+    summary = compute_associations(frame)
+
+    values = {(item.left, item.right): item.value for item in summary.numeric_numeric}
+    # x/y share the rows 0, 3 and 4; x/z share 1, 3 and 4.
+    assert values[(ColumnName("x"), ColumnName("y"))] == pytest.approx(
+        0.993944095928862
+    )
+    assert values[(ColumnName("x"), ColumnName("z"))] == pytest.approx(1.0)
+
+
 def test_categorical_associations_single_category() -> None:
     frame = pl.DataFrame(
         {
@@ -31,6 +56,20 @@ def test_categorical_associations_single_category() -> None:
     assert summary.categorical_categorical[0].value == 0.0
 
 
+def test_categorical_associations_skip_nulls_and_empty_cells() -> None:
+    frame = pl.DataFrame(
+        {
+            "left": ["A", "A", "B", "B", None],
+            "right": ["X", "Y", "X", "X", "Y"],
+        }
+    )
+
+    summary = compute_associations(frame)
+
+    # Table A:(1, 1), B:(2, 0) -> chi2 = 4/3, n = 4, k = 2.
+    assert summary.categorical_categorical[0].value == pytest.approx(math.sqrt(1 / 3))
+
+
 def test_mixed_associations_single_pair_returns_zero() -> None:
     frame = pl.DataFrame(
         {
@@ -42,3 +81,113 @@ def test_mixed_associations_single_pair_returns_zero() -> None:
     summary = compute_associations(frame)
 
     assert summary.numeric_categorical[0].value == 0.0
+
+
+def test_mixed_associations_drop_rows_with_nulls_per_pair() -> None:
+    frame = pl.DataFrame(
+        {
+            "numeric": [1.0, 2.0, 3.0, 4.0, None, 6.0],
+            "other": [1.0, 1.0, 1.0, 1.0, 1.0, 2.0],
+            "category": ["A", "A", "B", "B", "B", None],
+        }
+    )
+
+    summary = compute_associations(frame)
+
+    values = {item.left: item.value for item in summary.numeric_categorical}
+    # numeric/category share rows 0-3: between SS 4, total SS 5.
+    assert values[ColumnName("numeric")] == pytest.approx(math.sqrt(0.8))
+    assert values[ColumnName("other")] == 0.0
+
+
+def test_association_pair_counts_cover_every_family() -> None:
+    frame = pl.DataFrame(
+        {"a": [1.0, 2.0, 4.0], "b": [2.0, 1.0, 3.0], "c": ["x", "y", "x"]}
+    )
+    recorder = DiagnosticsRecorder()
+    target_recorder = DiagnosticsRecorder()
+
+    compute_associations(frame, recorder=recorder, mutual_information=True)
+    compute_associations(frame, recorder=target_recorder, target="a")
+
+    pairs = recorder.build().association_pairs
+    assert pairs.numeric_numeric == 1
+    assert pairs.numeric_numeric_spearman == 1
+    assert pairs.numeric_categorical == 2
+    assert pairs.mutual_information == 3
+    target_pairs = target_recorder.build().association_pairs
+    assert target_pairs.numeric_numeric == 1
+    assert target_pairs.numeric_categorical == 1
+    assert target_pairs.numeric_numeric_spearman == 0
+    assert target_pairs.mutual_information == 0
+
+
+def test_associations_pair_every_column_without_a_column_limit() -> None:
+    frame = pl.DataFrame({f"n{index}": [1.0, 2.0, 3.0] for index in range(60)})
+    recorder = DiagnosticsRecorder()
+
+    summary = compute_associations(frame, recorder=recorder)
+
+    assert recorder.build().association_pairs.numeric_numeric == 60 * 59 // 2
+    assert summary.column_limit is None
+    assert recorder.build().approximations == []
+
+
+def test_associations_cap_columns_per_kind_with_max_columns() -> None:
+    frame = pl.DataFrame(
+        {f"n{index}": [1.0, 2.0, 3.0] for index in range(60)}
+        | {f"c{index}": ["a", "b", "a"] for index in range(3)}
+    )
+    recorder = DiagnosticsRecorder()
+
+    summary = compute_associations(frame, recorder=recorder, max_columns=50)
+
+    assert recorder.build().association_pairs.numeric_numeric == 50 * 49 // 2
+    assert all(item.right != "n55" for item in summary.numeric_numeric)
+    assert summary.column_limit is not None
+    assert summary.column_limit.max_columns == 50
+    assert summary.column_limit.omitted_columns == [
+        f"n{index}" for index in range(50, 60)
+    ]
+    assert recorder.build().approximations == [
+        "Associations use the first 50 of 60 numeric columns."
+    ]
+
+
+def test_association_screening_skips_weak_pairs(monkeypatch) -> None:
+    monkeypatch.setattr(associations, "_SCREENING_ROWS", 50)
+    index = pl.int_range(400, eager=True)
+    frame = pl.DataFrame(
+        {f"noise{seed}": index.hash(seed) % 1_000 for seed in range(30)}
+        | {"trend": index, "echo": index * 2 + index % 3}
+    )
+    recorder = DiagnosticsRecorder()
+
+    exact = compute_associations(frame)
+    screened = compute_associations(frame, recorder=recorder, screening_tolerance=0.2)
+
+    assert screened.numeric_numeric[0] == exact.numeric_numeric[0]
+    assert recorder.build().association_pairs.numeric_numeric < 32 * 31 // 2
+    assert (
+        recorder.build()
+        .approximations[0]
+        .startswith("Association pairs were screened on 50 of 400 rows")
+    )
+
+
+def test_parallel_associations_match_serial_scores(monkeypatch) -> None:
+    monkeypatch.setattr(associations, "_CORRELATION_BLOCK_PAIRS", 3)
+    monkeypatch.setattr(associations, "_CONTINGENCY_BLOCK_PAIRS", 2)
+    index = pl.int_range(300, eager=True)
+    frame = pl.DataFrame(
+        {f"n{seed}": index.hash(seed) % 100 for seed in range(6)}
+        | {f"c{seed}": (index.hash(seed + 10) % 4).cast(pl.String) for seed in range(4)}
+    )
+
+    serial = compute_associations(frame, workers=1)
+    parallel = compute_associations(frame, workers=3)
+
+    assert parallel == serial
+    assert len(parallel.numeric_numeric) == 15
+    assert len(parallel.categorical_categorical) == 6
+    assert len(parallel.numeric_categorical) == 20
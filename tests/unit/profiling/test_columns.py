@@ -3,6 +3,7 @@ from __future__ import annotations
 import datetime as dt
 
 import polars as pl
+import pytest
 
 from mitoric.models.base import ColumnName, ColumnType, ExplicitType
 from mitoric.profiling.columns import profile_columns
@@ -62,3 +63,17 @@ def test_target_columns_filtering() -> None:
     categorical = profile_map[ColumnName("categorical")]
     assert categorical.categorical_profile is None
     assert categorical.text_profile is None
+
+
+def test_explicit_numeric_type_on_string_column() -> None:
+    frame = pl.DataFrame({"value": ["1", "2", "3", "4"] * 5})
+
+    profiles = profile_columns(
+        frame,
+        target_columns=None,
+        explicit_types=[ExplicitType(ColumnName("value"), ColumnType.NUMERIC)],
+    )
+
+    numeric = profiles[0].numeric_profile
+    assert numeric is not None
+    assert numeric.stats.mean == pytest.approx(2.5)
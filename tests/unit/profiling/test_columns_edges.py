@@ -307,3 +307,21 @@ def test_list_of_struct_unique_count() -> None:
     assert list_profile.unique_count == 3  # 2 unique non-null + 1 null
     assert list_profile.null_count == 1
     assert list_profile.non_null_count == 3
+
+
+def test_binary_column_profile_counts_leading_bytes() -> None:
+    frame = pl.DataFrame(
+        {"payload": [b"\x89PNG\r\n", b"\x89PNGxx", b"GIF89a", b"", None]},
+        schema={"payload": pl.Binary},
+    )
+
+    profiles = profile_columns(frame, target_columns=None, explicit_types=None)
+    binary_profile = profiles[0].binary_profile
+
+    assert profiles[0].unique_count == 5
+    assert binary_profile is not None
+    assert [(item.category, item.count) for item in binary_profile.top_prefixes] == [
+        ("89504e47", 2),
+        ("", 1),
+        ("47494638", 1),
+    ]
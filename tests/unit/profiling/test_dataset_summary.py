@@ -110,5 +110,22 @@ def test_dataset_summary_with_mixed_sortable_and_unsortable_columns() -> None:
 
     assert summary.row_count == 3
     assert summary.column_count == 2
-    # Duplicate detection uses sortable columns only (id), finds 1 duplicate
+    # Rows are hashed across all columns, including the List[Struct] one
     assert summary.duplicate_rows == 1
+
+
+def test_dataset_summary_counts_struct_and_list_duplicates() -> None:
+    frame = pl.DataFrame(
+        {
+            "point": [{"x": 1, "y": None}, {"x": 1, "y": None}, {"x": 1, "y": 2}],
+            "tags": [["a"], ["a"], ["a"]],
+        }
+    )
+
+    exact = summarize_dataset(frame, dataset_id="nested")
+    approximate = summarize_dataset(
+        frame, dataset_id="nested", approximate_duplicates=True
+    )
+
+    assert exact.duplicate_rows == 1
+    assert approximate.duplicate_rows == 1
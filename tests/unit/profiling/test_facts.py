@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import polars as pl
+
+from mitoric.models.base import ColumnType
+from mitoric.profiling.associations import compute_associations
+from mitoric.profiling.columns import profile_columns
+from mitoric.profiling.dataset import summarize_dataset
+from mitoric.profiling.facts import FrameFacts
+from mitoric.profiling.utils.scan_accounting import track_scans
+
+
+def _run_single_report_stages(
+    frame: pl.DataFrame, facts: FrameFacts | None
+) -> tuple[int, int]:
+    with track_scans() as ledger:
+        summarize_dataset(frame, dataset_id="single", facts=facts)
+        profile_columns(frame, target_columns=None, explicit_types=None, facts=facts)
+        compute_associations(frame, facts=facts)
+    label = ledger.passes("label")
+    return label.hash_aggregations, ledger.passes("size").copies
+
+
+def test_frame_facts_are_computed_once() -> None:
+    frame = pl.DataFrame({"label": ["a", "b", None], "size": [b"x", b"yy", None]})
+    facts = FrameFacts(frame)
+
+    label = facts.column("label")
+
+    assert facts.column("label") is label
+    assert label.column_type == ColumnType.CATEGORICAL
+    assert label.null_count == 1
+    assert label.unique_count == 3
+    numeric, is_integer = facts.column("size").normalized_numeric
+    assert numeric.to_list() == [1, 2, None]
+    assert is_integer
+
+
+def test_shared_facts_skip_repeated_work_across_stages() -> None:
+    frame = pl.DataFrame(
+        {
+            "label": ["a", "b", "a", "c"] * 10,
+            "size": [b"x", b"yy", b"zzz", b""] * 10,
+            "value": [1.0, 2.0, 3.0, 4.0] * 10,
+        }
+    )
+
+    independent = _run_single_report_stages(frame, facts=None)
+    shared = _run_single_report_stages(frame, facts=FrameFacts(frame))
+
+    # label is classified by every stage unless the facts are shared.
+    assert independent[0] - shared[0] == 2
+    # size: the bytes-to-length conversion is reused by associations.
+    assert shared[1] < independent[1]
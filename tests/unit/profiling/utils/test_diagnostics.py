@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from mitoric.models.base import ColumnName, ColumnType
+from mitoric.profiling.utils.diagnostics import DiagnosticsRecorder
+
+
+def test_recorder_orders_slowest_columns_and_accumulates() -> None:
+    recorder = DiagnosticsRecorder()
+    recorder.record_column(
+        ColumnName("fast"),
+        dtype="Int64",
+        data_type=ColumnType.NUMERIC,
+        unique_count=3,
+        elapsed_seconds=0.1,
+    )
+    recorder.record_column(
+        ColumnName("slow"),
+        dtype="String",
+        data_type=ColumnType.TEXT,
+        unique_count=500,
+        elapsed_seconds=0.2,
+    )
+    recorder.record_column(
+        ColumnName("fast"),
+        dtype="Int64",
+        data_type=ColumnType.NUMERIC,
+        unique_count=4,
+        elapsed_seconds=0.3,
+    )
+
+    diagnostics = recorder.build(slowest_limit=1)
+
+    assert [item.column_name for item in diagnostics.slowest_columns] == ["fast"]
+    assert diagnostics.slowest_columns[0].elapsed_seconds == 0.4
+    assert diagnostics.slowest_columns[0].unique_count == 4
+
+
+def test_recorder_collects_stages_pairs_and_approximations() -> None:
+    recorder = DiagnosticsRecorder()
+    with recorder.stage("summarize_dataset"):
+        pass
+    recorder.record_association_pairs(
+        numeric_numeric=3,
+        categorical_categorical=1,
+        numeric_categorical=6,
+        numeric_numeric_spearman=3,
+        mutual_information=10,
+    )
+    recorder.record_approximation("sampled")
+    recorder.record_approximation("sampled")
+
+    diagnostics = recorder.build()
+
+    assert [stage.stage for stage in diagnostics.stages] == ["summarize_dataset"]
+    assert diagnostics.association_pairs.numeric_categorical == 6
+    assert diagnostics.association_pairs.mutual_information == 10
+    assert diagnostics.approximations == ["sampled"]
+    assert diagnostics.total_seconds >= 0.0
@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import polars as pl
+
+from mitoric.profiling.utils.hashing import _count_hash_collisions, count_distinct_rows
+
+
+def test_hash_collisions_are_not_merged() -> None:
+    frame = pl.DataFrame({"id": [1, 2, 1, 3], "label": ["a", "b", "a", "c"]})
+    # Pretend rows 0-2 all hash to the same value although row 1 differs.
+    hashes = pl.Series([7, 7, 7, 9], dtype=pl.UInt64)
+
+    assert _count_hash_collisions(frame, hashes) == 1
+
+
+def test_count_distinct_rows_handles_nested_values() -> None:
+    frame = pl.DataFrame(
+        {
+            "items": [[{"id": 1}], [{"id": 1}], [{"id": 2}], []],
+            "meta": [{"k": None}, {"k": None}, {"k": None}, {"k": "x"}],
+        },
+        schema={
+            "items": pl.List(pl.Struct({"id": pl.Int64})),
+            "meta": pl.Struct({"k": pl.String}),
+        },
+    )
+
+    assert count_distinct_rows(frame) == 3
+    assert count_distinct_rows(frame, approximate=True) == 3
+    assert count_distinct_rows(frame.clear()) == 0
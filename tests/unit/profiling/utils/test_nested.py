@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from mitoric.profiling.utils.nested import unnest_struct_columns
+
+
+def test_unnest_struct_columns_keeps_flat_frames_untouched() -> None:
+    frame = pl.DataFrame({"a": [1, 2]})
+
+    assert unnest_struct_columns(frame) is frame
+
+
+def test_unnest_struct_columns_rejects_colliding_paths() -> None:
+    frame = pl.DataFrame({"a": [{"b": 1}], "a.b": [2]})
+
+    with pytest.raises(ValueError, match=r"\['a\.b'\]"):
+        unnest_struct_columns(frame)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import polars as pl
+import pytest
+
+from mitoric import (
+    CancellationToken,
+    ProgressUpdate,
+    ReportCancelledError,
+    generate_compare_report,
+    generate_single_report,
+)
+from mitoric.profiling.columns import profile_columns
+from mitoric.profiling.utils.progress import ProgressTracker
+
+
+def test_tracker_reports_stage_progress() -> None:
+    updates: list[ProgressUpdate] = []
+    tracker = ProgressTracker(updates.append)
+    frame = pl.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"]})
+
+    tracker.begin("profile_columns")
+    profile_columns(frame, target_columns=None, explicit_types=None, tracker=tracker)
+    tracker.finish()
+
+    assert [(u.stage, u.completed, u.total) for u in updates] == [
+        ("profile_columns", 0, 0),
+        ("profile_columns", 1, 2),
+        ("profile_columns", 2, 2),
+        ("complete", 1, 1),
+    ]
+
+
+def test_cancelled_token_stops_at_next_checkpoint() -> None:
+    token = CancellationToken()
+    tracker = ProgressTracker(cancel_token=token)
+    tracker.begin("profile_columns")
+    token.cancel()
+
+    with pytest.raises(ReportCancelledError, match="profile_columns"):
+        profile_columns(
+            pl.DataFrame({"a": [1, 2, 3]}),
+            target_columns=None,
+            explicit_types=None,
+            tracker=tracker,
+        )
+
+
+def test_single_report_emits_stages_in_order() -> None:
+    updates: list[ProgressUpdate] = []
+    frame = pl.DataFrame({"a": [1.0, 2.0, 3.0], "b": [3.0, 1.0, 2.0]})
+
+    generate_single_report(frame, progress=updates.append)
+
+    stages = list(dict.fromkeys(update.stage for update in updates))
+    assert stages == [
+        "summarize_dataset",
+        "profile_columns",
+        "compute_associations",
+        "render_report",
+        "write_report",
+        "complete",
+    ]
+    # One Pearson and one Spearman pair; mutual information is opt-in.
+    assert ("compute_associations", 2, 2) in [
+        (u.stage, u.completed, u.total) for u in updates
+    ]
+
+
+def test_cancel_from_callback_aborts_compare_report_without_writing(
+    tmp_path,
+) -> None:
+    token = CancellationToken()
+    save_path = tmp_path / "report.html"
+
+    def cancel_on_common_columns(update: ProgressUpdate) -> None:
+        if update.stage == "profile_common_columns":
+            token.cancel()
+
+    frame = pl.DataFrame({"a": [1, 2, 3]})
+    with pytest.raises(ReportCancelledError):
+        generate_compare_report(
+            frame,
+            frame,
+            save_path=str(save_path),
+            progress=cancel_on_common_columns,
+            cancel_token=token,
+        )
+
+    assert not save_path.exists()
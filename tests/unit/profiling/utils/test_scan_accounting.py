@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import polars as pl
+
+from mitoric.models.base import ColumnType
+from mitoric.profiling.associations import compute_associations
+from mitoric.profiling.columns import profile_columns
+from mitoric.profiling.compare.histograms import build_compare_histograms_for_column
+from mitoric.profiling.utils.scan_accounting import (
+    PassKind,
+    ScanLedger,
+    record_pass,
+    scanning_columns,
+    track_scans,
+)
+
+
+def test_record_pass_is_noop_without_active_ledger() -> None:
+    with scanning_columns("value"):
+        record_pass(PassKind.SCAN)
+
+    with track_scans() as ledger:
+        pass
+
+    assert ledger.report() == []
+
+
+def test_record_pass_attributes_to_current_columns() -> None:
+    with track_scans() as ledger:
+        with scanning_columns("left", "right"):
+            record_pass(PassKind.HASH_AGGREGATION)
+        with scanning_columns("left"):
+            record_pass(PassKind.COPY)
+            record_pass(PassKind.COPY)
+
+    assert ledger.passes("left").hash_aggregations == 1
+    assert ledger.passes("left").copies == 2
+    assert ledger.passes("right").total == 1
+    assert ledger.format_report().splitlines()[1].startswith("left\t")
+
+
+def test_profile_columns_pass_budget(scan_ledger: ScanLedger) -> None:
+    frame = pl.DataFrame(
+        {
+            "numeric": [1.5, 2.0, None, 4.0] * 30,
+            "category": ["a", "b", "a", "c"] * 30,
+        }
+    )
+
+    profile_columns(frame, target_columns=None, explicit_types=None)
+
+    # Exact counts: a new pass must come with its record_pass and a new budget.
+    assert scan_ledger.passes("numeric").total == 17
+    assert scan_ledger.passes("category").total == 8
+
+
+def test_compare_histograms_pass_budget(scan_ledger: ScanLedger) -> None:
+    with scanning_columns("numeric"):
+        build_compare_histograms_for_column(
+            pl.Series([1.5, 2.0, None, 4.0] * 30),
+            pl.Series([1.0, 3.0, None] * 30),
+            ColumnType.NUMERIC,
+            ColumnType.NUMERIC,
+        )
+    with scanning_columns("category"):
+        build_compare_histograms_for_column(
+            pl.Series(["a", "b", None] * 5),
+            pl.Series(["a", "c"] * 5),
+            ColumnType.CATEGORICAL,
+            ColumnType.CATEGORICAL,
+        )
+
+    assert scan_ledger.passes("numeric").total == 6
+    assert scan_ledger.passes("category").total == 10
+
+
+def test_compute_associations_pass_budget(scan_ledger: ScanLedger) -> None:
+    frame = pl.DataFrame(
+        {
+            "x": [1.0, 2.0, 3.0, 4.0],
+            "y": [2.0, 4.0, 6.0, 9.0],
+            "label": ["a", "b", "a", "b"],
+        }
+    )
+
+    compute_associations(frame)
+
+    assert scan_ledger.passes("x").total == 5
+    assert scan_ledger.passes("label").total == 5
@@ -5,7 +5,11 @@ import datetime as dt
 import polars as pl
 
 from mitoric.models.base import ColumnType
-from mitoric.profiling.utils.type_utils import classify_column_type, infer_column_type
+from mitoric.profiling.utils.type_utils import (
+    classify_column_type,
+    exceeds_distinct_count,
+    infer_column_type,
+)
 
 
 def test_infer_column_type_for_basic_dtypes() -> None:
@@ -24,6 +28,17 @@ def test_classify_column_type_for_text_threshold() -> None:
     assert classify_column_type(series) == ColumnType.TEXT
 
 
+def test_exceeds_distinct_count_matches_n_unique_across_chunks() -> None:
+    # 100 distinct values (plus null) spread over several probe chunks.
+    values = [f"value-{index % 100}" for index in range(5_000)] + [None]
+    series = pl.Series("text", values)
+
+    assert series.n_unique() == 101
+    assert exceeds_distinct_count(series, 100)
+    assert not exceeds_distinct_count(series, 101)
+    assert not exceeds_distinct_count(series.clear(), 0)
+
+
 def test_infer_column_type_for_extended_polars_dtypes() -> None:
     assert (
         infer_column_type(pl.Series("time", [dt.time(1, 2)], dtype=pl.Time))
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from mitoric.models.aggregation import (
     Association,
+    AssociationColumnLimit,
+    AssociationDrift,
+    AssociationMatrix,
     AssociationSummary,
+    BinaryProfile,
     CategoricalProfile,
     CategoryCount,
     ColumnMatchSummary,
@@ -22,6 +26,7 @@ from mitoric.models.aggregation import (
     NumericStats,
     NumericValueCount,
     QuantileValue,
+    TargetAssociation,
     TextLengthStats,
     TextProfile,
     TokenCount,
@@ -29,12 +34,14 @@ from mitoric.models.aggregation import (
     TypeMismatch,
 )
 from mitoric.models.base import (
+    AssociationMetric,
     AssociationValue,
     ColumnCount,
     ColumnName,
     ColumnType,
     DatasetId,
     DuplicateRowCount,
+    EncodedMatrix,
     MemoryBytes,
     MissingCount,
     MissingRate,
@@ -182,6 +189,14 @@ _EXPECTED_SINGLE_SCHEMA = {
                     }
                 ],
                 "value_samples": ["value"],
+                "element_count": "value",
+                "profiled_element_count": "value",
+                "element_numeric_profile": "value",
+                "element_categorical_profile": "value",
+            },
+            "binary_profile": {
+                "prefix_bytes": "value",
+                "top_prefixes": [{"category": "value", "count": "value"}],
             },
         }
     ],
@@ -191,8 +206,33 @@ _EXPECTED_SINGLE_SCHEMA = {
             {"left": "value", "right": "value", "value": "value"}
         ],
         "numeric_categorical": [{"left": "value", "right": "value", "value": "value"}],
+        "numeric_numeric_spearman": [
+            {"left": "value", "right": "value", "value": "value"}
+        ],
+        "mutual_information": [{"left": "value", "right": "value", "value": "value"}],
+        "numeric_numeric_matrix": {
+            "columns": ["value"],
+            "values": "value",
+            "signed": "value",
+        },
+        "categorical_categorical_matrix": {
+            "columns": ["value"],
+            "values": "value",
+            "signed": "value",
+        },
+        "mutual_information_matrix": {
+            "columns": ["value"],
+            "values": "value",
+            "signed": "value",
+        },
+        "target": "value",
+        "target_associations": [
+            {"feature": "value", "metric": "value", "value": "value"}
+        ],
+        "column_limit": {"max_columns": "value", "omitted_columns": ["value"]},
     },
     "histogram_bins": ["value"],
+    "diagnostics": "value",
 }
 
 _EXPECTED_COMPARE_SCHEMA = {
@@ -220,6 +260,20 @@ _EXPECTED_COMPARE_SCHEMA = {
         ],
         "column_profiles_left_only": _EXPECTED_SINGLE_SCHEMA["column_profiles"],
         "column_profiles_right_only": _EXPECTED_SINGLE_SCHEMA["column_profiles"],
+        "association_drift": [
+            {
+                "column": "value",
+                "other_column": "value",
+                "metric": "value",
+                "left_value": "value",
+                "right_value": "value",
+                "change": "value",
+            }
+        ],
+        "association_column_limit": {
+            "max_columns": "value",
+            "omitted_columns": ["value"],
+        },
     },
     "compare_column_profiles": [
         {
@@ -237,6 +291,7 @@ _EXPECTED_COMPARE_SCHEMA = {
         }
     ],
     "histogram_bins": ["value"],
+    "diagnostics": "value",
 }
 
 
@@ -378,6 +433,16 @@ def _sample_column_profiles() -> list[ColumnProfile]:
             list_profile=_sample_list_profile(),
             **base_args,
         ),
+        ColumnProfile(
+            column_name=ColumnName("binary"),
+            data_type=ColumnType.NUMERIC,
+            numeric_profile=_sample_numeric_profile(),
+            binary_profile=BinaryProfile(
+                prefix_bytes=4,
+                top_prefixes=[CategoryCount(category="89504e47", count=3)],
+            ),
+            **base_args,
+        ),
         ColumnProfile(
             column_name=ColumnName("struct"),
             data_type=ColumnType.STRUCT,
@@ -445,6 +510,44 @@ def test_single_report_payload_schema() -> None:
                 value=AssociationValue(0.2),
             )
         ],
+        numeric_numeric_spearman=[
+            Association(
+                left=ColumnName("a"),
+                right=ColumnName("b"),
+                value=AssociationValue(0.6),
+            )
+        ],
+        mutual_information=[
+            Association(
+                left=ColumnName("a"),
+                right=ColumnName("e"),
+                value=AssociationValue(0.3),
+            )
+        ],
+        numeric_numeric_matrix=AssociationMatrix(
+            columns=[ColumnName("a"), ColumnName("b")],
+            values=EncodedMatrix("vg=="),
+            signed=True,
+        ),
+        categorical_categorical_matrix=AssociationMatrix(
+            columns=[ColumnName("c"), ColumnName("d")],
+            values=EncodedMatrix("Mg=="),
+        ),
+        mutual_information_matrix=AssociationMatrix(
+            columns=[ColumnName("a"), ColumnName("e")],
+            values=EncodedMatrix("TA=="),
+        ),
+        target=ColumnName("a"),
+        target_associations=[
+            TargetAssociation(
+                feature=ColumnName("b"),
+                metric=AssociationMetric.PEARSON,
+                value=AssociationValue(0.5),
+            )
+        ],
+        column_limit=AssociationColumnLimit(
+            max_columns=ColumnCount(1), omitted_columns=[ColumnName("b")]
+        ),
     )
 
     payload = build_single_report_payload(
@@ -482,6 +585,19 @@ def test_compare_report_payload_schema() -> None:
         ],
         column_profiles_left_only=column_profiles,
         column_profiles_right_only=column_profiles,
+        association_drift=[
+            AssociationDrift(
+                column=ColumnName("a"),
+                other_column=ColumnName("b"),
+                metric=AssociationMetric.MUTUAL_INFORMATION,
+                left_value=AssociationValue(0.9),
+                right_value=AssociationValue(0.1),
+                change=AssociationValue(-0.8),
+            )
+        ],
+        association_column_limit=AssociationColumnLimit(
+            max_columns=ColumnCount(1), omitted_columns=[ColumnName("b")]
+        ),
     )
     compare_profiles = [
         CompareColumnProfile(
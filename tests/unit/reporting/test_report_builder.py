@@ -101,6 +101,7 @@ def test_build_single_report_payload() -> None:
         "column_profiles": [asdict(column_profile)],
         "associations": asdict(associations),
         "histogram_bins": histogram_bins,
+        "diagnostics": None,
     }
 
 
@@ -151,4 +152,5 @@ def test_build_compare_report_payload() -> None:
         "comparison_summary": asdict(comparison_summary),
         "compare_column_profiles": [asdict(compare_profile)],
         "histogram_bins": histogram_bins,
+        "diagnostics": None,
     }
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+from tests.conftest import SRC_ROOT
+
+
+def test_import_does_not_load_heavy_dependencies() -> None:
+    script = (
+        "import sys\n"
+        "import mitoric\n"
+        "from mitoric import generate_compare_report, generate_single_report\n"
+        "print(sorted(n for n in ('polars', 'jinja2') if n in sys.modules))\n"
+    )
+
+    completed = subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={"PYTHONPATH": str(SRC_ROOT)},
+    )
+
+    assert completed.stdout.strip() == "[]"